@@ -0,0 +1,65 @@
+from bisect import bisect_left
+from difflib import SequenceMatcher
+
+from pydantic import BaseModel
+
+from trainable_entity_extractor.config import ALIGNMENT_CACHE_MAX_CHANGED_FRACTION, ALIGNMENT_CACHE_WINDOW
+
+
+class AlignmentCache(BaseModel):
+    main_hashes: list[str] = list()
+    other_hashes: list[str] = list()
+    matches: list[tuple[int, int, float]] = list()
+
+    @staticmethod
+    def get_unchanged_indexes(previous_hashes: list[str], hashes: list[str]) -> tuple[dict[int, int], list[float]]:
+        unchanged_indexes: dict[int, int] = dict()
+        changed_positions: list[float] = list()
+        matcher = SequenceMatcher(None, previous_hashes, hashes, autojunk=False)
+        for tag, previous_start, previous_end, start, end in matcher.get_opcodes():
+            if tag == "equal":
+                unchanged_indexes.update(zip(range(previous_start, previous_end), range(start, end)))
+            elif tag == "delete":
+                changed_positions.append(start - 0.5)
+            else:
+                changed_positions.extend(range(start, end))
+
+        return unchanged_indexes, changed_positions
+
+    @staticmethod
+    def is_near_change(index: int, changed_positions: list[float], window: int) -> bool:
+        position = bisect_left(changed_positions, index - window)
+        return position < len(changed_positions) and changed_positions[position] <= index + window
+
+    def get_anchors(
+        self,
+        main_hashes: list[str],
+        other_hashes: list[str],
+        window: int = ALIGNMENT_CACHE_WINDOW,
+        max_changed_fraction: float = ALIGNMENT_CACHE_MAX_CHANGED_FRACTION,
+    ) -> list[tuple[int, int, float]] | None:
+        if not self.matches:
+            return None
+
+        main_indexes, main_changes = self.get_unchanged_indexes(self.main_hashes, main_hashes)
+        other_indexes, other_changes = self.get_unchanged_indexes(self.other_hashes, other_hashes)
+        changed_count = max(len(main_changes), len(other_changes))
+        if changed_count > max_changed_fraction * max(len(main_hashes), len(other_hashes)):
+            return None
+
+        anchors = list()
+        for previous_main_index, previous_other_index, score in sorted(self.matches):
+            if previous_main_index not in main_indexes or previous_other_index not in other_indexes:
+                continue
+
+            main_index = main_indexes[previous_main_index]
+            other_index = other_indexes[previous_other_index]
+            if self.is_near_change(main_index, main_changes, window):
+                continue
+
+            if self.is_near_change(other_index, other_changes, window):
+                continue
+
+            anchors.append((main_index, other_index, score))
+
+        return anchors
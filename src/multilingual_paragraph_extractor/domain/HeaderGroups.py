@@ -0,0 +1,48 @@
+from rapidfuzz import fuzz, process
+
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+
+
+class HeaderGroups:
+    def __init__(self, similarity_threshold: float):
+        self.similarity_threshold = similarity_threshold
+        self.texts: list[str] = list()
+        self.groups: list[list[ParagraphFeatures]] = list()
+        self.indexes_by_text: dict[str, int] = dict()
+        self.indexes_by_length: dict[int, list[int]] = dict()
+
+    def could_be_similar(self, length_1: int, length_2: int) -> bool:
+        return 100 * abs(length_1 - length_2) <= (100 - self.similarity_threshold) * (length_1 + length_2)
+
+    def get_candidates_indexes(self, text: str) -> list[int]:
+        last_index = self.indexes_by_text.get(text, len(self.texts) - 1)
+        candidates_indexes = list()
+        for length, indexes in self.indexes_by_length.items():
+            if self.could_be_similar(len(text), length):
+                candidates_indexes.extend([index for index in indexes if index <= last_index])
+
+        return candidates_indexes
+
+    def get_group_index(self, text: str) -> int | None:
+        candidates_indexes = self.get_candidates_indexes(text)
+        candidates_texts = [self.texts[index] for index in candidates_indexes]
+        matches = process.extract(
+            text, candidates_texts, scorer=fuzz.ratio, score_cutoff=self.similarity_threshold, limit=None
+        )
+        matches_indexes = [candidates_indexes[index] for _, score, index in matches if score > self.similarity_threshold]
+        return min(matches_indexes) if matches_indexes else None
+
+    def add(self, paragraph: ParagraphFeatures):
+        text = paragraph.text_cleaned
+        group_index = self.get_group_index(text)
+        if group_index is not None:
+            self.groups[group_index].append(paragraph)
+            return
+
+        self.indexes_by_text.setdefault(text, len(self.texts))
+        self.indexes_by_length.setdefault(len(text), list()).append(len(self.texts))
+        self.texts.append(text)
+        self.groups.append([paragraph])
+
+    def get_repeated_paragraphs(self, min_repetitions: int) -> list[ParagraphFeatures]:
+        return [paragraph for group in self.groups if len(group) >= min_repetitions for paragraph in group]
@@ -1,6 +1,8 @@
+import hashlib
 from typing import Optional
 
 from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfToken import PdfToken
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.TokenType import TokenType
 from pydantic import BaseModel
@@ -42,15 +44,22 @@ class ParagraphFeatures(BaseModel):
     __hash__ = object.__hash__
 
     def merge(self, paragraph_features: "ParagraphFeatures") -> "ParagraphFeatures":
-        self.text_cleaned += " " + paragraph_features.text_cleaned
-        self.original_text += " " + paragraph_features.original_text
-        self.words += paragraph_features.words
-        self.numbers += paragraph_features.numbers
-        self.numbers_by_spaces += paragraph_features.numbers_by_spaces
-        self.non_alphanumeric_characters += paragraph_features.non_alphanumeric_characters
+        bounding_box = self.bounding_box
         if self.page_number == paragraph_features.page_number:
-            self.bounding_box = Rectangle.merge_rectangles([self.bounding_box, paragraph_features.bounding_box])
-        return self
+            bounding_box = Rectangle.merge_rectangles([self.bounding_box, paragraph_features.bounding_box])
+
+        return self.model_copy(
+            update={
+                "text_cleaned": self.text_cleaned + " " + paragraph_features.text_cleaned,
+                "original_text": self.original_text + " " + paragraph_features.original_text,
+                "words": self.words + paragraph_features.words,
+                "numbers": self.numbers + paragraph_features.numbers,
+                "numbers_by_spaces": self.numbers_by_spaces + paragraph_features.numbers_by_spaces,
+                "non_alphanumeric_characters": self.non_alphanumeric_characters
+                + paragraph_features.non_alphanumeric_characters,
+                "bounding_box": bounding_box,
+            }
+        )
 
     def split_paragraph(self, splitter_word: str) -> ("ParagraphFeatures", "ParagraphFeatures"):
         paragraph_text_1 = self.original_text.split(splitter_word)[0].strip()
@@ -160,6 +169,9 @@ class ParagraphFeatures(BaseModel):
     def get_empty():
         return ParagraphFeatures()
 
+    def get_content_hash(self) -> str:
+        return hashlib.sha1(self.model_dump_json(exclude={"index"}).encode()).hexdigest()
+
     @staticmethod
     def get_numbers(words):
         numbers_and_spaces_list = ["".join([y if y.isnumeric() and y.isascii() else " " for y in x]) for x in words]
@@ -196,9 +208,6 @@ class ParagraphFeatures(BaseModel):
 
     @staticmethod
     def from_pdf_data(pdf_data: PdfData, pdf_segment: PdfDataSegment) -> "ParagraphFeatures":
-        first_token = ParagraphFeatures.get_first_token(pdf_data, pdf_segment)
-        words = pdf_segment.text_content.split()
-        numbers_by_spaces, numbers = ParagraphFeatures.get_numbers(words)
         tokens = list()
         for page, token in pdf_data.pdf_features.loop_tokens():
             if token.page_number != pdf_segment.page_number:
@@ -207,8 +216,31 @@ class ParagraphFeatures(BaseModel):
             if pdf_segment.is_selected(token.bounding_box):
                 tokens.append(token)
 
+        index = pdf_data.pdf_data_segments.index(pdf_segment)
+        return ParagraphFeatures.from_segment_tokens(pdf_data, pdf_segment, index, tokens)
+
+    @staticmethod
+    def list_from_pdf_data(pdf_data: PdfData) -> list["ParagraphFeatures"]:
+        tokens_by_page: dict[int, list[PdfToken]] = dict()
+        for page, token in pdf_data.pdf_features.loop_tokens():
+            tokens_by_page.setdefault(token.page_number, list()).append(token)
+
+        paragraphs_features = list()
+        for index, pdf_segment in enumerate(pdf_data.pdf_data_segments):
+            page_tokens = tokens_by_page.get(pdf_segment.page_number, list())
+            tokens = [token for token in page_tokens if pdf_segment.is_selected(token.bounding_box)]
+            paragraphs_features.append(ParagraphFeatures.from_segment_tokens(pdf_data, pdf_segment, index, tokens))
+
+        return paragraphs_features
+
+    @staticmethod
+    def from_segment_tokens(
+        pdf_data: PdfData, pdf_segment: PdfDataSegment, index: int, tokens: list[PdfToken]
+    ) -> "ParagraphFeatures":
+        words = pdf_segment.text_content.split()
+        numbers_by_spaces, numbers = ParagraphFeatures.get_numbers(words)
         return ParagraphFeatures(
-            index=pdf_data.pdf_data_segments.index(pdf_segment),
+            index=index,
             page_height=pdf_data.pdf_features.pages[0].page_height if pdf_data.pdf_features.pages else 1,
             page_width=pdf_data.pdf_features.pages[0].page_width if pdf_data.pdf_features.pages else 1,
             page_number=pdf_segment.page_number,
@@ -220,23 +252,12 @@ class ParagraphFeatures(BaseModel):
             numbers=numbers,
             numbers_by_spaces=numbers_by_spaces,
             non_alphanumeric_characters=ParagraphFeatures.get_aphanumeric(pdf_segment.text_content),
-            first_word=unidecode(pdf_segment.text_content.split()[0]) if pdf_segment.text_content else None,
-            font=first_token.font if first_token else None,
+            first_word=unidecode(words[0]) if words else None,
+            font=tokens[0].font if tokens else None,
             first_token_bounding_box=tokens[0].bounding_box if tokens else None,
             last_token_bounding_box=tokens[-1].bounding_box if tokens else None,
         )
 
-    @staticmethod
-    def get_first_token(pdf_data, pdf_segment):
-        for page, token in pdf_data.pdf_features.loop_tokens():
-            if token.page_number != pdf_segment.page_number:
-                continue
-
-            if pdf_segment.is_selected(token.bounding_box):
-                return token
-
-        return None
-
     @staticmethod
     def from_texts(texts: list[str]):
         paragraphs_features = []
@@ -1,8 +1,10 @@
+import numpy as np
 import rapidfuzz
 from pydantic import BaseModel
 from typing import Optional
 
 from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+from multilingual_paragraph_extractor.domain.ParagraphSignature import ParagraphSignature
 
 
 class ParagraphMatchScore(BaseModel):
@@ -61,6 +63,121 @@ class ParagraphMatchScore(BaseModel):
             overall_score=None,
         ).calculate_overall_score()
 
+    @staticmethod
+    def get_overall_scores(paragraphs_1: list[ParagraphFeatures], paragraphs_2: list[ParagraphFeatures]) -> np.ndarray:
+        signatures_1 = [ParagraphSignature.from_paragraph_features(x) for x in paragraphs_1]
+        signatures_2 = [ParagraphSignature.from_paragraph_features(x) for x in paragraphs_2]
+        if not signatures_1 or not signatures_2:
+            return np.zeros((len(signatures_1), len(signatures_2)))
+
+        def get_column(attribute: str) -> np.ndarray:
+            return np.array([getattr(x, attribute) for x in signatures_1], dtype=np.float64)[:, None]
+
+        def get_row(attribute: str) -> np.ndarray:
+            return np.array([getattr(x, attribute) for x in signatures_2], dtype=np.float64)[None, :]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            segment_type = ParagraphMatchScore.get_equal_matrix(signatures_1, signatures_2, "paragraph_type")
+
+            words_1, words_2 = get_column("words_count"), get_row("words_count")
+            max_words = np.maximum(words_1, words_2)
+            matching_words = ParagraphMatchScore.get_intersection_counts(signatures_1, signatures_2, "words")
+            text_fuzzy_match = np.where(words_1 > 0, matching_words / max_words, 0)
+            number_of_words = np.where(words_1 > 0, 1 - np.abs(words_1 - words_2) / max_words, 0)
+
+            max_numbers = np.maximum(get_column("numbers_by_spaces_count"), get_row("numbers_by_spaces_count"))
+            numbers_length = np.maximum(get_column("numbers_count"), get_row("numbers_count"))
+            by_spaces_score = (
+                ParagraphMatchScore.get_intersection_counts(signatures_1, signatures_2, "numbers_by_spaces") / max_numbers
+            )
+            numbers_score = (
+                ParagraphMatchScore.get_intersection_counts(signatures_1, signatures_2, "numbers") / numbers_length
+            )
+            numbers = np.where((max_numbers > 0) & (numbers_length > 0), np.maximum(by_spaces_score, numbers_score), 1)
+
+            first_word = ParagraphMatchScore.get_first_word_scores(signatures_1, signatures_2)
+
+            is_first_longer = get_column("text_length") > get_row("text_length")
+            characters_1, characters_2 = get_column("characters_count"), get_row("characters_count")
+            longer_characters = np.where(is_first_longer, characters_1, characters_2)
+            shorter_characters = np.where(is_first_longer, characters_2, characters_1)
+            matching_characters = ParagraphMatchScore.get_intersection_counts(signatures_1, signatures_2, "characters")
+            special_characters = np.where(
+                longer_characters > 0, matching_characters / longer_characters, np.where(shorter_characters > 0, 0, 1)
+            )
+
+            page_width = get_column("page_width")
+            margins_difference = np.abs(get_column("right_margin") - get_row("right_margin"))
+            alignment = np.where(page_width != 0, 1 - margins_difference / page_width, 0)
+            horizontal_distance = np.abs(get_column("horizontal_center") - get_row("horizontal_center"))
+            indentation = np.where(page_width != 0, 1 - horizontal_distance / page_width, 0)
+
+            same_bold = ParagraphMatchScore.get_equal_matrix(signatures_1, signatures_2, "bold")
+            same_italics = ParagraphMatchScore.get_equal_matrix(signatures_1, signatures_2, "italics")
+            font_style = 0.5 * same_bold + 0.5 * same_italics
+
+            font_size_1, font_size_2 = get_column("font_size"), get_row("font_size")
+            max_font_size = np.maximum(font_size_1, font_size_2)
+            font_size = np.where(font_size_1 != 0, 1 - np.abs(font_size_1 - font_size_2) / max_font_size, 0)
+
+        scores = [
+            segment_type,
+            text_fuzzy_match,
+            number_of_words,
+            numbers,
+            2 * first_word,
+            special_characters,
+            alignment,
+            indentation,
+            font_style,
+            font_size,
+        ]
+        overall_score = np.zeros((len(signatures_1), len(signatures_2)))
+        for score in scores:
+            overall_score = overall_score + score
+
+        return overall_score / 11
+
+    @staticmethod
+    def get_equal_matrix(
+        signatures_1: list[ParagraphSignature], signatures_2: list[ParagraphSignature], attribute: str
+    ) -> np.ndarray:
+        values = list(dict.fromkeys([getattr(x, attribute) for x in signatures_1 + signatures_2]))
+        values_ids = {value: index for index, value in enumerate(values)}
+        ids_1 = np.array([values_ids[getattr(x, attribute)] for x in signatures_1])
+        ids_2 = np.array([values_ids[getattr(x, attribute)] for x in signatures_2])
+        return (ids_1[:, None] == ids_2[None, :]).astype(np.float64)
+
+    @staticmethod
+    def get_intersection_counts(
+        signatures_1: list[ParagraphSignature], signatures_2: list[ParagraphSignature], attribute: str
+    ) -> np.ndarray:
+        values_1 = set().union(*[getattr(x, attribute) for x in signatures_1])
+        values_2 = set().union(*[getattr(x, attribute) for x in signatures_2])
+        shared_values_ids = {value: index for index, value in enumerate(values_1 & values_2)}
+        if not shared_values_ids:
+            return np.zeros((len(signatures_1), len(signatures_2)))
+
+        def get_matrix(signatures: list[ParagraphSignature]) -> np.ndarray:
+            matrix = np.zeros((len(signatures), len(shared_values_ids)), dtype=np.float32)
+            for row, signature in enumerate(signatures):
+                columns = [shared_values_ids[x] for x in getattr(signature, attribute) if x in shared_values_ids]
+                matrix[row, columns] = 1
+            return matrix
+
+        return (get_matrix(signatures_1) @ get_matrix(signatures_2).T).astype(np.float64)
+
+    @staticmethod
+    def get_first_word_scores(signatures_1: list[ParagraphSignature], signatures_2: list[ParagraphSignature]) -> np.ndarray:
+        first_words_1 = [x.first_word for x in signatures_1]
+        first_words_2 = [x.first_word for x in signatures_2]
+        ratios = rapidfuzz.process.cdist(
+            [x or "" for x in first_words_1], [x or "" for x in first_words_2], scorer=rapidfuzz.fuzz.ratio, dtype=np.float64
+        )
+        missing_1 = np.array([x is None for x in first_words_1])[:, None]
+        missing_2 = np.array([x is None for x in first_words_2])[None, :]
+        return np.where(missing_1 | missing_2, 0, ratios / 100)
+
     @staticmethod
     def get_difference(value_1: int, value_2: int) -> float:
         difference = abs(value_1 - value_2)
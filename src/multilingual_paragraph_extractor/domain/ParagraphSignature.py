@@ -0,0 +1,49 @@
+from typing import Optional
+
+from pdf_token_type_labels.TokenType import TokenType
+from pydantic import BaseModel
+
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+
+
+class ParagraphSignature(BaseModel):
+    paragraph_type: TokenType = TokenType.TEXT
+    text_length: int = 0
+    words: frozenset[str] = frozenset()
+    words_count: int = 0
+    numbers_by_spaces: frozenset[int] = frozenset()
+    numbers_by_spaces_count: int = 0
+    numbers: frozenset[int] = frozenset()
+    numbers_count: int = 0
+    characters: frozenset[str] = frozenset()
+    characters_count: int = 0
+    first_word: Optional[str] = None
+    page_width: float = 0
+    right_margin: float = 0
+    horizontal_center: float = 0
+    font_size: float = 0
+    bold: Optional[bool] = None
+    italics: Optional[bool] = None
+
+    @staticmethod
+    def from_paragraph_features(paragraph: ParagraphFeatures) -> "ParagraphSignature":
+        bounding_box = paragraph.bounding_box
+        return ParagraphSignature(
+            paragraph_type=paragraph.paragraph_type,
+            text_length=len(paragraph.text_cleaned),
+            words=frozenset(paragraph.words),
+            words_count=len(paragraph.words),
+            numbers_by_spaces=frozenset(paragraph.numbers_by_spaces),
+            numbers_by_spaces_count=len(paragraph.numbers_by_spaces),
+            numbers=frozenset(paragraph.numbers),
+            numbers_count=len(paragraph.numbers),
+            characters=frozenset(paragraph.non_alphanumeric_characters),
+            characters_count=len(paragraph.non_alphanumeric_characters),
+            first_word=paragraph.first_word,
+            page_width=paragraph.page_width,
+            right_margin=abs(paragraph.page_width - bounding_box.right),
+            horizontal_center=bounding_box.left + bounding_box.width / 2,
+            font_size=paragraph.font.font_size if paragraph.font else 0,
+            bold=paragraph.font.bold if paragraph.font else None,
+            italics=paragraph.font.italics if paragraph.font else None,
+        )
@@ -1,11 +1,13 @@
 import re
 from math import ceil
+from typing import Callable, Iterable, Iterator
 
 from pdf_token_type_labels.TokenType import TokenType
 from pydantic import BaseModel
-from rapidfuzz import fuzz
 
+from multilingual_paragraph_extractor.domain.AlignmentCache import AlignmentCache
 from multilingual_paragraph_extractor.domain.AlignmentScore import AlignmentScore
+from multilingual_paragraph_extractor.domain.HeaderGroups import HeaderGroups
 from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
 from multilingual_paragraph_extractor.domain.ParagraphMatchScore import ParagraphMatchScore
 
@@ -14,6 +16,11 @@ THRESHOLD = 0.5
 HEADER_SIMILARITY_THRESHOLD = 90
 TOP_OF_PAGE_THRESHOLD = 0.2
 REPEATED_HEADER_THRESHOLD = 0.2
+HEADER_TYPES = [TokenType.FOOTNOTE, TokenType.PAGE_HEADER, TokenType.PAGE_FOOTER]
+TEXT_CONTENT_TYPES = [TokenType.LIST_ITEM, TokenType.TEXT]
+REGULAR_CHARACTERS_REGEX = re.compile(
+    r"[^a-zA-Z0-9\sа-яА-Яά-ωΑ-Ω\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]"
+)
 
 
 class ParagraphsFromLanguage(BaseModel):
@@ -23,6 +30,7 @@ class ParagraphsFromLanguage(BaseModel):
     _aligned_paragraphs: list[ParagraphFeatures] = list()
     _alignment_scores: dict[ParagraphFeatures, AlignmentScore] = dict()
     _main_language_paragraphs: list[ParagraphFeatures] = list()
+    _alignment_cache: AlignmentCache | None = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -30,6 +38,12 @@ class ParagraphsFromLanguage(BaseModel):
     def replace_paragraphs_to_aligned(self):
         self.paragraphs = self._aligned_paragraphs
 
+    def set_alignment_cache(self, alignment_cache: AlignmentCache):
+        self._alignment_cache = alignment_cache
+
+    def get_alignment_cache(self) -> AlignmentCache | None:
+        return self._alignment_cache
+
     def set_as_main_language(self):
         self.is_main_language = True
         self._aligned_paragraphs = self.paragraphs
@@ -43,6 +57,24 @@ class ParagraphsFromLanguage(BaseModel):
             self._aligned_paragraphs = [ParagraphFeatures.get_empty() for _ in range(len(self._main_language_paragraphs))]
             return
 
+    def copy_alignment(self, aligned_language: "ParagraphsFromLanguage", main_language: "ParagraphsFromLanguage"):
+        self.paragraphs = aligned_language.paragraphs
+        self._aligned_paragraphs = aligned_language._aligned_paragraphs
+        self._main_language_paragraphs = main_language.paragraphs
+        self._alignment_cache = aligned_language._alignment_cache
+        self._alignment_scores = dict()
+        aligned_main_paragraphs = aligned_language._main_language_paragraphs
+        for aligned_main_paragraph, main_paragraph in zip(aligned_main_paragraphs, main_language.paragraphs):
+            if aligned_main_paragraph not in aligned_language._alignment_scores:
+                continue
+
+            alignment_score = aligned_language._alignment_scores[aligned_main_paragraph]
+            self._alignment_scores[main_paragraph] = AlignmentScore(
+                main_paragraph=main_paragraph,
+                other_paragraph=alignment_score.other_paragraph,
+                score=alignment_score.score,
+            )
+
     def fix_segments(self, main_language: "ParagraphsFromLanguage") -> bool:
         self.align(main_language)
         segmentation_changed = self.fix_other_language_segmentation()
@@ -50,74 +82,76 @@ class ParagraphsFromLanguage(BaseModel):
         segmentation_changed = self.fix_main_language_when_main_language_not_assigned() or segmentation_changed
         return segmentation_changed
 
-    def remove_no_text_types(self):
-        text_content_types = [
-            TokenType.LIST_ITEM,
-            TokenType.TEXT,
+    def clean(self):
+        threshold_area = self.get_big_paragraph_threshold_area()
+        paragraphs = [
+            x for x in self.paragraphs if not self.is_big_no_text_paragraph(x, threshold_area) and self.has_text(x)
         ]
-        self.paragraphs = [x for x in self.paragraphs if x.paragraph_type in text_content_types]
+        header_paragraphs = set(self.get_header_paragraphs(paragraphs))
+        paragraphs = (x for x in paragraphs if x.paragraph_type not in HEADER_TYPES and x not in header_paragraphs)
+        paragraphs = self.skip_duplicated_text(paragraphs)
+        paragraphs = self.merge_consecutive(paragraphs, ParagraphFeatures.collide)
+        paragraphs = self.merge_consecutive(paragraphs, ParagraphFeatures.is_part_of_same_segment)
+        self.paragraphs = [x for x in paragraphs if x.paragraph_type in TEXT_CONTENT_TYPES]
 
-    def merge_colliding_segments(self):
-        fixed_paragraphs = []
-        index = 0
+    def remove_no_text_types(self):
+        self.paragraphs = [x for x in self.paragraphs if x.paragraph_type in TEXT_CONTENT_TYPES]
 
-        while index < len(self.paragraphs):
-            paragraph = self.paragraphs[index]
+    def merge_colliding_segments(self):
+        self.paragraphs = list(self.merge_consecutive(self.paragraphs, ParagraphFeatures.collide))
 
-            if index + 1 >= len(self.paragraphs):
-                fixed_paragraphs.append(paragraph)
-                index += 1
+    @staticmethod
+    def merge_consecutive(
+        paragraphs: Iterable[ParagraphFeatures], should_merge: Callable[[ParagraphFeatures, ParagraphFeatures], bool]
+    ) -> Iterator[ParagraphFeatures]:
+        pending_paragraph = None
+        for paragraph in paragraphs:
+            if pending_paragraph is None:
+                pending_paragraph = paragraph
                 continue
 
-            if paragraph.collide(self.paragraphs[index + 1]):
-                merged_segment = paragraph.merge(self.paragraphs[index + 1])
-                fixed_paragraphs.append(merged_segment)
-                index += 2
+            if should_merge(pending_paragraph, paragraph):
+                yield pending_paragraph.merge(paragraph)
+                pending_paragraph = None
                 continue
 
-            fixed_paragraphs.append(paragraph)
-            index += 1
+            yield pending_paragraph
+            pending_paragraph = paragraph
 
-        self.paragraphs = fixed_paragraphs
+        if pending_paragraph is not None:
+            yield pending_paragraph
 
-    def remove_no_text_paragraphs(self):
-        cleaned_paragraphs = list()
-        for paragraph in self.paragraphs:
-            if not paragraph.text_cleaned:
-                continue
+    @staticmethod
+    def has_text(paragraph: ParagraphFeatures) -> bool:
+        if not paragraph.text_cleaned:
+            return False
 
-            if not any(char.isalnum() for char in paragraph.text_cleaned):
-                continue
+        if not any(char.isalnum() for char in paragraph.text_cleaned):
+            return False
 
-            regular_characters_regex = (
-                r"[^a-zA-Z0-9\sа-яА-Яά-ωΑ-Ω\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]"
-            )
-            regular_characters = re.sub(regular_characters_regex, "", paragraph.text_cleaned)
+        regular_characters = REGULAR_CHARACTERS_REGEX.sub("", paragraph.text_cleaned)
+        return len(regular_characters.strip()) > 1
 
-            if len(regular_characters.strip()) <= 1:
-                continue
+    def remove_no_text_paragraphs(self):
+        self.paragraphs = [x for x in self.paragraphs if self.has_text(x)]
 
-            cleaned_paragraphs.append(paragraph)
+    @staticmethod
+    def skip_duplicated_text(paragraphs: Iterable[ParagraphFeatures]) -> Iterator[ParagraphFeatures]:
+        previous_paragraph = None
+        for paragraph in paragraphs:
+            if previous_paragraph is not None and previous_paragraph.text_cleaned != paragraph.text_cleaned:
+                yield previous_paragraph
+            previous_paragraph = paragraph
 
-        self.paragraphs = cleaned_paragraphs
+        if previous_paragraph is not None:
+            yield previous_paragraph
 
     def remove_duplicated_text(self):
-        cleaned_paragraphs = list()
-        for paragraph, next_paragraph in zip(self.paragraphs, self.paragraphs[1:]):
-            if paragraph.text_cleaned == next_paragraph.text_cleaned:
-                continue
-
-            cleaned_paragraphs.append(paragraph)
-
-        if self.paragraphs:
-            cleaned_paragraphs.append(self.paragraphs[-1])
-
-        self.paragraphs = cleaned_paragraphs
+        self.paragraphs = list(self.skip_duplicated_text(self.paragraphs))
 
     def remove_headers_and_footers(self):
-        types = [TokenType.FOOTNOTE, TokenType.PAGE_HEADER, TokenType.PAGE_FOOTER]
-        header_paragraphs = self.find_headers_with_similarities()
-        self.paragraphs = [x for x in self.paragraphs if x.paragraph_type not in types]
+        header_paragraphs = set(self.find_headers_with_similarities())
+        self.paragraphs = [x for x in self.paragraphs if x.paragraph_type not in HEADER_TYPES]
         self.paragraphs = [p for p in self.paragraphs if p not in header_paragraphs]
 
     @staticmethod
@@ -127,23 +161,20 @@ class ParagraphsFromLanguage(BaseModel):
         return on_top or on_bottom
 
     def find_headers_with_similarities(self):
-        paragraphs_on_top = [x for x in self.paragraphs if self.is_top_or_bottom_of_page(x, self.paragraphs[0].page_height)]
-        pages_number = max([x.page_number for x in self.paragraphs]) if self.paragraphs else 1
-        headers = {}
+        return self.get_header_paragraphs(self.paragraphs)
+
+    @staticmethod
+    def get_header_paragraphs(paragraphs: list[ParagraphFeatures]) -> list[ParagraphFeatures]:
+        paragraphs_on_top = [
+            x for x in paragraphs if ParagraphsFromLanguage.is_top_or_bottom_of_page(x, paragraphs[0].page_height)
+        ]
+        pages_number = max([x.page_number for x in paragraphs]) if paragraphs else 1
+        header_groups = HeaderGroups(HEADER_SIMILARITY_THRESHOLD)
         for paragraph in paragraphs_on_top:
-            found_match = False
-            for header_text in headers:
-                if fuzz.ratio(paragraph.text_cleaned, header_text) > HEADER_SIMILARITY_THRESHOLD:
-                    headers[header_text].append(paragraph)
-                    found_match = True
-                    break
-            if not found_match:
-                headers[paragraph.text_cleaned] = [paragraph]
+            header_groups.add(paragraph)
 
         min_pages = max(ceil(pages_number * REPEATED_HEADER_THRESHOLD), 3)
-        repeated_headers = {k: v for k, v in headers.items() if len(v) >= min_pages}
-        header_paragraphs = [p for header_list in repeated_headers.values() for p in header_list]
-        return header_paragraphs
+        return header_groups.get_repeated_paragraphs(min_pages)
 
     @staticmethod
     def is_paragraph_separators(text: str) -> bool:
@@ -231,38 +262,67 @@ class ParagraphsFromLanguage(BaseModel):
         return True
 
     def merge_paragraphs_spanning_two_pages(self):
-        fixed_paragraphs = []
-        index = 0
+        self.paragraphs = list(self.merge_consecutive(self.paragraphs, ParagraphFeatures.is_part_of_same_segment))
 
-        while index < len(self.paragraphs):
-            paragraph = self.paragraphs[index]
+    def set_alignment_scores(self):
+        self._alignment_scores = dict()
+        main = self._main_language_paragraphs
+        other = self.paragraphs
+        if self._alignment_cache is None:
+            matches = self.get_global_alignment(main, other)
+        else:
+            matches = self.get_cached_alignment(main, other)
+
+        for main_index, other_index, score in matches:
+            self._alignment_scores[main[main_index]] = AlignmentScore(
+                main_paragraph=main[main_index],
+                other_paragraph=other[other_index],
+                score=score,
+            )
 
-            if index + 1 >= len(self.paragraphs):
-                fixed_paragraphs.append(paragraph)
-                index += 1
-                continue
+    def get_cached_alignment(
+        self, main: list[ParagraphFeatures], other: list[ParagraphFeatures]
+    ) -> list[tuple[int, int, float]]:
+        main_hashes = [x.get_content_hash() for x in main]
+        other_hashes = [x.get_content_hash() for x in other]
+        anchors = self._alignment_cache.get_anchors(main_hashes, other_hashes)
+        if anchors is None:
+            matches = self.get_global_alignment(main, other)
+        else:
+            matches = self.get_anchored_alignment(main, other, anchors)
 
-            if paragraph.is_part_of_same_segment(self.paragraphs[index + 1]):
-                merged_segment = paragraph.merge(self.paragraphs[index + 1])
-                fixed_paragraphs.append(merged_segment)
-                index += 2
-                continue
+        self._alignment_cache = AlignmentCache(main_hashes=main_hashes, other_hashes=other_hashes, matches=matches)
+        return matches
 
-            fixed_paragraphs.append(paragraph)
-            index += 1
+    @staticmethod
+    def get_anchored_alignment(
+        main: list[ParagraphFeatures], other: list[ParagraphFeatures], anchors: list[tuple[int, int, float]]
+    ) -> list[tuple[int, int, float]]:
+        matches = list()
+        main_start, other_start = 0, 0
+        for main_end, other_end, score in anchors + [(len(main), len(other), None)]:
+            if main_start < main_end and other_start < other_end:
+                window_matches = ParagraphsFromLanguage.get_global_alignment(
+                    main[main_start:main_end], other[other_start:other_end]
+                )
+                matches.extend([(main_start + i, other_start + j, x) for i, j, x in reversed(window_matches)])
 
-        self.paragraphs = fixed_paragraphs
+            if score is not None:
+                matches.append((main_end, other_end, score))
 
-    def set_alignment_scores(self):
+            main_start, other_start = main_end + 1, other_end + 1
+
+        return matches[::-1]
+
+    @staticmethod
+    def get_global_alignment(main: list[ParagraphFeatures], other: list[ParagraphFeatures]) -> list[tuple[int, int, float]]:
         # Needleman-Wunsch global alignment for paragraphs, strict matching
-        self._alignment_scores = dict()
-        main = self._main_language_paragraphs
-        other = self.paragraphs
         n = len(main)
         m = len(other)
         gap_penalty = -0.05
         min_match_score = THRESHOLD
 
+        match_scores = ParagraphMatchScore.get_overall_scores(main, other).tolist()
         dp = [[0.0] * (m + 1) for _ in range(n + 1)]
         traceback = [[None] * (m + 1) for _ in range(n + 1)]
 
@@ -275,7 +335,7 @@ class ParagraphsFromLanguage(BaseModel):
 
         for i in range(1, n + 1):
             for j in range(1, m + 1):
-                match_score = ParagraphMatchScore.from_paragraphs_features(main[i - 1], other[j - 1]).overall_score
+                match_score = match_scores[i - 1][j - 1]
                 match = dp[i - 1][j - 1] + match_score
                 delete = dp[i - 1][j] + gap_penalty
                 insert = dp[i][j - 1] + gap_penalty
@@ -288,16 +348,13 @@ class ParagraphsFromLanguage(BaseModel):
                 else:
                     traceback[i][j] = "left"
 
+        matches = list()
         i, j = n, m
         while i > 0 and j > 0:
             if traceback[i][j] == "diag":
-                score = ParagraphMatchScore.from_paragraphs_features(main[i - 1], other[j - 1]).overall_score
+                score = match_scores[i - 1][j - 1]
                 if score >= min_match_score:
-                    self._alignment_scores[main[i - 1]] = AlignmentScore(
-                        main_paragraph=main[i - 1],
-                        other_paragraph=other[j - 1],
-                        score=score,
-                    )
+                    matches.append((i - 1, j - 1, score))
                 i -= 1
                 j -= 1
             elif traceback[i][j] == "up":
@@ -305,6 +362,8 @@ class ParagraphsFromLanguage(BaseModel):
             else:
                 j -= 1
 
+        return matches
+
     def is_same_pdf(self):
         paragraph_count = len(self._main_language_paragraphs)
         if not paragraph_count:
@@ -337,7 +396,9 @@ class ParagraphsFromLanguage(BaseModel):
                 main_to_receive = inverse_alignment_scores[previous_paragraph].main_paragraph
                 score = inverse_alignment_scores[previous_paragraph].score
                 if self.should_merge_paragraphs(main_to_receive, score, previous_paragraph, paragraph_to_be_merged):
-                    to_remove = self.split_main_or_merge_other(main_to_receive, previous_paragraph, paragraph_to_be_merged)
+                    to_remove = self.split_main_or_merge_other(
+                        main_to_receive, previous_paragraph, paragraph_to_be_merged, inverse_alignment_scores
+                    )
                     paragraphs_to_be_remove.extend(to_remove)
                     continue
 
@@ -347,12 +408,12 @@ class ParagraphsFromLanguage(BaseModel):
             main_to_receive = inverse_alignment_scores[next_paragraph].main_paragraph
             score = inverse_alignment_scores[next_paragraph].score
             if self.should_merge_paragraphs(main_to_receive, score, paragraph_to_be_merged, next_paragraph):
-                to_remove = self.split_main_or_merge_other(main_to_receive, paragraph_to_be_merged, next_paragraph)
+                to_remove = self.split_main_or_merge_other(
+                    main_to_receive, paragraph_to_be_merged, next_paragraph, inverse_alignment_scores
+                )
                 paragraphs_to_be_remove.extend(to_remove)
 
-        for paragraph in paragraphs_to_be_remove:
-            if paragraph in self.paragraphs:
-                self.paragraphs.remove(paragraph)
+        self.remove_paragraphs(self.paragraphs, paragraphs_to_be_remove)
 
         return len(paragraphs_to_be_remove) != 0 or main_paragraphs_count != len(self._main_language_paragraphs)
 
@@ -371,6 +432,7 @@ class ParagraphsFromLanguage(BaseModel):
                 if self.should_merge_paragraphs(other_to_compare, score, previous_paragraph, paragraph_to_be_merged):
                     merged = previous_paragraph.merge(paragraph_to_be_merged)
                     self._main_language_paragraphs[idx - 1] = merged
+                    del self._alignment_scores[previous_paragraph]
                     self._alignment_scores[merged] = AlignmentScore(
                         main_paragraph=merged,
                         other_paragraph=other_to_compare,
@@ -388,16 +450,18 @@ class ParagraphsFromLanguage(BaseModel):
             score = self._alignment_scores[next_paragraph].score
             if self.should_merge_paragraphs(other_to_compare, score, paragraph_to_be_merged, next_paragraph):
                 self._main_language_paragraphs[idx + 1] = paragraph_to_be_merged.merge(next_paragraph)
-                paragraphs_to_be_remove.append(next_paragraph)
+                paragraphs_to_be_remove.append(paragraph_to_be_merged)
 
-        for paragraph in paragraphs_to_be_remove:
-            if paragraph in self._main_language_paragraphs:
-                self._main_language_paragraphs.remove(paragraph)
+        self.remove_paragraphs(self._main_language_paragraphs, paragraphs_to_be_remove)
 
         return len(paragraphs_to_be_remove) != 0 or main_paragraphs_count != len(self._main_language_paragraphs)
 
     def split_main_or_merge_other(
-        self, main_paragraph: ParagraphFeatures, previous_paragraph: ParagraphFeatures, next_paragraph: ParagraphFeatures
+        self,
+        main_paragraph: ParagraphFeatures,
+        previous_paragraph: ParagraphFeatures,
+        next_paragraph: ParagraphFeatures,
+        inverse_alignment_scores: dict[ParagraphFeatures, AlignmentScore],
     ):
         if self.split_paragraph(self._main_language_paragraphs, next_paragraph, main_paragraph):
             return []
@@ -406,17 +470,40 @@ class ParagraphsFromLanguage(BaseModel):
             return []
 
         if previous_paragraph in self._aligned_paragraphs:
-            previous_paragraph.merge(next_paragraph)
+            merged = previous_paragraph.merge(next_paragraph)
+            self.replace_other_paragraph(previous_paragraph, merged, inverse_alignment_scores)
             return [next_paragraph]
 
         if next_paragraph in self._aligned_paragraphs:
-            previous_paragraph.merge(next_paragraph)
-            index = self.paragraphs.index(next_paragraph)
-            self.paragraphs[index] = previous_paragraph
-            return [next_paragraph]
+            merged = previous_paragraph.merge(next_paragraph)
+            self.replace_other_paragraph(next_paragraph, merged, inverse_alignment_scores)
+            return [previous_paragraph]
 
         return []
 
+    def replace_other_paragraph(
+        self,
+        paragraph: ParagraphFeatures,
+        new_paragraph: ParagraphFeatures,
+        inverse_alignment_scores: dict[ParagraphFeatures, AlignmentScore],
+    ):
+        self.paragraphs[:] = [new_paragraph if x is paragraph else x for x in self.paragraphs]
+        self._aligned_paragraphs[:] = [new_paragraph if x is paragraph else x for x in self._aligned_paragraphs]
+        if paragraph not in inverse_alignment_scores:
+            return
+
+        alignment_score = inverse_alignment_scores.pop(paragraph)
+        new_alignment_score = AlignmentScore(
+            main_paragraph=alignment_score.main_paragraph, other_paragraph=new_paragraph, score=alignment_score.score
+        )
+        inverse_alignment_scores[new_paragraph] = new_alignment_score
+        self._alignment_scores[alignment_score.main_paragraph] = new_alignment_score
+
+    @staticmethod
+    def remove_paragraphs(paragraphs: list[ParagraphFeatures], paragraphs_to_remove: list[ParagraphFeatures]):
+        paragraphs_to_remove = set(paragraphs_to_remove)
+        paragraphs[:] = [x for x in paragraphs if x not in paragraphs_to_remove]
+
     @staticmethod
     def should_merge_paragraphs(
         paragraph: ParagraphFeatures,
@@ -424,7 +511,7 @@ class ParagraphsFromLanguage(BaseModel):
         previous_paragraph_to_merge: ParagraphFeatures,
         next_paragraph_to_merge: ParagraphFeatures,
     ) -> bool:
-        merged_paragraph = previous_paragraph_to_merge.model_copy(deep=True).merge(next_paragraph_to_merge)
+        merged_paragraph = previous_paragraph_to_merge.merge(next_paragraph_to_merge)
         match_score = ParagraphMatchScore.from_paragraphs_features(paragraph, merged_paragraph)
         return previous_score <= match_score.overall_score
 
@@ -433,28 +520,27 @@ class ParagraphsFromLanguage(BaseModel):
             return False
         return len(self._aligned_paragraphs) == len(main_language.paragraphs)
 
-    def remove_big_no_text_paragraphs(self):
-        threshold_area = 0.2 * self.paragraphs[0].page_width * self.paragraphs[0].page_height if self.paragraphs else 0
-        fixed_paragraphs = list()
+    def get_big_paragraph_threshold_area(self) -> float:
+        return 0.2 * self.paragraphs[0].page_width * self.paragraphs[0].page_height if self.paragraphs else 0
 
-        for paragraph in self.paragraphs:
-            if not len(paragraph.original_text):
-                continue
+    @staticmethod
+    def is_big_no_text_paragraph(paragraph: ParagraphFeatures, threshold_area: float) -> bool:
+        if not len(paragraph.original_text):
+            return True
 
-            if paragraph.bounding_box.area() < threshold_area:
-                fixed_paragraphs.append(paragraph)
-                continue
-            if paragraph.font.font_size > 10:
-                font_size_corrector = 1 + abs(paragraph.font.font_size - 10) / 10
-            else:
-                font_size_corrector = 1 - abs(paragraph.font.font_size - 10) / 10
+        if paragraph.bounding_box.area() < threshold_area:
+            return False
 
-            if paragraph.bounding_box.area() / (len(paragraph.original_text) * font_size_corrector) > 100:
-                continue
+        if paragraph.font.font_size > 10:
+            font_size_corrector = 1 + abs(paragraph.font.font_size - 10) / 10
+        else:
+            font_size_corrector = 1 - abs(paragraph.font.font_size - 10) / 10
 
-            fixed_paragraphs.append(paragraph)
+        return paragraph.bounding_box.area() / (len(paragraph.original_text) * font_size_corrector) > 100
 
-        self.paragraphs = fixed_paragraphs
+    def remove_big_no_text_paragraphs(self):
+        threshold_area = self.get_big_paragraph_threshold_area()
+        self.paragraphs = [x for x in self.paragraphs if not self.is_big_no_text_paragraph(x, threshold_area)]
 
     def to_db(self):
         return ParagraphsFromLanguage(
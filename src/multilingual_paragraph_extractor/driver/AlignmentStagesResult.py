@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from trainable_entity_extractor.domain.StageTiming import StageTiming
+
+
+class AlignmentStagesResult(BaseModel):
+    commit: str
+    paragraphs_count: int
+    stage_timings: list[StageTiming]
+
+    def get_seconds(self, stage_name: str) -> float:
+        return sum([x.wall_seconds for x in self.stage_timings if x.name == stage_name])
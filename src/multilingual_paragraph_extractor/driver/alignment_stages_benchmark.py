@@ -0,0 +1,232 @@
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from random import Random
+
+import numpy as np
+from pdf_features.Rectangle import Rectangle
+from py_markdown_table.markdown_table import markdown_table
+
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from multilingual_paragraph_extractor.driver.AlignmentStagesResult import AlignmentStagesResult
+from trainable_entity_extractor.config import ROOT_PATH
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
+from trainable_entity_extractor.domain.StageTiming import StageTiming
+
+BENCHMARK_PATH = Path(ROOT_PATH, "data", "paragraph_extraction", "alignment_stages_benchmark")
+PARAGRAPHS_COUNTS = [50, 100, 200, 400, 800]
+REPEATS = 3
+PARAGRAPHS_PER_PAGE = 20
+PAGE_WIDTH = 600
+PAGE_HEIGHT = 800
+HEADER_TEXT = "Synthetic report of the committee"
+CLEANING_PASSES = [
+    "remove_big_no_text_paragraphs",
+    "remove_no_text_paragraphs",
+    "remove_headers_and_footers",
+    "remove_duplicated_text",
+    "merge_colliding_segments",
+    "merge_paragraphs_spanning_two_pages",
+    "remove_no_text_types",
+]
+ALIGNMENT_STAGES = ["fix_segments", "set_alignment_scores", "get_aligned_paragraphs_from_scores"]
+STAGES = CLEANING_PASSES + ["clean"] + ALIGNMENT_STAGES
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_PATH, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def get_synthetic_texts(paragraphs_count: int, seed: int) -> tuple[list[str], list[str]]:
+    random = Random(seed)
+    vocabulary = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=random.randint(3, 9))) for _ in range(2000)]
+    main_texts = list()
+    other_texts = list()
+    for index in range(paragraphs_count):
+        words = random.choices(vocabulary, k=random.randint(8, 60))
+        main_texts.append(f"{index + 1}. {' '.join(words)} ({random.randint(1, 999)}).")
+        translated_words = [word[::-1] + "o" for word in words]
+        other_text = f"{index + 1}. {' '.join(translated_words)} ({main_texts[-1].split('(')[-1]}"
+
+        chance = random.random()
+        if chance < 0.02:
+            continue
+
+        if chance < 0.04:
+            split_index = len(other_text) // 2
+            other_texts.extend([other_text[:split_index].strip(" .;"), other_text[split_index:].strip()])
+            continue
+
+        other_texts.append(other_text)
+
+    return main_texts, other_texts
+
+
+def get_paragraphs_with_layout(texts: list[str]) -> list[ParagraphFeatures]:
+    paragraphs = list()
+    for position, paragraph in enumerate(ParagraphFeatures.from_texts(texts)):
+        page_number = 1 + position // PARAGRAPHS_PER_PAGE
+        row = position % PARAGRAPHS_PER_PAGE
+        if row == 0:
+            header = ParagraphFeatures.from_texts([HEADER_TEXT])[0]
+            paragraphs.append(get_paragraph_in_page(header, len(paragraphs), page_number, 20))
+
+        paragraphs.append(get_paragraph_in_page(paragraph, len(paragraphs), page_number, 100 + 30 * row))
+
+    return paragraphs
+
+
+def get_paragraph_in_page(paragraph: ParagraphFeatures, index: int, page_number: int, top: int) -> ParagraphFeatures:
+    bounding_box = Rectangle.from_coordinates(50, top, PAGE_WIDTH - 50, top + 25)
+    return paragraph.model_copy(
+        update={
+            "index": index,
+            "page_number": page_number,
+            "page_width": PAGE_WIDTH,
+            "page_height": PAGE_HEIGHT,
+            "bounding_box": bounding_box,
+            "first_token_bounding_box": Rectangle.from_coordinates(50, top, 100, top + 10),
+            "last_token_bounding_box": Rectangle.from_coordinates(PAGE_WIDTH - 100, top + 15, PAGE_WIDTH - 50, top + 25),
+        }
+    )
+
+
+def get_synthetic_languages(paragraphs_count: int, seed: int = 0) -> tuple[ParagraphsFromLanguage, ParagraphsFromLanguage]:
+    main_texts, other_texts = get_synthetic_texts(paragraphs_count, seed)
+    main_language = ParagraphsFromLanguage(
+        language="en", paragraphs=get_paragraphs_with_layout(main_texts), is_main_language=True
+    )
+    other_language = ParagraphsFromLanguage(
+        language="es", paragraphs=get_paragraphs_with_layout(other_texts), is_main_language=False
+    )
+    return main_language, other_language
+
+
+def benchmark_stages(profiler: StageProfiler, paragraphs_count: int, seed: int):
+    main_language, other_language = get_synthetic_languages(paragraphs_count, seed)
+    for cleaning_pass in CLEANING_PASSES:
+        with profiler.measure(cleaning_pass):
+            getattr(main_language, cleaning_pass)()
+            getattr(other_language, cleaning_pass)()
+
+    fused_main_language, fused_other_language = get_synthetic_languages(paragraphs_count, seed)
+    with profiler.measure("clean"):
+        fused_main_language.clean()
+        fused_other_language.clean()
+
+    with profiler.measure("fix_segments"):
+        other_language.fix_segments(main_language)
+
+    other_language._main_language_paragraphs = main_language.paragraphs
+    with profiler.measure("set_alignment_scores"):
+        other_language.set_alignment_scores()
+
+    with profiler.measure("get_aligned_paragraphs_from_scores"):
+        other_language.get_aligned_paragraphs_from_scores()
+
+
+def get_fastest_timings(stage_timings: list[StageTiming]) -> list[StageTiming]:
+    fastest_timings: dict[str, StageTiming] = dict()
+    for stage_timing in stage_timings:
+        if stage_timing.name not in fastest_timings:
+            fastest_timings[stage_timing.name] = stage_timing
+        elif stage_timing.wall_seconds < fastest_timings[stage_timing.name].wall_seconds:
+            fastest_timings[stage_timing.name] = stage_timing
+
+    return [fastest_timings[x] for x in STAGES if x in fastest_timings]
+
+
+def run_benchmark(paragraphs_counts: list[int] = None, repeats: int = REPEATS) -> list[AlignmentStagesResult]:
+    commit = get_commit()
+    results: list[AlignmentStagesResult] = list()
+    for paragraphs_count in paragraphs_counts or PARAGRAPHS_COUNTS:
+        profiler = StageProfiler(f"alignment stages {paragraphs_count}", enabled=True)
+        for seed in range(repeats):
+            benchmark_stages(profiler, paragraphs_count, seed)
+
+        stage_timings = get_fastest_timings(profiler.get_stage_timings())
+        results.append(AlignmentStagesResult(commit=commit, paragraphs_count=paragraphs_count, stage_timings=stage_timings))
+
+    return results
+
+
+def get_scaling_exponents(results: list[AlignmentStagesResult]) -> dict[str, float]:
+    paragraphs_counts = np.log([x.paragraphs_count for x in results])
+    exponents = dict()
+    for stage in STAGES:
+        seconds = np.array([x.get_seconds(stage) for x in results])
+        if len(results) < 2 or not np.all(seconds > 0):
+            continue
+
+        exponents[stage] = round(float(np.polyfit(paragraphs_counts, np.log(seconds), 1)[0]), 2)
+
+    return exponents
+
+
+def save_results(results: list[AlignmentStagesResult]) -> Path:
+    commit = results[0].commit if results else get_commit()
+    path = Path(BENCHMARK_PATH, f"{datetime.now().strftime('%Y_%m_%d_%H_%M')}_{commit}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([x.model_dump() for x in results], indent=4))
+    return path
+
+
+def load_results(path: str | Path) -> list[AlignmentStagesResult]:
+    return [AlignmentStagesResult(**x) for x in json.loads(Path(path).read_text())]
+
+
+def plot_results(results: list[AlignmentStagesResult], path: Path):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed, skipping the scaling plot")
+        return
+
+    figure, axis = plt.subplots(figsize=(10, 6))
+    paragraphs_counts = [x.paragraphs_count for x in results]
+    for stage in STAGES:
+        axis.plot(paragraphs_counts, [x.get_seconds(stage) for x in results], marker="o", label=stage)
+
+    axis.set_xscale("log")
+    axis.set_yscale("log")
+    axis.set_xlabel("paragraphs per language")
+    axis.set_ylabel("seconds")
+    axis.set_title(f"Alignment stages {results[0].commit}")
+    axis.legend(fontsize=8)
+    figure.savefig(path, bbox_inches="tight")
+    plt.close(figure)
+
+
+def print_results(results: list[AlignmentStagesResult], baseline_results: list[AlignmentStagesResult] = None):
+    exponents = get_scaling_exponents(results)
+    baseline_by_count = {x.paragraphs_count: x for x in baseline_results or []}
+    rows = list()
+    for stage in STAGES:
+        row = {"stage": stage, "exponent": exponents.get(stage, "")}
+        for result in results:
+            seconds = result.get_seconds(stage)
+            row[str(result.paragraphs_count)] = f"{seconds:.4f}"
+            baseline = baseline_by_count.get(result.paragraphs_count)
+            if baseline and baseline.get_seconds(stage) > 0:
+                row[str(result.paragraphs_count)] += f" (x{seconds / baseline.get_seconds(stage):.2f})"
+        rows.append(row)
+
+    print(markdown_table(rows).set_params(padding_width=2).get_markdown())
+
+
+if __name__ == "__main__":
+    # baseline_path = Path(BENCHMARK_PATH, "2024_01_01_00_00_abcdef1.json")
+    baseline_path = None
+    benchmark_results = run_benchmark(PARAGRAPHS_COUNTS, REPEATS)
+    results_path = save_results(benchmark_results)
+    plot_results(benchmark_results, results_path.with_suffix(".png"))
+    print_results(benchmark_results, load_results(baseline_path) if baseline_path else None)
+    print("Results saved in", results_path)
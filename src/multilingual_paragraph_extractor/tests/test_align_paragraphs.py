@@ -1,8 +1,10 @@
+import shutil
 from unittest import TestCase
 
 from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
 from multilingual_paragraph_extractor.use_cases.MultilingualParagraphAlignerUseCase import (
     MultilingualParagraphAlignerUseCase,
+    ALIGNMENT_CACHE_FILE_NAME,
 )
 from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
@@ -250,3 +252,63 @@ class TestAlignParagraphs(TestCase):
 
         self.assertEqual("", paragraphs_from_languages[1].paragraphs[0].original_text)
         self.assertEqual("", paragraphs_from_languages[1].paragraphs[1].original_text)
+
+    def test_align_paragraphs_in_parallel(self):
+        paragraphs = self.get_paragraphs("en")
+        paragraphs_issue = [paragraphs[0], paragraphs[1].merge(paragraphs[2])]
+        language_paragraph_1 = ParagraphsFromLanguage(language="en", paragraphs=paragraphs_issue, is_main_language=True)
+        language_paragraph_2 = ParagraphsFromLanguage(
+            language="tr", paragraphs=self.get_paragraphs("tr"), is_main_language=False
+        )
+        language_paragraph_3 = ParagraphsFromLanguage(
+            language="es", paragraphs=self.get_paragraphs("es")[0:2], is_main_language=False
+        )
+
+        multilingual_paragraph_extractor = MultilingualParagraphAlignerUseCase(
+            extractor_identifier=self.extraction_identifier, workers=2
+        )
+        paragraphs_from_languages = [language_paragraph_1, language_paragraph_2, language_paragraph_3]
+        multilingual_paragraph_extractor.align_languages(paragraphs_from_languages)
+
+        self.assertEqual(["a 0. en", "b 1: en", "c 2! en"], [x.text_cleaned for x in language_paragraph_1.paragraphs])
+        self.assertEqual(["a 0. tr", "b 1: tr", "c 2! tr"], [x.text_cleaned for x in language_paragraph_2.paragraphs])
+        self.assertEqual(["a 0. es", "b 1: es", ""], [x.text_cleaned for x in language_paragraph_3.paragraphs])
+
+    def test_merge_main_language_changes(self):
+        main_snapshot = tuple(ParagraphFeatures.from_texts(texts=["a 0.", "b 1:", "c 2!", "d 3?"]))
+        first_language_main = [main_snapshot[0].merge(main_snapshot[1]), *main_snapshot[2:]]
+        second_language_main = [
+            main_snapshot[0],
+            main_snapshot[1].merge(main_snapshot[2]),
+            main_snapshot[3],
+        ]
+        third_language_main = [*main_snapshot[:2], main_snapshot[2].merge(main_snapshot[3])]
+
+        merged_paragraphs = MultilingualParagraphAlignerUseCase.merge_main_language_changes(
+            main_snapshot, [first_language_main, second_language_main, third_language_main]
+        )
+
+        self.assertEqual(["a 0. b 1:", "c 2! d 3?"], [x.text_cleaned for x in merged_paragraphs])
+
+    def test_align_paragraphs_with_alignment_cache(self):
+        extraction_identifier = ExtractionIdentifier(extraction_name="paragraph_extraction_cache")
+        shutil.rmtree(extraction_identifier.get_path(), ignore_errors=True)
+        multilingual_paragraph_extractor = MultilingualParagraphAlignerUseCase(
+            extractor_identifier=extraction_identifier, use_cache=True
+        )
+
+        main_language = ParagraphsFromLanguage(language="en", paragraphs=self.get_paragraphs("en"), is_main_language=True)
+        other_language = ParagraphsFromLanguage(language="tr", paragraphs=self.get_paragraphs("tr"), is_main_language=False)
+        multilingual_paragraph_extractor.align_languages([main_language, other_language])
+        cache = extraction_identifier.get_file_content(ALIGNMENT_CACHE_FILE_NAME)
+
+        other_paragraphs = self.get_paragraphs("tr")
+        other_paragraphs[1] = ParagraphFeatures.from_texts(texts=["b 1: tr edited"])[0]
+        main_language = ParagraphsFromLanguage(language="en", paragraphs=self.get_paragraphs("en"), is_main_language=True)
+        other_language = ParagraphsFromLanguage(language="tr", paragraphs=other_paragraphs, is_main_language=False)
+        multilingual_paragraph_extractor.align_languages([main_language, other_language])
+
+        self.assertEqual(3, len(cache["en_tr"]["matches"]))
+        self.assertEqual(["a 0. en", "b 1: en", "c 2! en"], [x.text_cleaned for x in main_language.paragraphs])
+        self.assertEqual(["a 0. tr", "b 1: tr edited", "c 2! tr"], [x.text_cleaned for x in other_language.paragraphs])
+        shutil.rmtree(extraction_identifier.get_path(), ignore_errors=True)
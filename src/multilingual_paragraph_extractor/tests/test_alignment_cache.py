@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from multilingual_paragraph_extractor.domain.AlignmentCache import AlignmentCache
+
+
+class TestAlignmentCache(TestCase):
+    def test_get_anchors_away_from_changes(self):
+        hashes = [str(i) for i in range(10)]
+        alignment_cache = AlignmentCache(main_hashes=hashes, other_hashes=hashes, matches=[(i, i, 1.0) for i in range(10)])
+
+        other_hashes = hashes[:5] + ["new"] + hashes[6:]
+        anchors = alignment_cache.get_anchors(hashes, other_hashes, window=1, max_changed_fraction=0.5)
+
+        self.assertEqual([0, 1, 2, 3, 7, 8, 9], [main_index for main_index, _, _ in anchors])
+
+    def test_get_anchors_after_deletion(self):
+        hashes = [str(i) for i in range(10)]
+        alignment_cache = AlignmentCache(main_hashes=hashes, other_hashes=hashes, matches=[(i, i, 1.0) for i in range(10)])
+
+        other_hashes = hashes[:5] + hashes[6:]
+        anchors = alignment_cache.get_anchors(hashes, other_hashes, window=1, max_changed_fraction=0.5)
+
+        self.assertEqual([(0, 0), (1, 1), (2, 2), (3, 3), (7, 6), (8, 7), (9, 8)], [(x, y) for x, y, _ in anchors])
+
+    def test_full_recompute_when_many_changes(self):
+        hashes = [str(i) for i in range(10)]
+        alignment_cache = AlignmentCache(main_hashes=hashes, other_hashes=hashes, matches=[(i, i, 1.0) for i in range(10)])
+
+        other_hashes = [f"new {i}" for i in range(5)] + hashes[5:]
+
+        self.assertIsNone(alignment_cache.get_anchors(hashes, other_hashes, window=1, max_changed_fraction=0.2))
+        self.assertIsNone(AlignmentCache().get_anchors(hashes, hashes))
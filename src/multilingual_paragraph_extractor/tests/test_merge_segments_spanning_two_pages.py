@@ -74,6 +74,18 @@ class TestMergeSegmentsSpanningTwoPages(TestCase):
         self.assertEqual("Text to be continued here", paragraphs_from_languages[0].paragraphs[1].text_cleaned)
         self.assertEqual("Text.", paragraphs_from_languages[0].paragraphs[2].text_cleaned)
 
+    def test_merge_keeps_original_paragraphs(self):
+        regular_paragraph_1, beginning_paragraphs, end_paragraphs, regular_paragraph_2 = self.get_paragraphs()
+
+        paragraphs = [regular_paragraph_1, beginning_paragraphs, end_paragraphs, regular_paragraph_2]
+        language_paragraph = ParagraphsFromLanguage(language="en", paragraphs=paragraphs, is_main_language=False)
+        language_paragraph.clean()
+
+        self.assertEqual("Text to be continued here", language_paragraph.paragraphs[1].text_cleaned)
+        self.assertEqual("Text to be continued", beginning_paragraphs.text_cleaned)
+        self.assertEqual("here", end_paragraphs.original_text)
+        self.assertIs(regular_paragraph_1, language_paragraph.paragraphs[0])
+
     def test_not_merge_when_same_page(self):
         regular_paragraph_1, beginning_paragraphs, end_paragraphs, regular_paragraph_2 = self.get_paragraphs()
 
@@ -122,6 +122,37 @@ class TestParagraphFeatures(TestCase):
         self.assertEqual("³", paragraph.original_text)
         self.assertEqual([], paragraph.numbers_by_spaces)
 
+    def test_list_from_pdf_data(self):
+        with open(self.xml_path, "rb") as file:
+            xml_file = XmlFile(extraction_identifier=self.identifier, to_train=True, xml_file_name="test.xml")
+            xml_file.save(file_content=file.read())
+
+        segmentation_data = SegmentationData(
+            page_width=612,
+            page_height=792,
+            xml_segments_boxes=[],
+            label_segments_boxes=[],
+        )
+        pdf_data = PdfData.from_xml_file(xml_file=xml_file, segmentation_data=segmentation_data)
+
+        paragraphs = ParagraphFeatures.list_from_pdf_data(pdf_data)
+
+        self.assertEqual(len(pdf_data.pdf_data_segments), len(paragraphs))
+        self.assertTrue(paragraphs)
+        for index, (pdf_segment, paragraph) in enumerate(zip(pdf_data.pdf_data_segments, paragraphs)):
+            tokens = list()
+            for page, token in pdf_data.pdf_features.loop_tokens():
+                if token.page_number == pdf_segment.page_number and pdf_segment.is_selected(token.bounding_box):
+                    tokens.append(token)
+
+            self.assertEqual(index, paragraph.index)
+            self.assertEqual(pdf_segment.page_number, paragraph.page_number)
+            self.assertEqual(pdf_segment.bounding_box, paragraph.bounding_box)
+            self.assertEqual(pdf_segment.text_content.split(), paragraph.words)
+            self.assertEqual(tokens[0].font if tokens else None, paragraph.font)
+            self.assertEqual(tokens[0].bounding_box if tokens else None, paragraph.first_token_bounding_box)
+            self.assertEqual(tokens[-1].bounding_box if tokens else None, paragraph.last_token_bounding_box)
+
     def test_get_numbers(self):
         self.assertEqual(([15, 2021], [15, 2021]), ParagraphFeatures.get_numbers(["15", "February", "2021"]))
         self.assertEqual(([15, 16, 2021], [15162021]), ParagraphFeatures.get_numbers(["15", "16", "2021"]))
@@ -180,3 +180,20 @@ droits civils et politiques, visant à abolir la peine de mort (Italie) ;""",
         score_2 = ParagraphMatchScore.from_paragraphs_features(p3, p4).overall_score
         print(score_1, score_2)
         self.assertGreater(score_1, score_2)
+
+    def test_overall_scores_match_pairwise_scores(self):
+        paragraphs_1 = ParagraphFeatures.from_texts(
+            ["1. First paragraph; with 12 words", "(a) Second 3/4", "No numbers here"]
+        )
+        paragraphs_2 = ParagraphFeatures.from_texts(["1. Primer párrafo; con 12 palabras", "(a) Segundo 3/4"])
+        paragraphs_2.append(self.get_paragraph())
+        paragraphs_2[1].paragraph_type = TokenType.TITLE
+        paragraphs_2[1].first_word = None
+
+        overall_scores = ParagraphMatchScore.get_overall_scores(paragraphs_1, paragraphs_2)
+
+        self.assertEqual((3, 3), overall_scores.shape)
+        for i, paragraph_1 in enumerate(paragraphs_1):
+            for j, paragraph_2 in enumerate(paragraphs_2):
+                expected_score = ParagraphMatchScore.from_paragraphs_features(paragraph_1, paragraph_2).overall_score
+                self.assertEqual(expected_score, overall_scores[i][j])
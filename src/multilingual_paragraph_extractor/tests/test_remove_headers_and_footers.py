@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from pdf_features.Rectangle import Rectangle
+
+from multilingual_paragraph_extractor.domain.HeaderGroups import HeaderGroups
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+
+
+class TestRemoveHeadersAndFooters(TestCase):
+    def test_remove_repeated_headers(self):
+        texts = []
+        for page_number in range(1, 6):
+            texts.append(f"United Nations A/HRC/47/1{page_number % 2} General Assembly")
+            texts.append(f"Body text number {page_number} of the report")
+        paragraphs = ParagraphFeatures.from_texts(texts)
+        for index, paragraph in enumerate(paragraphs):
+            paragraph.page_number = index // 2 + 1
+            if index % 2:
+                paragraph.bounding_box = Rectangle.from_coordinates(0, 4, 10, 6)
+        paragraphs_from_language = ParagraphsFromLanguage(language="en", paragraphs=paragraphs, is_main_language=True)
+
+        paragraphs_from_language.remove_headers_and_footers()
+
+        self.assertEqual(5, len(paragraphs_from_language.paragraphs))
+        self.assertTrue(all(x.text_cleaned.startswith("Body text") for x in paragraphs_from_language.paragraphs))
+
+    def test_header_groups_keep_first_similar_header(self):
+        header_groups = HeaderGroups(similarity_threshold=90)
+        paragraphs = ParagraphFeatures.from_texts(
+            ["Report of the Working Group", "Report of the Working Groups", "Report of the Working Group", "Annex"]
+        )
+        for paragraph in paragraphs:
+            header_groups.add(paragraph)
+
+        self.assertEqual(2, len(header_groups.groups))
+        self.assertEqual(paragraphs[:3], header_groups.get_repeated_paragraphs(3))
+        self.assertEqual([], header_groups.get_repeated_paragraphs(4))
@@ -1,10 +1,37 @@
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from multilingual_paragraph_extractor.domain.AlignmentCache import AlignmentCache
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
 from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.config import ALIGNMENT_CACHE, ALIGNMENT_WORKERS
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 
+ALIGNMENT_CACHE_FILE_NAME = "alignment_cache.json"
+
+
+def _fix_segments(
+    main_paragraphs: tuple[ParagraphFeatures, ...], other_language: ParagraphsFromLanguage
+) -> tuple[list[ParagraphFeatures], ParagraphsFromLanguage]:
+    main_language = ParagraphsFromLanguage(language="", paragraphs=list(main_paragraphs), is_main_language=True)
+    other_language.fix_segments(main_language)
+    return main_language.paragraphs, other_language
+
+
+def _align(main_paragraphs: tuple[ParagraphFeatures, ...], other_language: ParagraphsFromLanguage) -> ParagraphsFromLanguage:
+    main_language = ParagraphsFromLanguage(language="", paragraphs=list(main_paragraphs), is_main_language=True)
+    other_language.align(main_language)
+    return other_language
+
 
 class MultilingualParagraphAlignerUseCase:
-    def __init__(self, extractor_identifier: ExtractionIdentifier):
+    def __init__(
+        self, extractor_identifier: ExtractionIdentifier, workers: int = ALIGNMENT_WORKERS, use_cache: bool = ALIGNMENT_CACHE
+    ):
         self.extractor_identifier = extractor_identifier
+        self.workers = workers
+        self.use_cache = use_cache
 
     def align_languages(self, paragraphs_from_languages: list[ParagraphsFromLanguage]):
         if not paragraphs_from_languages:
@@ -12,27 +39,171 @@ class MultilingualParagraphAlignerUseCase:
 
         self.clean_paragraphs(paragraphs_from_languages)
         main_language, other_languages = self.get_main_and_other_languages(paragraphs_from_languages)
+        self.load_alignment_caches(main_language, other_languages)
+
+        if not self.align_in_parallel(main_language, other_languages):
+            self.align_serially(main_language, other_languages)
 
+        self.save_alignment_caches(main_language, other_languages)
+
+        main_language.set_as_main_language()
+        for other_language_paragraphs in other_languages:
+            other_language_paragraphs.replace_paragraphs_to_aligned()
+
+    @staticmethod
+    def get_alignment_cache_keys(main_language: ParagraphsFromLanguage, other_languages: list[ParagraphsFromLanguage]):
+        keys = list()
+        repetitions = Counter()
+        for other_language_paragraphs in other_languages:
+            key = f"{main_language.language}_{other_language_paragraphs.language}"
+            keys.append(f"{key}_{repetitions[key]}" if repetitions[key] else key)
+            repetitions[key] += 1
+
+        return keys
+
+    def load_alignment_caches(self, main_language: ParagraphsFromLanguage, other_languages: list[ParagraphsFromLanguage]):
+        if not self.use_cache:
+            return
+
+        try:
+            content = self.extractor_identifier.get_file_content(ALIGNMENT_CACHE_FILE_NAME, dict())
+            caches = {key: AlignmentCache(**value) for key, value in content.items()}
+        except Exception as e:
+            print(f"Error loading alignment cache: {e}")
+            caches = dict()
+
+        for key, other_language_paragraphs in zip(
+            self.get_alignment_cache_keys(main_language, other_languages), other_languages
+        ):
+            other_language_paragraphs.set_alignment_cache(caches.get(key, AlignmentCache()))
+
+    def save_alignment_caches(self, main_language: ParagraphsFromLanguage, other_languages: list[ParagraphsFromLanguage]):
+        if not self.use_cache:
+            return
+
+        content = dict()
+        for key, other_language_paragraphs in zip(
+            self.get_alignment_cache_keys(main_language, other_languages), other_languages
+        ):
+            alignment_cache = other_language_paragraphs.get_alignment_cache()
+            if alignment_cache is not None:
+                content[key] = alignment_cache.model_dump()
+
+        try:
+            self.extractor_identifier.save_content(ALIGNMENT_CACHE_FILE_NAME, content)
+        except Exception as e:
+            print(f"Error saving alignment cache: {e}")
+
+    @staticmethod
+    def align_serially(main_language: ParagraphsFromLanguage, other_languages: list[ParagraphsFromLanguage]):
         for other_language_paragraphs in other_languages:
             other_language_paragraphs.fix_segments(main_language)
 
         for other_language_paragraphs in other_languages:
             other_language_paragraphs.align(main_language)
 
-        main_language.set_as_main_language()
-        for other_language_paragraphs in other_languages:
-            other_language_paragraphs.replace_paragraphs_to_aligned()
+    def align_in_parallel(
+        self, main_language: ParagraphsFromLanguage, other_languages: list[ParagraphsFromLanguage]
+    ) -> bool:
+        workers = min(self.workers, len(other_languages))
+        if workers < 2 or multiprocessing.current_process().daemon:
+            return False
+
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                main_snapshot = tuple(main_language.paragraphs)
+                snapshots = [main_snapshot] * len(other_languages)
+                fixed_results = list(executor.map(_fix_segments, snapshots, other_languages))
+
+                fixed_main_paragraphs = [main_paragraphs for main_paragraphs, _ in fixed_results]
+                merged_main_snapshot = tuple(self.merge_main_language_changes(main_snapshot, fixed_main_paragraphs))
+                fixed_languages = [fixed_language for _, fixed_language in fixed_results]
+                snapshots = [merged_main_snapshot] * len(other_languages)
+                aligned_languages = list(executor.map(_align, snapshots, fixed_languages))
+        except Exception as e:
+            print(f"Error aligning languages in parallel: {e}")
+            return False
+
+        main_language.paragraphs = list(merged_main_snapshot)
+        for other_language_paragraphs, aligned_language in zip(other_languages, aligned_languages):
+            other_language_paragraphs.copy_alignment(aligned_language, main_language)
+
+        return True
+
+    @staticmethod
+    def get_text_length(paragraph: ParagraphFeatures) -> int:
+        return len("".join(paragraph.original_text.split()))
+
+    @staticmethod
+    def get_segmentation_changes(
+        main_snapshot: tuple[ParagraphFeatures, ...], fixed_main_paragraphs: list[ParagraphFeatures]
+    ) -> list[tuple[int, int, list[ParagraphFeatures]]]:
+        snapshot_lengths = [MultilingualParagraphAlignerUseCase.get_text_length(x) for x in main_snapshot]
+        fixed_lengths = [MultilingualParagraphAlignerUseCase.get_text_length(x) for x in fixed_main_paragraphs]
+        if sum(snapshot_lengths) != sum(fixed_lengths):
+            return []
+
+        changes = list()
+        snapshot_start, fixed_start = 0, 0
+        snapshot_index, fixed_index = 0, 0
+        snapshot_end, fixed_end = 0, 0
+        while snapshot_index < len(main_snapshot) or fixed_index < len(fixed_main_paragraphs):
+            if fixed_index == len(fixed_main_paragraphs) or (
+                snapshot_index < len(main_snapshot) and snapshot_end <= fixed_end
+            ):
+                snapshot_end += snapshot_lengths[snapshot_index]
+                snapshot_index += 1
+            else:
+                fixed_end += fixed_lengths[fixed_index]
+                fixed_index += 1
+
+            if snapshot_end != fixed_end or snapshot_index == snapshot_start or fixed_index == fixed_start:
+                continue
+
+            if snapshot_index - snapshot_start != 1 or fixed_index - fixed_start != 1:
+                changes.append((snapshot_start, snapshot_index, fixed_main_paragraphs[fixed_start:fixed_index]))
+
+            snapshot_start, fixed_start = snapshot_index, fixed_index
+
+        if snapshot_start < len(main_snapshot) or fixed_start < len(fixed_main_paragraphs):
+            changes.append((snapshot_start, len(main_snapshot), fixed_main_paragraphs[fixed_start:]))
+
+        return changes
+
+    @staticmethod
+    def merge_main_language_changes(
+        main_snapshot: tuple[ParagraphFeatures, ...], fixed_main_paragraphs_by_language: list[list[ParagraphFeatures]]
+    ) -> list[ParagraphFeatures]:
+        changed_positions = [False] * len(main_snapshot)
+        accepted_changes: dict[int, tuple[int, list[ParagraphFeatures]]] = dict()
+        for fixed_main_paragraphs in fixed_main_paragraphs_by_language:
+            changes = MultilingualParagraphAlignerUseCase.get_segmentation_changes(main_snapshot, fixed_main_paragraphs)
+            for start, end, paragraphs in changes:
+                if any(changed_positions[start:end]):
+                    continue
+
+                changed_positions[start:end] = [True] * (end - start)
+                accepted_changes[start] = (end, paragraphs)
+
+        merged_paragraphs = list()
+        index = 0
+        while index < len(main_snapshot):
+            if index in accepted_changes:
+                end, paragraphs = accepted_changes[index]
+                merged_paragraphs.extend(paragraphs)
+                index = end
+                continue
+
+            merged_paragraphs.append(main_snapshot[index])
+            index += 1
+
+        return merged_paragraphs
 
     @staticmethod
     def clean_paragraphs(paragraphs_from_languages):
         for paragraphs_from_language in paragraphs_from_languages:
-            paragraphs_from_language.remove_big_no_text_paragraphs()
-            paragraphs_from_language.remove_no_text_paragraphs()
-            paragraphs_from_language.remove_headers_and_footers()
-            paragraphs_from_language.remove_duplicated_text()
-            paragraphs_from_language.merge_colliding_segments()
-            paragraphs_from_language.merge_paragraphs_spanning_two_pages()
-            paragraphs_from_language.remove_no_text_types()
+            paragraphs_from_language.clean()
 
     @staticmethod
     def get_main_and_other_languages(
@@ -0,0 +1,102 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import traceback
+from typing import Optional
+
+from trainable_entity_extractor.config import LOG_BATCH_SIZE, LOG_QUEUE_SIZE, config_logger
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+
+LEVEL_BY_SEVERITY = {LogSeverity.error: logging.ERROR, LogSeverity.debug: logging.DEBUG}
+
+
+class AsyncLogWriter:
+    _instance: Optional["AsyncLogWriter"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self, logger: logging.Logger = config_logger, queue_size: int = LOG_QUEUE_SIZE, batch_size: int = LOG_BATCH_SIZE
+    ):
+        self.logger = logger
+        self.batch_size = batch_size
+        self.records: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped_records_count = 0
+        self.process_id = os.getpid()
+        self.thread = threading.Thread(target=self._run, name="extractor-logger", daemon=True)
+        self.thread.start()
+
+    @staticmethod
+    def get_instance() -> "AsyncLogWriter":
+        with AsyncLogWriter._instance_lock:
+            instance = AsyncLogWriter._instance
+            if not instance or instance.process_id != os.getpid():
+                instance = AsyncLogWriter()
+                AsyncLogWriter._instance = instance
+                atexit.register(instance.flush)
+
+        return instance
+
+    @staticmethod
+    def flush_current():
+        instance = AsyncLogWriter._instance
+        if instance and instance.process_id == os.getpid():
+            instance.flush()
+
+    def write(self, severity: LogSeverity, message: str, context: str, exception: Exception = None):
+        record = (severity, message, context, exception)
+        if severity == LogSeverity.error:
+            self.records.put(record)
+            return
+
+        try:
+            self.records.put_nowait(record)
+        except queue.Full:
+            self.dropped_records_count += 1
+
+    def flush(self, timeout: float = 5):
+        if not self.thread.is_alive():
+            return
+
+        flushed = threading.Event()
+        try:
+            self.records.put(flushed, timeout=timeout)
+        except queue.Full:
+            return
+
+        flushed.wait(timeout)
+
+    def _run(self):
+        while True:
+            batch = [self.records.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.records.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if isinstance(record, threading.Event):
+                    record.set()
+                    continue
+                self.emit(self.logger, *record)
+
+            if self.dropped_records_count:
+                dropped_records_count, self.dropped_records_count = self.dropped_records_count, 0
+                self.logger.warning(f"Logging queue full, {dropped_records_count} log records dropped")
+
+    @staticmethod
+    def emit(logger: logging.Logger, severity: LogSeverity, message: str, context: str, exception: Exception = None):
+        try:
+            if exception:
+                stacktrace_message = "\n".join(
+                    traceback.format_exception(type(exception), exception, exception.__traceback__)
+                )
+                message += f"\nException type: {type(exception).__name__}"
+                message += f"\nException: {exception}"
+                message += f"\nStackTrace: {stacktrace_message}"
+
+            logger.log(LEVEL_BY_SEVERITY.get(severity, logging.INFO), f"{message} for {context}")
+        except Exception:
+            logger.error(f"{message} for {context}")
@@ -0,0 +1,238 @@
+import fnmatch
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from trainable_entity_extractor.adapters.LocalModelStorage import LocalModelStorage
+from trainable_entity_extractor.config import MODEL_BUNDLES_PATH
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.ModelBundleManifest import ModelBundleManifest
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+
+MANIFEST_FILE_NAME = "manifest.json"
+INSTALLED_BUNDLE_FILE_NAME = "installed_bundle.json"
+TRANSIENT_ARTIFACTS = ["checkpoint-*", "runs", "xml_to_train", "__pycache__", "*.tmp"]
+BUNDLE_VERSIONS_TO_KEEP = 2
+COMPRESS_LEVEL = 1
+CHUNK_SIZE = 1024 * 1024
+
+
+class BundleModelStorage(LocalModelStorage):
+    def __init__(self, bundles_path: str | Path = None, extractors: list[type[ExtractorBase]] = None):
+        self.bundles_path = Path(bundles_path) if bundles_path else None
+        self.extractors_by_name = {extractor.__name__: extractor for extractor in extractors or []}
+
+    def get_bundles_path(self, extraction_identifier: ExtractionIdentifier) -> Path:
+        return Path(
+            self.bundles_path or MODEL_BUNDLES_PATH, extraction_identifier.run_name, extraction_identifier.extraction_name
+        )
+
+    def get_manifest(self, extraction_identifier: ExtractionIdentifier) -> Optional[ModelBundleManifest]:
+        manifest_path = Path(self.get_bundles_path(extraction_identifier), MANIFEST_FILE_NAME)
+        if not manifest_path.exists():
+            return None
+
+        try:
+            return ModelBundleManifest.model_validate_json(manifest_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"Error reading model bundle manifest {manifest_path}: {e}")
+            return None
+
+    @staticmethod
+    def is_transient(name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in TRANSIENT_ARTIFACTS)
+
+    def get_other_methods_folders(self, extractor_job: TrainableEntityExtractorJob) -> set[str]:
+        extractor = self.extractors_by_name.get(extractor_job.extractor_name)
+        if not extractor:
+            return set()
+
+        method_names = extractor.get_method_registry().get_names()
+        return {name.lower() for name in method_names if name.lower() != extractor_job.method_name.lower()}
+
+    def get_bundle_files(self, model_path: Path, excluded_folders: set[str] = None) -> list[str]:
+        bundle_files = list()
+        for folder, folder_names, file_names in os.walk(model_path):
+            is_root = Path(folder) == model_path
+            folder_names[:] = sorted(
+                [
+                    name
+                    for name in folder_names
+                    if not self.is_transient(name) and not (is_root and name.lower() in (excluded_folders or set()))
+                ]
+            )
+            for file_name in sorted(file_names):
+                if self.is_transient(file_name) or file_name == INSTALLED_BUNDLE_FILE_NAME:
+                    continue
+                bundle_files.append(Path(folder, file_name).relative_to(model_path).as_posix())
+
+        return bundle_files
+
+    @staticmethod
+    def stage_files(model_path: Path, bundle_files: list[str], staging_path: Path):
+        for bundle_file in bundle_files:
+            staged_file = Path(staging_path, bundle_file)
+            staged_file.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(Path(model_path, bundle_file), staged_file)
+            except OSError:
+                shutil.copy2(Path(model_path, bundle_file), staged_file)
+
+    @staticmethod
+    def write_atomically(path: Path, content: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as temporary_file:
+            temporary_file.write(content)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_file.name, path)
+
+    def upload_model(self, extraction_identifier: ExtractionIdentifier, extractor_job: TrainableEntityExtractorJob) -> bool:
+        if not self.save_extractor_job(extraction_identifier, extractor_job):
+            return False
+
+        model_path = Path(extraction_identifier.get_path())
+        bundles_path = self.get_bundles_path(extraction_identifier)
+        staging_path = Path(bundles_path, f".staging.{os.getpid()}")
+        try:
+            previous_manifest = self.get_manifest(extraction_identifier)
+            version = previous_manifest.version + 1 if previous_manifest else 1
+            bundle_name = f"{version:06d}.tar.gz"
+            bundle_files = self.get_bundle_files(model_path, self.get_other_methods_folders(extractor_job))
+            shutil.rmtree(staging_path, ignore_errors=True)
+            self.stage_files(model_path, bundle_files, staging_path)
+            sha256, size_bytes = self.write_bundle(staging_path, bundle_files, Path(bundles_path, bundle_name))
+
+            manifest = ModelBundleManifest(
+                version=version,
+                bundle_name=bundle_name,
+                sha256=sha256,
+                size_bytes=size_bytes,
+                created=time.time(),
+                method_name=extractor_job.method_name,
+                files=bundle_files,
+                extractor_job=self.serialize_job_to_dict(extractor_job),
+            )
+            self.write_atomically(Path(bundles_path, MANIFEST_FILE_NAME), manifest.model_dump_json(indent=2).encode())
+            self.prune_old_bundles(bundles_path, version)
+            return True
+        except Exception as e:
+            print(f"Error uploading model bundle: {e}")
+            return False
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+    @staticmethod
+    def write_bundle(model_path: Path, bundle_files: list[str], bundle_path: Path) -> tuple[str, int]:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = Path(bundle_path.parent, f".{bundle_path.name}.{os.getpid()}.tmp")
+        try:
+            with tarfile.open(temporary_path, mode="w:gz", compresslevel=COMPRESS_LEVEL) as tar:
+                for bundle_file in bundle_files:
+                    tar.add(Path(model_path, bundle_file), arcname=bundle_file, recursive=False)
+
+            with open(temporary_path, "rb") as bundle:
+                os.fsync(bundle.fileno())
+
+            sha256 = BundleModelStorage.get_sha256(temporary_path)
+            size_bytes = temporary_path.stat().st_size
+            os.replace(temporary_path, bundle_path)
+            return sha256, size_bytes
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def get_sha256(path: Path) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                sha256.update(chunk)
+
+        return sha256.hexdigest()
+
+    @staticmethod
+    def prune_old_bundles(bundles_path: Path, current_version: int):
+        for bundle_path in bundles_path.glob("*.tar.gz"):
+            version = bundle_path.name.split(".")[0]
+            if version.isdigit() and int(version) <= current_version - BUNDLE_VERSIONS_TO_KEEP:
+                bundle_path.unlink(missing_ok=True)
+
+    def is_installed(self, model_path: Path, manifest: ModelBundleManifest) -> bool:
+        installed_bundle_path = Path(model_path, INSTALLED_BUNDLE_FILE_NAME)
+        if not installed_bundle_path.exists():
+            return False
+
+        try:
+            installed_manifest = ModelBundleManifest.model_validate_json(installed_bundle_path.read_text(encoding="utf-8"))
+        except Exception:
+            return False
+
+        return installed_manifest.sha256 == manifest.sha256
+
+    @staticmethod
+    def get_extract_arguments(tar: tarfile.TarFile) -> dict:
+        if hasattr(tarfile, "data_filter"):
+            return {"filter": "data"}
+
+        for member in tar.getmembers():
+            if member.name.startswith("/") or ".." in Path(member.name).parts or not (member.isfile() or member.isdir()):
+                raise ValueError(f"Unsafe member in model bundle: {member.name}")
+
+        return {}
+
+    def download_model(self, extraction_identifier: ExtractionIdentifier) -> bool:
+        model_path = Path(extraction_identifier.get_path())
+        manifest = self.get_manifest(extraction_identifier)
+        if not manifest:
+            return model_path.exists()
+
+        if self.is_installed(model_path, manifest):
+            return True
+
+        versions_path = self.get_installed_versions_path(model_path)
+        version_path = Path(versions_path, f"{manifest.version:06d}_{manifest.sha256[:12]}")
+        staging_path = Path(versions_path, f".staging.{os.getpid()}")
+        try:
+            bundle_path = Path(self.get_bundles_path(extraction_identifier), manifest.bundle_name)
+            if self.get_sha256(bundle_path) != manifest.sha256:
+                print(f"Model bundle {manifest.bundle_name} checksum mismatch for {extraction_identifier}")
+                return False
+
+            if not version_path.exists():
+                shutil.rmtree(staging_path, ignore_errors=True)
+                with tarfile.open(bundle_path, mode="r:gz") as tar:
+                    tar.extractall(staging_path, **self.get_extract_arguments(tar))
+                Path(staging_path, INSTALLED_BUNDLE_FILE_NAME).write_text(manifest.model_dump_json(), encoding="utf-8")
+                os.replace(staging_path, version_path)
+
+            self.point_to_version(model_path, version_path)
+            self.prune_installed_versions(versions_path, version_path)
+            return True
+        except Exception as e:
+            print(f"Error downloading model bundle: {e}")
+            shutil.rmtree(staging_path, ignore_errors=True)
+            return False
+
+    def install_model(self, training_identifier: ExtractionIdentifier, extraction_identifier: ExtractionIdentifier) -> bool:
+        if not self.download_model(extraction_identifier):
+            return False
+
+        shutil.rmtree(training_identifier.get_path(), ignore_errors=True)
+        return True
+
+    def get_extractor_job(self, extraction_identifier: ExtractionIdentifier) -> Optional[TrainableEntityExtractorJob]:
+        manifest = self.get_manifest(extraction_identifier)
+        if not manifest:
+            return super().get_extractor_job(extraction_identifier)
+
+        try:
+            return self.deserialize_job_from_dict(manifest.extractor_job)
+        except Exception as e:
+            print(f"Error loading job: {e}")
+            return None
@@ -1,12 +1,56 @@
+import logging
 import os
-import traceback
-from trainable_entity_extractor.config import config_logger
+import threading
+
+from trainable_entity_extractor.adapters.AsyncLogWriter import AsyncLogWriter
+from trainable_entity_extractor.config import LOG_ASYNC, LOG_DEBUG_SAMPLE_RATE, config_logger
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.LogSeverity import LogSeverity
 from trainable_entity_extractor.ports.Logger import Logger
 
+MACHINE_NAME = os.uname().nodename if hasattr(os, "uname") else os.environ.get("COMPUTERNAME", "")
+CONTEXT_CACHE_SIZE = 1024
+
 
 class ExtractorLogger(Logger):
+    def __init__(self, asynchronous: bool = LOG_ASYNC, debug_sample_rate: float = LOG_DEBUG_SAMPLE_RATE):
+        self.asynchronous = asynchronous
+        self.debug_sample_every = max(1, round(1 / debug_sample_rate)) if debug_sample_rate > 0 else 0
+        self.debug_events_count = 0
+        self.contexts: dict[tuple, str] = dict()
+        self.lock = threading.Lock()
+
+    def get_context(self, extraction_identifier: ExtractionIdentifier) -> str:
+        if not extraction_identifier:
+            return f"No identifier on {MACHINE_NAME}"
+
+        key = (
+            extraction_identifier.run_name,
+            extraction_identifier.extraction_name,
+            str(extraction_identifier.output_path),
+            extraction_identifier.extra_model_folder,
+            tuple(sorted(extraction_identifier.metadata.items())),
+        )
+        context = self.contexts.get(key)
+        if context is None:
+            context = f"{extraction_identifier.model_dump_json()} on {MACHINE_NAME}"
+            with self.lock:
+                if len(self.contexts) >= CONTEXT_CACHE_SIZE:
+                    self.contexts.clear()
+                self.contexts[key] = context
+
+        return context
+
+    def is_sampled_out(self, severity: LogSeverity) -> bool:
+        if severity != LogSeverity.debug:
+            return False
+
+        if not self.debug_sample_every or not config_logger.isEnabledFor(logging.DEBUG):
+            return True
+
+        self.debug_events_count += 1
+        return self.debug_events_count % self.debug_sample_every != 0
+
     def log(
         self,
         extraction_identifier: ExtractionIdentifier,
@@ -14,24 +58,15 @@ class ExtractorLogger(Logger):
         severity: LogSeverity = LogSeverity.info,
         exception: Exception = None,
     ):
-        identifier = extraction_identifier.model_dump_json() if extraction_identifier else "No identifier"
-        machine_name = os.uname().nodename
-
-        if severity != LogSeverity.error:
-            config_logger.info(f"{message} for {identifier} on {machine_name}")
+        if self.is_sampled_out(severity):
             return
 
-        try:
-            if exception:
-                stacktrace_message = "\n".join(
-                    traceback.format_exception(type(exception), exception, exception.__traceback__)
-                )
-                error_message = message
-                error_message += f"\nException type: {type(exception).__name__}"
-                error_message += f"\nException: {exception}"
-                error_message += f"\nStackTrace: {stacktrace_message}"
-                config_logger.error(error_message + " for " + identifier + " on " + machine_name)
-            else:
-                config_logger.error(message + " for " + identifier + " on " + machine_name)
-        except:
-            config_logger.error(message + " for " + identifier + " on " + machine_name)
+        context = self.get_context(extraction_identifier)
+        if self.asynchronous:
+            AsyncLogWriter.get_instance().write(severity, message, context, exception)
+        else:
+            AsyncLogWriter.emit(config_logger, severity, message, context, exception)
+
+    @staticmethod
+    def flush():
+        AsyncLogWriter.flush_current()
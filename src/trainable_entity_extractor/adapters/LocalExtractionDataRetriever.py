@@ -1,5 +1,7 @@
+import os
 import pickle
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 from pathlib import Path
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
@@ -44,7 +46,8 @@ class LocalExtractionDataRetriever(ExtractionDataRetriever):
 
             pickle_file = cache_path / "prediction_data.pickle"
             with open(pickle_file, "wb") as f:
-                pickle.dump(prediction_data, f)
+                for prediction_sample in prediction_data:
+                    pickle.dump(prediction_sample, f)
 
             return True
         except Exception as e:
@@ -53,17 +56,36 @@ class LocalExtractionDataRetriever(ExtractionDataRetriever):
 
     def get_prediction_data(self, extraction_identifier: ExtractionIdentifier) -> list[PredictionSample]:
         try:
-            cache_path = self._get_cache_path(extraction_identifier)
-            pickle_file = cache_path / "prediction_data.pickle"
-
-            if pickle_file.exists():
-                with open(pickle_file, "rb") as f:
-                    return pickle.load(f)
+            return list(self._iterate_prediction_samples(extraction_identifier))
         except Exception as e:
             print(f"Failed to load cached prediction data: {e}")
 
         return []
 
+    def iterate_prediction_data(
+        self, extraction_identifier: ExtractionIdentifier, chunk_size: int
+    ) -> Iterator[list[PredictionSample]]:
+        prediction_samples = self._iterate_prediction_samples(extraction_identifier)
+        while chunk := list(islice(prediction_samples, chunk_size)):
+            yield chunk
+
+    def _iterate_prediction_samples(self, extraction_identifier: ExtractionIdentifier) -> Iterator[PredictionSample]:
+        for frame in self._iterate_pickle_frames(self._get_cache_path(extraction_identifier) / "prediction_data.pickle"):
+            if isinstance(frame, list):
+                yield from frame
+            else:
+                yield frame
+
+    @staticmethod
+    def _iterate_pickle_frames(pickle_file: Path) -> Iterator:
+        if not pickle_file.exists():
+            return
+
+        file_size = pickle_file.stat().st_size
+        with open(pickle_file, "rb") as f:
+            while f.tell() < file_size:
+                yield pickle.load(f)
+
     def _get_from_cache(self, extraction_identifier: ExtractionIdentifier) -> Optional[ExtractionData]:
         try:
             cache_path = self._get_cache_path(extraction_identifier)
@@ -82,29 +104,49 @@ class LocalExtractionDataRetriever(ExtractionDataRetriever):
 
     def get_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
         try:
-            cache_path = self._get_cache_path(extraction_identifier)
-            pickle_file = cache_path / "suggestions_data.pickle"
-
-            if pickle_file.exists():
-                with open(pickle_file, "rb") as f:
-                    return pickle.load(f)
+            pickle_file = self._get_cache_path(extraction_identifier) / "suggestions_data.pickle"
+            return [suggestion for frame in self._iterate_pickle_frames(pickle_file) for suggestion in frame]
         except Exception as e:
             print(f"Failed to load cached suggestions data: {e}")
 
         return []
 
     def save_suggestions(self, extraction_identifier: ExtractionIdentifier, suggestions: list[Suggestion]) -> bool:
+        if not self.append_suggestions(extraction_identifier, suggestions):
+            return False
+
+        return self.commit_suggestions(extraction_identifier)
+
+    def append_suggestions(self, extraction_identifier: ExtractionIdentifier, suggestions: list[Suggestion]) -> bool:
         try:
             cache_path = self._get_cache_path(extraction_identifier)
             cache_path.mkdir(parents=True, exist_ok=True)
 
-            pickle_file = cache_path / "suggestions_data.pickle"
-            with open(pickle_file, "wb") as f:
+            with open(cache_path / "suggestions_data.pickle.partial", "ab") as f:
                 pickle.dump(suggestions, f)
 
             return True
         except Exception as e:
             print(f"Failed to cache suggestions data: {e}")
+            self.discard_suggestions(extraction_identifier)
+            return False
+
+    def commit_suggestions(self, extraction_identifier: ExtractionIdentifier) -> bool:
+        cache_path = self._get_cache_path(extraction_identifier)
+        try:
+            os.replace(cache_path / "suggestions_data.pickle.partial", cache_path / "suggestions_data.pickle")
+            return True
+        except Exception as e:
+            print(f"Failed to cache suggestions data: {e}")
+            self.discard_suggestions(extraction_identifier)
+            return False
+
+    def discard_suggestions(self, extraction_identifier: ExtractionIdentifier) -> bool:
+        try:
+            (self._get_cache_path(extraction_identifier) / "suggestions_data.pickle.partial").unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            print(f"Failed to discard cached suggestions data: {e}")
             return False
 
     def is_extractor_cancelled(self, extractor_identifier: ExtractionIdentifier):
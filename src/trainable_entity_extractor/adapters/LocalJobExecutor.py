@@ -1,3 +1,4 @@
+import time
 from datetime import timedelta, datetime
 from pathlib import Path
 import shutil
@@ -11,11 +12,14 @@ from trainable_entity_extractor.adapters.extractors.text_to_multi_option_extract
     TextToMultiOptionExtractor,
 )
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.TextToTextExtractor import TextToTextExtractor
+from trainable_entity_extractor.config import PROFILE_TRACES_PATH, PREDICTION_CHUNK_SIZE
 from trainable_entity_extractor.domain.DistributedJob import DistributedJob
 from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
 from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.ports.JobExecutor import JobExecutor
 from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
 from trainable_entity_extractor.use_cases.TrainUseCase import TrainUseCase
@@ -32,7 +36,7 @@ class LocalJobExecutor(JobExecutor):
 
     @staticmethod
     def ensure_fresh_model_folder(extraction_identifier: ExtractionIdentifier, max_age_hours: int = 1) -> None:
-        path = Path(extraction_identifier.get_path())
+        path = Path(extraction_identifier.get_training_identifier().get_path())
 
         if path.exists():
             folder_modified_time = datetime.fromtimestamp(path.stat().st_mtime)
@@ -45,16 +49,46 @@ class LocalJobExecutor(JobExecutor):
         else:
             path.mkdir(parents=True, exist_ok=True)
 
+    def save_stage_timings(
+        self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob, profiler: StageProfiler
+    ) -> None:
+        if not profiler.enabled or not profiler.stage_timings:
+            return
+
+        self.logger.log(extraction_identifier, profiler.to_log())
+        trace_name = f"{distributed_sub_job.extractor_job.method_name}_{int(time.time())}.trace.json"
+        trace_path = Path(PROFILE_TRACES_PATH, extraction_identifier.run_name, extraction_identifier.extraction_name)
+        try:
+            profiler.save_chrome_trace(trace_path / trace_name)
+        except Exception as e:
+            self.logger.log(extraction_identifier, f"Saving stage timings trace failed: {e}", LogSeverity.error, e)
+
     def start_performance_evaluation(
         self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
+    ):
+        profiler = StageProfiler(f"{extraction_identifier} / {distributed_sub_job.extractor_job.method_name}")
+        with profiler:
+            performance = self._start_performance_evaluation(extraction_identifier, distributed_sub_job)
+
+        if performance:
+            performance.stage_timings = profiler.get_stage_timings()
+        self.save_stage_timings(extraction_identifier, distributed_sub_job, profiler)
+        return performance
+
+    def _start_performance_evaluation(
+        self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
     ):
         try:
-            self.ensure_fresh_model_folder(extraction_identifier)
-            extraction_data = self.data_retriever.get_extraction_data(extraction_identifier)
+            with StageProfiler.stage("ensure_fresh_model_folder"):
+                self.ensure_fresh_model_folder(extraction_identifier)
+            with StageProfiler.stage("load_extraction_data"):
+                extraction_data = self.data_retriever.get_extraction_data(extraction_identifier)
             if not extraction_data:
                 distributed_sub_job.status = JobStatus.FAILURE
                 return None
 
+            extraction_data.extraction_identifier = extraction_identifier.get_training_identifier()
+
             if not extraction_data.samples or len(extraction_data.samples) == 0:
                 distributed_sub_job.status = JobStatus.FAILURE
                 return None
@@ -82,22 +116,39 @@ class LocalJobExecutor(JobExecutor):
             return None
 
     def upload_model(self, extraction_identifier: ExtractionIdentifier, extractor_job: TrainableEntityExtractorJob) -> bool:
+        training_identifier = extraction_identifier.get_training_identifier()
         try:
-            extraction_identifier.clean_extractor_folder(extractor_job.method_name)
-            return self.model_storage.upload_model(extraction_identifier, extractor_job)
+            training_identifier.clean_extractor_folder(extractor_job.method_name)
+            if not self.model_storage.upload_model(training_identifier, extractor_job):
+                return False
+
+            return self.model_storage.install_model(training_identifier, extraction_identifier)
         except Exception as e:
             self.logger.log(extraction_identifier, f"Model upload failed with exception: {e}", LogSeverity.error, e)
             return False
 
     def start_training(
         self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
+    ) -> Tuple[bool, str]:
+        profiler = StageProfiler(f"{extraction_identifier} / {distributed_sub_job.extractor_job.method_name}")
+        with profiler:
+            result = self._start_training(extraction_identifier, distributed_sub_job)
+
+        self.save_stage_timings(extraction_identifier, distributed_sub_job, profiler)
+        return result
+
+    def _start_training(
+        self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
     ) -> Tuple[bool, str]:
         try:
-            extraction_data = self.data_retriever.get_extraction_data(extraction_identifier)
+            with StageProfiler.stage("load_extraction_data"):
+                extraction_data = self.data_retriever.get_extraction_data(extraction_identifier)
             if not extraction_data:
                 distributed_sub_job.status = JobStatus.FAILURE
                 return False, "No extraction data available for training"
 
+            extraction_data.extraction_identifier = extraction_identifier.get_training_identifier()
+
             train_use_case = TrainUseCase(extractors=self.EXTRACTORS, logger=self.logger)
             success, message = train_use_case.train_one_method(distributed_sub_job.extractor_job, extraction_data)
 
@@ -105,7 +156,10 @@ class LocalJobExecutor(JobExecutor):
                 distributed_sub_job.status = JobStatus.FAILURE
                 return False, message
 
-            if not self.upload_model(extraction_identifier, distributed_sub_job.extractor_job):
+            with StageProfiler.stage("upload_model"):
+                model_uploaded = self.upload_model(extraction_identifier, distributed_sub_job.extractor_job)
+
+            if not model_uploaded:
                 distributed_sub_job.status = JobStatus.FAILURE
                 return False, "Model upload failed after training"
 
@@ -117,23 +171,47 @@ class LocalJobExecutor(JobExecutor):
             return False, str(e)
 
     def start_prediction(self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob) -> None:
+        profiler = StageProfiler(f"{extraction_identifier} / {distributed_sub_job.extractor_job.method_name}")
+        with profiler:
+            self._start_prediction(extraction_identifier, distributed_sub_job)
+
+        self.save_stage_timings(extraction_identifier, distributed_sub_job, profiler)
+
+    def _start_prediction(self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob) -> None:
         try:
-            prediction_data = self.data_retriever.get_prediction_data(extraction_identifier)
-            if not prediction_data:
+            with StageProfiler.stage("download_model"):
+                model_downloaded = self.model_storage.download_model(extraction_identifier)
+            if not model_downloaded:
                 distributed_sub_job.status = JobStatus.FAILURE
                 distributed_sub_job.result = False
                 return
 
+            self.data_retriever.discard_suggestions(extraction_identifier)
+            samples_chunks = self.data_retriever.iterate_prediction_data(extraction_identifier, PREDICTION_CHUNK_SIZE)
             predict_use_case = PredictUseCase(extractors=self.EXTRACTORS, logger=self.logger)
-            suggestions = predict_use_case.predict(distributed_sub_job.extractor_job, prediction_data)
-            success = self.data_retriever.save_suggestions(extraction_identifier, suggestions)
-            if success:
+            suggestions_chunks = predict_use_case.predict_in_chunks(distributed_sub_job.extractor_job, samples_chunks)
+
+            chunks_count = 0
+            success = True
+            while success:
+                with StageProfiler.stage("predict"):
+                    suggestions = next(suggestions_chunks, None)
+                if suggestions is None:
+                    break
+
+                chunks_count += 1
+                with StageProfiler.stage("save_suggestions"):
+                    success = self.data_retriever.append_suggestions(extraction_identifier, suggestions)
+
+            if success and chunks_count and self.data_retriever.commit_suggestions(extraction_identifier):
                 distributed_sub_job.status = JobStatus.SUCCESS
                 distributed_sub_job.result = True
             else:
+                self.data_retriever.discard_suggestions(extraction_identifier)
                 distributed_sub_job.status = JobStatus.FAILURE
                 distributed_sub_job.result = False
         except Exception as e:
+            self.data_retriever.discard_suggestions(extraction_identifier)
             distributed_sub_job.status = JobStatus.FAILURE
             distributed_sub_job.result = False
 
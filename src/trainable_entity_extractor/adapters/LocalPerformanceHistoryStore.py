@@ -0,0 +1,38 @@
+import hashlib
+from pathlib import Path
+
+from trainable_entity_extractor.config import PERFORMANCE_HISTORY_PATH
+from trainable_entity_extractor.domain.PerformanceHistory import PerformanceHistory
+from trainable_entity_extractor.ports.PerformanceHistoryStore import PerformanceHistoryStore
+
+
+class LocalPerformanceHistoryStore(PerformanceHistoryStore):
+    def __init__(self, history_path: str | Path = PERFORMANCE_HISTORY_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.history_path = Path(history_path)
+
+    def _get_file_path(self, profile_key: str) -> Path:
+        file_name = hashlib.sha1(profile_key.encode()).hexdigest()[:16]
+        return Path(self.history_path, f"{file_name}.json")
+
+    def get_history(self, profile_key: str) -> PerformanceHistory:
+        file_path = self._get_file_path(profile_key)
+        try:
+            if file_path.exists():
+                return PerformanceHistory.model_validate_json(file_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"Error loading performance history {file_path}: {e}")
+
+        return PerformanceHistory(profile_key=profile_key)
+
+    def save_history(self, performance_history: PerformanceHistory) -> bool:
+        file_path = self._get_file_path(performance_history.profile_key)
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = file_path.with_suffix(".tmp")
+            temporary_path.write_text(performance_history.model_dump_json(indent=2), encoding="utf-8")
+            temporary_path.replace(file_path)
+            return True
+        except Exception as e:
+            print(f"Error saving performance history {file_path}: {e}")
+            return False
@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from queue import Queue, Empty
+from typing import Optional
+
+from trainable_entity_extractor.adapters.ResidentExtractor import ResidentExtractor
+from trainable_entity_extractor.config import PREDICTION_WORKER_MEMORY_BUDGET_MB, PREDICTION_WORKER_COALESCE_SECONDS
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.PredictionRequest import PredictionRequest
+from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.Suggestion import Suggestion
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.Logger import Logger
+from trainable_entity_extractor.ports.PredictionWorker import PredictionWorker
+from trainable_entity_extractor.use_cases.PredictUseCase import PredictUseCase
+
+
+class LocalPredictionWorker(PredictionWorker):
+    def __init__(
+        self,
+        extractors: list[type[ExtractorBase]],
+        logger: Logger,
+        memory_budget_mb: int = PREDICTION_WORKER_MEMORY_BUDGET_MB,
+        coalesce_seconds: float = PREDICTION_WORKER_COALESCE_SECONDS,
+        use_thread: bool = True,
+    ):
+        self.predict_use_case = PredictUseCase(extractors=extractors, logger=logger)
+        self.logger = logger
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.coalesce_seconds = coalesce_seconds
+        self.use_thread = use_thread
+        self.requests: Queue[Optional[PredictionRequest]] = Queue()
+        self.resident_extractors: OrderedDict[tuple, ResidentExtractor] = OrderedDict()
+        self.resident_extractors_lock = threading.Lock()
+        self.thread_lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def predict(
+        self, extractor_job: TrainableEntityExtractorJob, prediction_samples: list[PredictionSample]
+    ) -> list[Suggestion]:
+        request = PredictionRequest(extractor_job=extractor_job, prediction_samples=prediction_samples)
+
+        if not self.use_thread:
+            self.process_requests([request])
+            return request.future.result()
+
+        self.start()
+        self.requests.put(request)
+        return request.future.result()
+
+    def start(self):
+        with self.thread_lock:
+            if self.thread and self.thread.is_alive():
+                return
+
+            self.thread = threading.Thread(target=self.serve, name="prediction_worker", daemon=True)
+            self.thread.start()
+
+    def close(self) -> None:
+        with self.thread_lock:
+            if self.thread and self.thread.is_alive():
+                self.requests.put(None)
+                self.thread.join()
+            self.thread = None
+
+        with self.resident_extractors_lock:
+            self.resident_extractors.clear()
+
+    def serve(self):
+        while True:
+            requests = [self.requests.get()] + self.get_pending_requests()
+            self.process_requests([request for request in requests if request])
+
+            if None in requests:
+                return
+
+    def get_pending_requests(self) -> list[Optional[PredictionRequest]]:
+        pending_requests = list()
+        deadline = time.monotonic() + self.coalesce_seconds
+        while None not in pending_requests:
+            try:
+                pending_requests.append(self.requests.get(timeout=max(0.0, deadline - time.monotonic())))
+            except Empty:
+                break
+
+        return pending_requests
+
+    def process_requests(self, requests: list[PredictionRequest]):
+        requests_by_key: dict[tuple, list[PredictionRequest]] = dict()
+        for request in requests:
+            requests_by_key.setdefault(request.get_key(), []).append(request)
+
+        for key_requests in requests_by_key.values():
+            try:
+                self.process_batch(key_requests)
+            except Exception as e:
+                extraction_identifier = self.predict_use_case.get_extraction_identifier(key_requests[0].extractor_job)
+                self.logger.log(extraction_identifier, f"Prediction worker failed: {e}", LogSeverity.error, e)
+                for request in key_requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def process_batch(self, requests: list[PredictionRequest]):
+        extractor_job = requests[0].extractor_job
+        resident_extractor = self.get_resident_extractor(extractor_job)
+        samples = [sample for request in requests for sample in request.prediction_samples]
+        with resident_extractor.resident_models:
+            suggestions = self.predict_use_case.get_suggestions(resident_extractor.extractor, extractor_job, samples)
+        self.evict_over_budget()
+
+        if len(requests) == 1:
+            requests[0].future.set_result(suggestions)
+            return
+
+        if len(suggestions) != len(samples):
+            with resident_extractor.resident_models:
+                for request in requests:
+                    request.future.set_result(
+                        self.predict_use_case.get_suggestions(
+                            resident_extractor.extractor, extractor_job, request.prediction_samples
+                        )
+                    )
+            return
+
+        start = 0
+        for request in requests:
+            end = start + len(request.prediction_samples)
+            request.future.set_result(suggestions[start:end])
+            start = end
+
+    def get_resident_extractor(self, extractor_job: TrainableEntityExtractorJob) -> ResidentExtractor:
+        key = PredictionRequest(extractor_job=extractor_job, prediction_samples=[]).get_key()
+        model_path = Path(self.predict_use_case.get_extraction_identifier(extractor_job).get_path())
+        model_modified = model_path.stat().st_mtime if model_path.exists() else 0
+
+        with self.resident_extractors_lock:
+            resident_extractor = self.resident_extractors.get(key)
+            if resident_extractor and resident_extractor.model_modified == model_modified:
+                self.resident_extractors.move_to_end(key)
+                return resident_extractor
+
+        extractor_instance = self.predict_use_case.get_extractor_instance(extractor_job)
+        if not extractor_instance:
+            raise ValueError(f"Extractor {extractor_job.extractor_name} not found")
+
+        resident_extractor = ResidentExtractor(
+            extractor=extractor_instance.keep_methods_resident(),
+            model_path=str(model_path),
+            model_modified=model_modified,
+        )
+
+        with self.resident_extractors_lock:
+            self.resident_extractors[key] = resident_extractor
+            self.resident_extractors.move_to_end(key)
+
+        return resident_extractor
+
+    def evict_over_budget(self):
+        with self.resident_extractors_lock:
+            resident_bytes = sum(x.get_size_bytes() for x in self.resident_extractors.values())
+            while len(self.resident_extractors) > 1 and resident_bytes > self.memory_budget_bytes:
+                _, resident_extractor = self.resident_extractors.popitem(last=False)
+                resident_bytes -= resident_extractor.get_size_bytes()
+
+    def evict(self, extraction_identifier: ExtractionIdentifier) -> None:
+        model_path = str(Path(extraction_identifier.get_path()))
+        with self.resident_extractors_lock:
+            for key, resident_extractor in list(self.resident_extractors.items()):
+                if resident_extractor.model_path == model_path:
+                    del self.resident_extractors[key]
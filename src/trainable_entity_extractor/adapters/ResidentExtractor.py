@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+
+
+@dataclass
+class ResidentExtractor:
+    extractor: ExtractorBase
+    model_path: str
+    model_modified: float
+    resident_models: ResidentModels = field(default_factory=ResidentModels)
+
+    def get_size_bytes(self) -> int:
+        return self.resident_models.get_size_bytes()
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+from trainable_entity_extractor.adapters.AsyncLogWriter import AsyncLogWriter
+from trainable_entity_extractor.config import SUB_JOB_MEMORY_LIMIT_MB, SUB_JOB_POLL_SECONDS
+from trainable_entity_extractor.domain.SupervisionOutcome import SupervisionOutcome
+
+TERMINATION_GRACE_SECONDS = 5
+
+
+class SubJobSupervisor:
+    def __init__(
+        self,
+        memory_limit_mb: int = SUB_JOB_MEMORY_LIMIT_MB,
+        poll_seconds: float = SUB_JOB_POLL_SECONDS,
+        termination_grace_seconds: float = TERMINATION_GRACE_SECONDS,
+    ):
+        self.memory_limit_mb = memory_limit_mb
+        self.poll_seconds = poll_seconds
+        self.termination_grace_seconds = termination_grace_seconds
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self.context = multiprocessing.get_context(start_method)
+
+    def run(
+        self, target: Callable, args: tuple, timeout: float, is_cancelled: Callable[[], bool]
+    ) -> tuple[SupervisionOutcome, Any]:
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(target=self._run_child, args=(sender, target, args))
+        process.start()
+        sender.close()
+        start_time = time.monotonic()
+
+        try:
+            while True:
+                if receiver.poll(self.poll_seconds):
+                    return self._receive(receiver, process)
+
+                if not process.is_alive():
+                    if receiver.poll():
+                        return self._receive(receiver, process)
+                    return SupervisionOutcome.CRASHED, f"Process exited with code {process.exitcode}"
+
+                if timeout and time.monotonic() - start_time > timeout:
+                    self.stop(process)
+                    return SupervisionOutcome.TIMED_OUT, f"Timed out after {timeout} seconds"
+
+                if self.memory_limit_mb and self.get_rss_mb(process.pid) > self.memory_limit_mb:
+                    self.stop(process)
+                    return SupervisionOutcome.MEMORY_EXCEEDED, f"Memory limit of {self.memory_limit_mb}MB exceeded"
+
+                if is_cancelled():
+                    self.stop(process)
+                    return SupervisionOutcome.CANCELED, "Canceled"
+        finally:
+            receiver.close()
+
+    @staticmethod
+    def _run_child(sender: Connection, target: Callable, args: tuple):
+        if hasattr(os, "setsid"):
+            os.setsid()
+
+        try:
+            outcome = (SupervisionOutcome.FINISHED, target(*args))
+        except BaseException as e:
+            outcome = (SupervisionOutcome.CRASHED, f"{type(e).__name__}: {e}")
+
+        AsyncLogWriter.flush_current()
+        try:
+            sender.send(outcome)
+        except BaseException as e:
+            sender.send((SupervisionOutcome.CRASHED, f"{type(e).__name__}: {e}"))
+        finally:
+            sender.close()
+
+    def _receive(self, receiver: Connection, process) -> tuple[SupervisionOutcome, Any]:
+        try:
+            outcome, value = receiver.recv()
+        except EOFError:
+            outcome, value = SupervisionOutcome.CRASHED, f"Process exited with code {process.exitcode}"
+
+        process.join(self.termination_grace_seconds)
+        if process.is_alive():
+            self.stop(process)
+        return outcome, value
+
+    def stop(self, process):
+        self._signal(process, signal.SIGTERM)
+        process.join(self.termination_grace_seconds)
+        if process.is_alive() or hasattr(os, "killpg"):
+            self._signal(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        process.join()
+
+    @staticmethod
+    def _signal(process, signal_number: int):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal_number)
+            else:
+                os.kill(process.pid, signal_number)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    @staticmethod
+    def get_rss_mb(pid: int) -> float:
+        try:
+            with open(f"/proc/{pid}/statm") as statm:
+                resident_pages = int(statm.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+        except (OSError, ValueError, IndexError):
+            return 0.0
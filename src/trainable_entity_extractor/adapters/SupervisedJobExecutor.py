@@ -0,0 +1,84 @@
+import time
+from functools import partial
+from typing import Callable, Tuple
+
+from trainable_entity_extractor.adapters.LocalJobExecutor import LocalJobExecutor
+from trainable_entity_extractor.adapters.SubJobSupervisor import SubJobSupervisor
+from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.SupervisionOutcome import SupervisionOutcome
+from trainable_entity_extractor.ports.ExtractionDataRetriever import ExtractionDataRetriever
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.Logger import Logger
+from trainable_entity_extractor.ports.ModelStorage import ModelStorage
+
+
+def run_sub_job(start: Callable, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob):
+    returned_value = start(extraction_identifier, distributed_sub_job)
+    return returned_value, distributed_sub_job.status, distributed_sub_job.result
+
+
+class SupervisedJobExecutor(LocalJobExecutor):
+    def __init__(
+        self,
+        extractors: list[type[ExtractorBase]],
+        data_retriever: ExtractionDataRetriever,
+        model_storage: ModelStorage,
+        logger: Logger,
+        supervisor: SubJobSupervisor = None,
+    ):
+        super().__init__(extractors, data_retriever, model_storage, logger)
+        self.supervisor = supervisor or SubJobSupervisor()
+
+    def supervise(
+        self, start: Callable, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
+    ) -> tuple[SupervisionOutcome, object]:
+        distributed_sub_job.status = JobStatus.RUNNING
+        outcome, value = self.supervisor.run(
+            target=run_sub_job,
+            args=(partial(start, self), extraction_identifier, distributed_sub_job),
+            timeout=distributed_sub_job.extractor_job.timeout,
+            is_cancelled=lambda: self.is_extractor_cancelled(extraction_identifier),
+        )
+
+        if outcome == SupervisionOutcome.FINISHED:
+            returned_value, distributed_sub_job.status, distributed_sub_job.result = value
+            return outcome, returned_value
+
+        distributed_sub_job.status = JobStatus.CANCELED if outcome == SupervisionOutcome.CANCELED else JobStatus.FAILURE
+        message = f"{distributed_sub_job.extractor_job.method_name} stopped ({outcome}): {value}"
+        severity = LogSeverity.info if outcome == SupervisionOutcome.CANCELED else LogSeverity.error
+        self.logger.log(extraction_identifier, message, severity)
+        return outcome, message
+
+    def start_performance_evaluation(
+        self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
+    ):
+        start_time = time.time()
+        outcome, value = self.supervise(
+            LocalJobExecutor.start_performance_evaluation, extraction_identifier, distributed_sub_job
+        )
+        if outcome == SupervisionOutcome.FINISHED:
+            return value
+
+        distributed_sub_job.result = Performance(
+            method_name=distributed_sub_job.extractor_job.method_name,
+            execution_seconds=int(time.time() - start_time),
+            failed=True,
+            timed_out=outcome == SupervisionOutcome.TIMED_OUT,
+        )
+        return distributed_sub_job.result
+
+    def start_training(
+        self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob
+    ) -> Tuple[bool, str]:
+        outcome, value = self.supervise(LocalJobExecutor.start_training, extraction_identifier, distributed_sub_job)
+        return value if outcome == SupervisionOutcome.FINISHED else (False, value)
+
+    def start_prediction(self, extraction_identifier: ExtractionIdentifier, distributed_sub_job: DistributedSubJob) -> None:
+        outcome, _ = self.supervise(LocalJobExecutor.start_prediction, extraction_identifier, distributed_sub_job)
+        if outcome != SupervisionOutcome.FINISHED:
+            distributed_sub_job.result = False
@@ -12,6 +12,7 @@ from trainable_entity_extractor.adapters.extractors.pdf_to_multi_option_extracto
     CleanBeginningDot250,
 )
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.domain.Value import Value
 from trainable_entity_extractor.ports.MethodBase import MethodBase
 
@@ -63,7 +64,8 @@ class ToTextExtractorMethod(MethodBase):
         if not train_set.samples:
             return 0
 
-        self.train(train_set)
+        with StageProfiler.stage("train"):
+            self.train(train_set)
         samples = test_set.samples
         prediction_samples_data = PredictionSamplesData(
             prediction_samples=[
@@ -76,7 +78,8 @@ class ToTextExtractorMethod(MethodBase):
             multi_value=train_set.multi_value if train_set.multi_value else False,
         )
 
-        predictions = self.predict(prediction_samples_data)
+        with StageProfiler.stage("predict"):
+            predictions = self.predict(prediction_samples_data)
 
         correct = [
             sample
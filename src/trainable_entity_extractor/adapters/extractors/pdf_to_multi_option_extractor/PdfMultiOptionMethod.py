@@ -9,6 +9,7 @@ from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSample import PredictionSample
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.domain.TrainingSample import TrainingSample
 from trainable_entity_extractor.domain.Value import Value
 from trainable_entity_extractor.adapters.extractors.pdf_to_multi_option_extractor.MultiLabelMethod import MultiLabelMethod
@@ -55,13 +56,15 @@ class PdfMultiOptionMethod(MethodBase):
         self.set_parameters(train_set)
         truth_one_hot = self.one_hot_to_options_list([x.labeled_data.values for x in test_set.samples], self.options)
 
-        self.train(train_set)
+        with StageProfiler.stage("train"):
+            self.train(train_set)
         prediction_samples_data = PredictionSamplesData(
             prediction_samples=[PredictionSample.from_pdf_data(x.pdf_data) for x in test_set.samples],
             options=self.options,
             multi_value=self.multi_value,
         )
-        predictions = self.predict(prediction_samples_data)
+        with StageProfiler.stage("predict"):
+            predictions = self.predict(prediction_samples_data)
 
         if not self.multi_value:
             predictions = [x[:1] for x in predictions]
@@ -96,11 +99,13 @@ class PdfMultiOptionMethod(MethodBase):
         self.set_parameters(multi_option_data)
 
         print("Filtering segments")
-        filtered_multi_option_data = self.filter_segments_method().filter(multi_option_data)
+        with StageProfiler.stage("filter_segments"):
+            filtered_multi_option_data = self.filter_segments_method().filter(multi_option_data)
 
         print("Creating model")
-        multi_label = self.multi_label_method(self.extraction_identifier)
-        multi_label.train(filtered_multi_option_data)
+        with StageProfiler.stage("model_fit"):
+            multi_label = self.multi_label_method(self.extraction_identifier)
+            multi_label.train(filtered_multi_option_data)
 
     def predict(self, prediction_samples_data: PredictionSamplesData) -> list[list[Value]]:
         self.options = prediction_samples_data.options
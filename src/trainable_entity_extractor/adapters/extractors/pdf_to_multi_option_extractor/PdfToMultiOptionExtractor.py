@@ -137,13 +137,16 @@ class PdfToMultiOptionExtractor(ExtractorBase):
         self.options: list[Option] = list()
         self.multi_value = False
 
-    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
-        self.options = extraction_data.options
-        self.multi_value = extraction_data.multi_value
+    def reset_model_folders(self):
         SegmentSelector(self.extraction_identifier).prepare_model_folder()
         FastSegmentSelector(self.extraction_identifier).prepare_model_folder()
         FastAndPositionsSegmentSelector(self.extraction_identifier).prepare_model_folder()
 
+    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+        self.options = extraction_data.options
+        self.multi_value = extraction_data.multi_value
+        self.reset_model_folders()
+
         return ExtractorBase.get_train_test_sets(extraction_data)
 
     def get_suggestions(self, method_name: str, prediction_samples_data: PredictionSamplesData) -> list[Suggestion]:
@@ -226,7 +229,9 @@ class PdfToMultiOptionExtractor(ExtractorBase):
             languages.update([sample.labeled_data.language_iso])
 
         empty_pdfs = [
-            x for x in extraction_data.samples if x.pdf_data and x.pdf_data.pdf_features and not x.pdf_data.contains_text()
+            x
+            for x in extraction_data.samples
+            if x.pdf_data and x.pdf_data.has_pdf_features() and not x.pdf_data.contains_text()
         ]
         options_count = len(extraction_data.options)
         stats = f"\nNumber of options: {options_count}\n"
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import fasttext
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
@@ -73,7 +74,7 @@ class FastTextMethod(MultiLabelMethod):
         texts = [sample.pdf_data.get_text() for sample in prediction_samples_data.prediction_samples]
         texts = [text.replace("\n", " ") for text in texts]
 
-        model = fasttext.load_model(self.get_model_path())
+        model = ResidentModels.load(self.get_model_path(), lambda: fasttext.load_model(self.get_model_path()))
         id_labels = {option.id: option.label for option in prediction_samples_data.options}
         labels = self.clean_labels(prediction_samples_data.options, id_labels)
 
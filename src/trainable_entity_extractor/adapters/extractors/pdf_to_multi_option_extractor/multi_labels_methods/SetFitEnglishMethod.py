@@ -4,6 +4,7 @@ from os.path import join, exists
 import pandas as pd
 import torch
 from datasets import load_dataset
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
 from setfit import SetFitModel, TrainingArguments, Trainer
@@ -112,7 +113,7 @@ class SetFitEnglishMethod(MultiLabelMethod):
         texts = [sample.pdf_data.get_text() for sample in prediction_samples_data.prediction_samples]
         texts = [text.replace("\n", " ") for text in texts]
 
-        model = SetFitModel.from_pretrained(self.get_model_path())
+        model = ResidentModels.load(self.get_model_path(), lambda: SetFitModel.from_pretrained(self.get_model_path()))
         predictions = model.predict(texts)
 
         if prediction_samples_data.multi_value:
@@ -7,6 +7,7 @@ import pandas as pd
 import torch.cuda
 from datasets import load_dataset
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
 from trainable_entity_extractor.domain.Value import Value
@@ -124,7 +125,9 @@ class SingleLabelSetFitEnglishMethod(MultiLabelMethod):
         torch.cuda.empty_cache()
 
     def predict(self, prediction_samples_data: PredictionSamplesData) -> list[list[Value]]:
-        model = SetFitModel.from_pretrained(self.get_model_path(), trust_remote_code=True)
+        model = ResidentModels.load(
+            self.get_model_path(), lambda: SetFitModel.from_pretrained(self.get_model_path(), trust_remote_code=True)
+        )
         predict_texts = [sample.pdf_data.get_text() for sample in prediction_samples_data.prediction_samples]
         predictions = model.predict(predict_texts)
 
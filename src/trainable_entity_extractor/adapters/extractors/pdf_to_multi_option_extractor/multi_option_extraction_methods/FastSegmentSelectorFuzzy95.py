@@ -128,7 +128,7 @@ class FastSegmentSelectorFuzzy95(PdfMultiOptionMethod):
     def fix_two_pages_segments(self, sample: TrainingSample | PredictionSample) -> list[PdfDataSegment]:
         pdf_data_segments = sample.pdf_data.pdf_data_segments
         text_type_segments = [s for s in pdf_data_segments if s.segment_type in self.text_types]
-        text_type_segments_set = set(text_type_segments)
+        text_type_segments_indexes = PdfDataSegment.get_indexes(text_type_segments)
 
         fixed_segments = []
         removed_segments = set()
@@ -137,7 +137,7 @@ class FastSegmentSelectorFuzzy95(PdfMultiOptionMethod):
             if segment in removed_segments:
                 continue
 
-            new_segment, merged_segment = self._fix_segment(segment, text_type_segments, text_type_segments_set)
+            new_segment, merged_segment = self._fix_segment(segment, text_type_segments, text_type_segments_indexes)
             fixed_segments.append(new_segment)
             if merged_segment is not None:
                 removed_segments.add(merged_segment)
@@ -146,10 +146,12 @@ class FastSegmentSelectorFuzzy95(PdfMultiOptionMethod):
 
     @staticmethod
     def _fix_segment(
-        segment: PdfDataSegment, text_type_segments: list[PdfDataSegment], text_type_segments_set: set[PdfDataSegment]
+        segment: PdfDataSegment,
+        text_type_segments: list[PdfDataSegment],
+        text_type_segments_indexes: dict[PdfDataSegment, int],
     ):
-        if segment in text_type_segments_set and segment.text_content and segment.text_content[-1] != ".":
-            segment_index = text_type_segments.index(segment)
+        if segment in text_type_segments_indexes and segment.text_content and segment.text_content[-1] != ".":
+            segment_index = text_type_segments_indexes[segment]
             if (
                 segment_index + 1 < len(text_type_segments)
                 and segment.page_number < text_type_segments[segment_index + 1].page_number
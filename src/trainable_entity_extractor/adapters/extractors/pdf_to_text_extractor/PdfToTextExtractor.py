@@ -88,10 +88,13 @@ class PdfToTextExtractor(ToTextExtractor):
     METHODS += [pdf_to_text_method_builder(PdfToTextSegmentSelector, GeminiTextMethod)]
     METHODS += t5_methods
 
-    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+    def reset_model_folders(self):
         SegmentSelector(extraction_identifier=self.extraction_identifier).prepare_model_folder()
         FastSegmentSelector(extraction_identifier=self.extraction_identifier).prepare_model_folder()
         FastAndPositionsSegmentSelector(extraction_identifier=self.extraction_identifier).prepare_model_folder()
+
+    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+        self.reset_model_folders()
         return self.get_train_test_sets(extraction_data)
 
     @staticmethod
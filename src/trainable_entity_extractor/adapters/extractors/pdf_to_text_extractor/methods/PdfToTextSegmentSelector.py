@@ -4,6 +4,7 @@ from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIde
 from trainable_entity_extractor.domain.PdfData import PdfData
 from trainable_entity_extractor.domain.PdfDataSegment import PdfDataSegment
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
 
 
@@ -42,9 +43,11 @@ class PdfToTextSegmentSelector(SegmentSelector):
         return semantic_metadata_extraction.predict(prediction_samples_data)
 
     def get_performance(self, train_set: ExtractionData, test_set: ExtractionData) -> float:
-        self.create_segment_selector_model(train_set)
-        self._select_segments([sample.pdf_data for sample in train_set.samples])
-        self._select_segments([sample.pdf_data for sample in test_set.samples])
+        with StageProfiler.stage("segment_selector_model"):
+            self.create_segment_selector_model(train_set)
+        with StageProfiler.stage("segment_selection"):
+            self._select_segments([sample.pdf_data for sample in train_set.samples])
+            self._select_segments([sample.pdf_data for sample in test_set.samples])
 
         semantic_metadata_extraction = self.SEMANTIC_METHOD(self.extraction_identifier)
         return semantic_metadata_extraction.get_performance(train_set, test_set)
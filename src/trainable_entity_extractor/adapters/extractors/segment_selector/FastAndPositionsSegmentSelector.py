@@ -8,14 +8,14 @@ class FastAndPositionsSegmentSelector(FastSegmentSelector):
         features = list()
         text = segment.text_content
 
-        if segment in self.text_segments:
-            index = self.text_segments.index(segment)
+        if segment in self.text_segments_indexes:
+            index = self.text_segments_indexes[segment]
             previous_segment_texts = self.clean_texts(self.text_segments[index - 1]) if index > 0 else []
             next_segment_texts = (
                 self.clean_texts(self.text_segments[index + 1]) if index + 1 < len(self.text_segments) else []
             )
         else:
-            index = segments.index(segment)
+            index = self.segments_indexes[segment] if segment in self.segments_indexes else segments.index(segment)
             previous_segment_texts = self.clean_texts(segments[index - 1]) if index > 0 else ""
             next_segment_texts = self.clean_texts(segments[index + 1]) if index + 1 < len(segments) else ""
 
@@ -8,6 +8,7 @@ from pathlib import Path
 import numpy as np
 from pdf_token_type_labels.TokenType import TokenType
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.PdfData import PdfData
 from trainable_entity_extractor.domain.PdfDataSegment import PdfDataSegment
@@ -21,6 +22,8 @@ class FastSegmentSelector(SegmentSelectorBase):
         super().__init__(extraction_identifier)
         self.text_types = [TokenType.TEXT, TokenType.LIST_ITEM, TokenType.TITLE, TokenType.SECTION_HEADER, TokenType.CAPTION]
         self.previous_words, self.next_words, self.text_segments = [], [], []
+        self.text_segments_indexes: dict[PdfDataSegment, int] = dict()
+        self.segments_indexes: dict[PdfDataSegment, int] = dict()
 
         self.fast_segment_selector_path = Path(self.extraction_identifier.get_path(), self.__class__.__name__)
 
@@ -45,14 +48,14 @@ class FastSegmentSelector(SegmentSelectorBase):
         features = list()
         text = segment.text_content
 
-        if segment in self.text_segments:
-            index = self.text_segments.index(segment)
+        if segment in self.text_segments_indexes:
+            index = self.text_segments_indexes[segment]
             previous_segment_texts = self.clean_texts(self.text_segments[index - 1]) if index > 0 else []
             next_segment_texts = (
                 self.clean_texts(self.text_segments[index + 1]) if index + 1 < len(self.text_segments) else []
             )
         else:
-            index = segments.index(segment)
+            index = self.segments_indexes[segment] if segment in self.segments_indexes else segments.index(segment)
             previous_segment_texts = self.clean_texts(segments[index - 1]) if index > 0 else ""
             next_segment_texts = self.clean_texts(segments[index + 1]) if index + 1 < len(segments) else ""
 
@@ -129,6 +132,8 @@ class FastSegmentSelector(SegmentSelectorBase):
     def get_x_y(self, segments):
         x_rows = []
         y = []
+        self.text_segments_indexes = PdfDataSegment.get_indexes(self.text_segments)
+        self.segments_indexes = PdfDataSegment.get_indexes(segments)
 
         for segment in segments:
             x_rows.append(self.get_features(segment, segments))
@@ -152,7 +157,7 @@ class FastSegmentSelector(SegmentSelectorBase):
         if x.size == 0 or x[0].size == 0:
             return []
 
-        model = lgb.Booster(model_file=self.model_path)
+        model = ResidentModels.load(self.model_path, lambda: lgb.Booster(model_file=self.model_path))
         predictions_array = model.predict(x)
         predictions = list(predictions_array) if predictions_array is not None else []
         return self.predictions_scores_to_segments(segments, predictions)
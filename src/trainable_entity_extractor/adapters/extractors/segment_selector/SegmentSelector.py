@@ -5,6 +5,7 @@ from os import makedirs
 from os.path import join, exists
 from pathlib import Path
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.PdfData import PdfData
 from trainable_entity_extractor.adapters.extractors.segment_selector.SegmentSelectorBase import SegmentSelectorBase
@@ -21,7 +22,7 @@ class SegmentSelector(SegmentSelectorBase):
 
     def load_model(self):
         if exists(self.model_path):
-            return lgb.Booster(model_file=self.model_path)
+            return ResidentModels.load(self.model_path, lambda: lgb.Booster(model_file=self.model_path))
 
         return None
 
@@ -56,7 +57,7 @@ class SegmentSelector(SegmentSelectorBase):
     def get_valid_pdfs_data(pdfs_data: list[PdfData]) -> list[PdfData]:
         valid_pdf_data = list()
         for pdf_data in pdfs_data:
-            if not pdf_data.pdf_features or not pdf_data.pdf_data_segments:
+            if not pdf_data.has_pdf_features() or not pdf_data.pdf_data_segments:
                 continue
 
             valid_pdf_data.append(pdf_data)
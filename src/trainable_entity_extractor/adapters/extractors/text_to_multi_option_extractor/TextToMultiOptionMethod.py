@@ -13,6 +13,7 @@ from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
 from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.ports.MethodBase import MethodBase
 
 
@@ -54,15 +55,18 @@ class TextToMultiOptionMethod(MethodBase):
         self.options = train_set.options
         self.multi_value = train_set.multi_value
 
-        self.train(train_set)
+        with StageProfiler.stage("train"):
+            self.train(train_set)
 
         prediction_samples_list = [PredictionSample(source_text=x.labeled_data.source_text) for x in test_set.samples]
         prediction_samples = PredictionSamplesData(
             prediction_samples=prediction_samples_list, options=self.options, multi_value=self.multi_value
         )
-        predictions = self.predict(prediction_samples)
+        with StageProfiler.stage("predict"):
+            predictions = self.predict(prediction_samples)
 
-        self.remove_model()
+        with StageProfiler.stage("cleanup"):
+            self.remove_model()
 
         correct_one_hot_encoding = self.get_one_hot_encoding(test_set)
         predictions_one_hot_encoding = [
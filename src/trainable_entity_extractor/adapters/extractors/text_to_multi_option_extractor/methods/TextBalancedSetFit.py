@@ -5,6 +5,7 @@ from os.path import join, exists
 import pandas as pd
 from datasets import load_dataset
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.Option import Option
 from setfit import SetFitModel, TrainingArguments, Trainer
@@ -155,7 +156,7 @@ class TextBalancedSetFit(TextToMultiOptionMethod):
     def predict(self, prediction_samples_data: PredictionSamplesData) -> list[list[Option]]:
         self.options = prediction_samples_data.options
         self.multi_value = prediction_samples_data.multi_value
-        model = SetFitModel.from_pretrained(self.get_model_path())
+        model = ResidentModels.load(self.get_model_path(), lambda: SetFitModel.from_pretrained(self.get_model_path()))
         texts = [self.get_text(sample.get_input_text()) for sample in prediction_samples_data.prediction_samples]
         predictions = model.predict(texts)
 
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import fasttext
 
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
 from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
@@ -73,7 +74,7 @@ class TextFastTextMethod(TextToMultiOptionMethod):
         texts = [sample.get_input_text() for sample in prediction_samples.prediction_samples]
         texts = [text.replace("\n", " ") for text in texts]
 
-        model = fasttext.load_model(self.get_model_path())
+        model = ResidentModels.load(self.get_model_path(), lambda: fasttext.load_model(self.get_model_path()))
         labels = self.clean_labels(prediction_samples.options)
 
         if prediction_samples.multi_value:
@@ -1,6 +1,7 @@
 import textwrap
 from pathlib import Path
 import random
+from typing import Any
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Gemini.GeminiRun import (
@@ -74,15 +75,8 @@ class GeminiRunMultiOption(GeminiRun):
             sample for sample, prediction in zip(self.non_used_samples, predictions) if set(prediction) != set(sample.output)
         ]
 
-    def _process_samples_with_function(self, extract_func: callable, samples: list) -> list:
-        outputs = []
-        for sample in samples:
-            try:
-                result = extract_func(sample.input_text)
-                outputs.append(result)
-            except Exception:
-                outputs.append([])
-        return outputs
+    def _process_outputs(self, outputs: list[tuple[bool, Any]]) -> list:
+        return [result if success else [] for success, result in outputs]
 
     @staticmethod
     def from_extractor_identifier_multioption(
@@ -9,6 +9,7 @@ from trainable_entity_extractor.adapters.extractors.text_to_multi_option_extract
     GeminiRunMultiOption,
 )
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Gemini.GeminiSample import GeminiSample
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
 
 
 class TextGeminiMultiOption(TextToMultiOptionMethod):
@@ -16,9 +17,7 @@ class TextGeminiMultiOption(TextToMultiOptionMethod):
         return "TextGeminiMultiOption"
 
     def can_be_used(self, extraction_data):
-        if GEMINI_API_KEY:
-            return True
-        return False
+        return LLMResponseCache().can_generate(GEMINI_API_KEY)
 
     def should_be_retrained_with_more_data(self):
         return False
@@ -11,6 +11,7 @@ from trainable_entity_extractor.adapters.extractors.text_to_multi_option_extract
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Ollama.OllamaSample import (
     OllamaSample,
 )
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
 
 
 class TextOllamaMultiOption(TextToMultiOptionMethod):
@@ -18,9 +19,7 @@ class TextOllamaMultiOption(TextToMultiOptionMethod):
         return "TextOllamaMultiOption"
 
     def can_be_used(self, extraction_data):
-        if OLLAMA_API_KEY:
-            return True
-        return False
+        return LLMResponseCache().can_generate(OLLAMA_API_KEY)
 
     def should_be_retrained_with_more_data(self):
         return False
@@ -1,13 +1,17 @@
 import random
 from pathlib import Path
-import builtins
+from typing import Any
 
 from google import genai
 from pydantic import BaseModel
 import textwrap
 
-from trainable_entity_extractor.config import GEMINI_API_KEY
+from trainable_entity_extractor.config import GEMINI_API_KEY, LLM_MAX_ATTEMPTS
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.GeneratedCodeRunner import (
+    GeneratedCodeRunner,
+)
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Gemini.GeminiSample import GeminiSample
 
 CODE_FILE_NAME = "gemini_code.py"
@@ -42,7 +46,7 @@ class GeminiRun(BaseModel):
         self._set_prompt()
 
     def run_training(self, previous_run: "GeminiRun"):
-        if not self.max_training_size or not GEMINI_API_KEY:
+        if not self.max_training_size or not LLMResponseCache().can_generate(GEMINI_API_KEY):
             return
 
         self._update_data_from_previous_run(previous_run)
@@ -63,13 +67,33 @@ class GeminiRun(BaseModel):
             if prediction.strip() != sample.output.strip()
         ]
 
-    def _set_code_from_model(self):
+    def _request_answer(self) -> str:
         client = genai.Client(api_key=GEMINI_API_KEY)
         response = client.models.generate_content(model=self.gemini_model, contents=self.prompt)
-        answer: str = response.text
+        return response.text
+
+    def _set_code_from_model(self):
+        parameters = {"provider": "gemini"}
+        llm_response_cache = LLMResponseCache()
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            answer = llm_response_cache.get_response(
+                self.gemini_model, self.prompt, parameters, self._request_answer, attempt
+            )
+            if answer is None:
+                return
+
+            self.code = self.get_code_from_answer(answer)
+            if self.code:
+                return
+
+    @staticmethod
+    def get_code_from_answer(answer: str) -> str:
         code_start = "```python\n"
         code_end = "```"
-        self.code = answer[answer.find(code_start) + len(code_start) : answer.rfind(code_end)]
+        if code_start not in answer:
+            return ""
+
+        return answer[answer.find(code_start) + len(code_start) : answer.rfind(code_end)]
 
     def _get_task_section(self, indent_prefix: str) -> str:
         """Override in subclasses to customize the task section"""
@@ -140,61 +164,17 @@ class GeminiRun(BaseModel):
         if not self.code:
             return
 
-        code_to_save = self.code.replace("\\n", "\n")
-        code_to_save = code_to_save.replace("\\t", "\t")
-        code_to_save = code_to_save.replace("\\r", "\r")
-
-        extraction_identifier.save_content(CODE_FILE_NAME, code_to_save, False)
+        extraction_identifier.save_content(CODE_FILE_NAME, self._get_code_to_execute(), False)
         extraction_identifier.save_content(PROMPT_FILE_NAME, self.prompt, False)
 
-    def _load_extract_function(self):
-        import re
-        import json
-        import math
-        import datetime
-        import collections
-        import itertools
-        import string
-        import rapidfuzz
-
-        local_namespace = {}
-
+    def _get_code_to_execute(self) -> str:
         code_to_execute = self.code.replace("\\n", "\n")
         code_to_execute = code_to_execute.replace("\\t", "\t")
         code_to_execute = code_to_execute.replace("\\r", "\r")
+        return code_to_execute
 
-        try:
-            global_namespace = {
-                "__builtins__": builtins,
-                "__name__": "__main__",
-                "re": re,
-                "json": json,
-                "math": math,
-                "datetime": datetime,
-                "collections": collections,
-                "itertools": itertools,
-                "string": string,
-                "rapidfuzz": rapidfuzz,
-            }
-
-            exec(code_to_execute, global_namespace, local_namespace)
-            extract_func = local_namespace.get("extract")
-            if callable(extract_func):
-                return extract_func
-            return None
-        except Exception as e:
-            print(f"Error loading extract function: {e}")
-            return None
-
-    def _process_samples_with_function(self, extract_func: callable, samples: list[GeminiSample]) -> list[str]:
-        outputs_texts = []
-        for sample in samples:
-            try:
-                result = extract_func(sample.input_text)
-                outputs_texts.append(str(result) if result is not None else "")
-            except Exception:
-                outputs_texts.append("")
-
+    def _process_outputs(self, outputs: list[tuple[bool, Any]]) -> list[str]:
+        outputs_texts = [str(result) if success and result is not None else "" for success, result in outputs]
         outputs_texts = [self.clean_outputs(text) for text in outputs_texts]
         return outputs_texts
 
@@ -202,11 +182,11 @@ class GeminiRun(BaseModel):
         if not self.code:
             return self._get_empty_results(samples)
 
-        extract_func = self._load_extract_function()
-        if not extract_func:
+        outputs = GeneratedCodeRunner.run(self._get_code_to_execute(), [sample.input_text for sample in samples])
+        if outputs is None:
             return self._get_empty_results(samples)
 
-        return self._process_samples_with_function(extract_func, samples)
+        return self._process_outputs(outputs)
 
     @staticmethod
     def from_extractor_identifier(extraction_identifier: ExtractionIdentifier) -> "GeminiRun":
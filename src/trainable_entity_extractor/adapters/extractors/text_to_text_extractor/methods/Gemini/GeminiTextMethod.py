@@ -4,6 +4,7 @@ from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSa
 from trainable_entity_extractor.adapters.extractors.ToTextExtractorMethod import ToTextExtractorMethod
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Gemini.GeminiRun import GeminiRun
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Gemini.GeminiSample import GeminiSample
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
 
 
 class GeminiTextMethod(ToTextExtractorMethod):
@@ -12,15 +13,13 @@ class GeminiTextMethod(ToTextExtractorMethod):
         return "GeminiTextMethod"
 
     def can_be_used(self, extraction_data: ExtractionData) -> bool:
-        if GEMINI_API_KEY:
-            return True
-        return False
+        return LLMResponseCache().can_generate(GEMINI_API_KEY)
 
     def should_be_retrained_with_more_data(self):
         return False
 
     def train(self, extraction_data: ExtractionData):
-        if not GEMINI_API_KEY:
+        if not LLMResponseCache().can_generate(GEMINI_API_KEY):
             return
 
         gemini_samples = [GeminiSample.from_training_sample(sample) for sample in extraction_data.samples]
@@ -0,0 +1,181 @@
+import atexit
+import builtins
+import hashlib
+import marshal
+import multiprocessing
+import pickle
+from multiprocessing.pool import Pool
+from types import CodeType
+from typing import Any, Optional
+
+SAMPLE_TIMEOUT_SECONDS = 2
+CALL_TIMEOUT_SECONDS = 30
+WORKER_MEMORY_LIMIT_BYTES = 2 * 1024**3
+WORKERS_COUNT = 2
+
+_worker_functions: dict[str, Optional[callable]] = dict()
+
+
+class SampleTimeoutError(Exception):
+    pass
+
+
+def _raise_sample_timeout(signal_number, frame):
+    raise SampleTimeoutError()
+
+
+def _initialize_worker(memory_limit_bytes: int):
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def _get_extract_function(code_hash: str, marshaled_code: bytes) -> Optional[callable]:
+    if code_hash in _worker_functions:
+        return _worker_functions[code_hash]
+
+    import re
+    import json
+    import math
+    import datetime
+    import collections
+    import itertools
+    import string
+    import rapidfuzz
+
+    global_namespace = {
+        "__builtins__": builtins,
+        "__name__": "__main__",
+        "re": re,
+        "json": json,
+        "math": math,
+        "datetime": datetime,
+        "collections": collections,
+        "itertools": itertools,
+        "string": string,
+        "rapidfuzz": rapidfuzz,
+    }
+    local_namespace = {}
+
+    try:
+        exec(marshal.loads(marshaled_code), global_namespace, local_namespace)
+        extract_function = local_namespace.get("extract")
+        extract_function = extract_function if callable(extract_function) else None
+    except Exception as e:
+        print(f"Error loading extract function: {e}")
+        extract_function = None
+
+    _worker_functions[code_hash] = extract_function
+    return extract_function
+
+
+def _to_transferable(value: Any) -> Any:
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return str(value)
+
+
+def _apply_extract(code_hash: str, marshaled_code: bytes, texts: list[str], use_timer: bool) -> list[tuple[bool, Any]]:
+    extract_function = _get_extract_function(code_hash, marshaled_code)
+    if not extract_function:
+        return [(False, None)] * len(texts)
+
+    if use_timer:
+        import signal
+
+        signal.signal(signal.SIGALRM, _raise_sample_timeout)
+
+    outputs = []
+    for text in texts:
+        try:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_REAL, SAMPLE_TIMEOUT_SECONDS)
+            outputs.append((True, _to_transferable(extract_function(text))))
+        except BaseException:
+            outputs.append((False, None))
+        finally:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return outputs
+
+
+class GeneratedCodeRunner:
+    compiled_codes: dict[str, Optional[CodeType]] = dict()
+    pool: Optional[Pool] = None
+
+    @staticmethod
+    def get_code_hash(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def compile_code(code: str) -> Optional[CodeType]:
+        code_hash = GeneratedCodeRunner.get_code_hash(code)
+        if code_hash not in GeneratedCodeRunner.compiled_codes:
+            try:
+                GeneratedCodeRunner.compiled_codes[code_hash] = compile(code, f"<extract_{code_hash[:12]}>", "exec")
+            except Exception as e:
+                print(f"Error compiling extract function: {e}")
+                GeneratedCodeRunner.compiled_codes[code_hash] = None
+
+        return GeneratedCodeRunner.compiled_codes[code_hash]
+
+    @staticmethod
+    def get_pool() -> Optional[Pool]:
+        if GeneratedCodeRunner.pool:
+            return GeneratedCodeRunner.pool
+
+        if multiprocessing.current_process().daemon:
+            return None
+
+        try:
+            context = multiprocessing.get_context("spawn")
+            GeneratedCodeRunner.pool = context.Pool(
+                processes=WORKERS_COUNT, initializer=_initialize_worker, initargs=(WORKER_MEMORY_LIMIT_BYTES,)
+            )
+        except Exception as e:
+            print(f"Error starting generated code workers: {e}")
+            return None
+
+        return GeneratedCodeRunner.pool
+
+    @staticmethod
+    def close_pool():
+        if GeneratedCodeRunner.pool:
+            GeneratedCodeRunner.pool.terminate()
+            GeneratedCodeRunner.pool = None
+
+    @staticmethod
+    def run(code: str, texts: list[str]) -> Optional[list[tuple[bool, Any]]]:
+        code_object = GeneratedCodeRunner.compile_code(code)
+        if not code_object:
+            return None
+
+        if not texts:
+            return []
+
+        code_hash = GeneratedCodeRunner.get_code_hash(code)
+        marshaled_code = marshal.dumps(code_object)
+
+        pool = GeneratedCodeRunner.get_pool()
+        if not pool:
+            return _apply_extract(code_hash, marshaled_code, texts, False)
+
+        async_result = pool.apply_async(_apply_extract, (code_hash, marshaled_code, texts, True))
+        try:
+            return async_result.get(timeout=CALL_TIMEOUT_SECONDS + SAMPLE_TIMEOUT_SECONDS * len(texts))
+        except multiprocessing.TimeoutError:
+            print(f"Generated extract function timed out on {len(texts)} samples")
+            GeneratedCodeRunner.close_pool()
+            return [(False, None)] * len(texts)
+        except Exception as e:
+            print(f"Error running extract function: {e}")
+            return [(False, None)] * len(texts)
+
+
+atexit.register(GeneratedCodeRunner.close_pool)
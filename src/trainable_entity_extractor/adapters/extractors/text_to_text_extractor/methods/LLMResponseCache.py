@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from trainable_entity_extractor.config import LLM_CACHE_PATH, LLM_CACHE_MODE, LLM_CACHE_MAX_MB
+from trainable_entity_extractor.domain.LLMCacheMode import LLMCacheMode
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        cache_path: str | Path = LLM_CACHE_PATH,
+        mode: LLMCacheMode | str = LLM_CACHE_MODE,
+        max_mb: float = LLM_CACHE_MAX_MB,
+    ):
+        self.cache_path = Path(cache_path)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        try:
+            self.mode = LLMCacheMode(str(mode).upper())
+        except ValueError:
+            self.mode = LLMCacheMode.OFF
+
+    @staticmethod
+    def get_key(model: str, prompt: str, parameters: dict) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        key_content = json.dumps({"model": model, "prompt_hash": prompt_hash, "parameters": parameters}, sort_keys=True)
+        return hashlib.sha256(key_content.encode("utf-8")).hexdigest()
+
+    def get_file_path(self, key: str) -> Path:
+        return self.cache_path / key[:2] / f"{key}.json"
+
+    def can_generate(self, api_key: Optional[str]) -> bool:
+        return bool(api_key) or self.mode == LLMCacheMode.REPLAY
+
+    def get(self, model: str, prompt: str, parameters: dict) -> Optional[str]:
+        if self.mode == LLMCacheMode.OFF:
+            return None
+
+        file_path = self.get_file_path(self.get_key(model, prompt, parameters))
+        if not file_path.exists():
+            return None
+
+        try:
+            response = json.loads(file_path.read_text(encoding="utf-8"))["response"]
+            os.utime(file_path)
+            return response
+        except Exception as e:
+            print(f"Error reading cached LLM response {file_path}: {e}")
+            return None
+
+    def save(self, model: str, prompt: str, parameters: dict, response: str) -> None:
+        if self.mode != LLMCacheMode.READ_WRITE:
+            return
+
+        file_path = self.get_file_path(self.get_key(model, prompt, parameters))
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        content = {"model": model, "parameters": parameters, "prompt": prompt, "response": response}
+        temporary_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            temporary_path.write_text(json.dumps(content, ensure_ascii=False), encoding="utf-8")
+            os.replace(temporary_path, file_path)
+        except Exception as e:
+            print(f"Error caching LLM response {file_path}: {e}")
+            temporary_path.unlink(missing_ok=True)
+
+        self.evict()
+
+    def evict(self) -> None:
+        files = list()
+        for file_path in self.cache_path.glob("*/*.json"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_path))
+
+        cache_size = sum(size for _, size, _ in files)
+        for _, size, file_path in sorted(files):
+            if cache_size <= self.max_bytes:
+                return
+
+            file_path.unlink(missing_ok=True)
+            cache_size -= size
+
+    def get_response(
+        self, model: str, prompt: str, parameters: dict, request_response: Callable[[], str], attempt: int = 0
+    ) -> Optional[str]:
+        response = self.get(model, prompt, parameters) if attempt == 0 else None
+        if response is not None:
+            return response
+
+        if self.mode == LLMCacheMode.REPLAY:
+            print(f"No cached LLM response for model {model} in replay mode")
+            return None
+
+        response = request_response()
+        self.save(model, prompt, parameters, response)
+        return response
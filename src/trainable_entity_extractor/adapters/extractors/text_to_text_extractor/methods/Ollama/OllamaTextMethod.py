@@ -4,6 +4,7 @@ from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSa
 from trainable_entity_extractor.adapters.extractors.ToTextExtractorMethod import ToTextExtractorMethod
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Ollama.OllamaRun import OllamaRun
 from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.Ollama.OllamaSample import OllamaSample
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
 
 
 class OllamaTextMethod(ToTextExtractorMethod):
@@ -12,15 +13,13 @@ class OllamaTextMethod(ToTextExtractorMethod):
         return "OllamaTextMethod"
 
     def can_be_used(self, extraction_data: ExtractionData) -> bool:
-        if OLLAMA_API_KEY:
-            return True
-        return False
+        return LLMResponseCache().can_generate(OLLAMA_API_KEY)
 
     def should_be_retrained_with_more_data(self):
         return False
 
     def train(self, extraction_data: ExtractionData):
-        if not OLLAMA_API_KEY:
+        if not LLMResponseCache().can_generate(OLLAMA_API_KEY):
             return
 
         ollama_samples = [OllamaSample.from_training_sample(sample) for sample in extraction_data.samples]
@@ -9,10 +9,50 @@ APP_PATH = Path(__file__).parent.parent.absolute()
 ROOT_PATH = Path(__file__).parent.parent.parent.absolute()
 DATA_PATH = Path(ROOT_PATH, "models_data")
 CACHE_PATH = Path(DATA_PATH, "cache", "extraction_data")
+MODEL_BUNDLES_PATH = Path(os.environ.get("MODEL_BUNDLES_PATH", Path(DATA_PATH, "model_bundles")))
 EXTRACTOR_JOB_PATH = Path("extractor_job", "extractor_job.json")
 GRAYLOG_IP = os.environ.get("GRAYLOG_IP")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 OLLAMA_API_KEY = os.environ.get("OLLAMA_API_KEY")
+LLM_CACHE_PATH = Path(os.environ.get("LLM_CACHE_PATH", Path(DATA_PATH, "cache", "llm_responses")))
+LLM_CACHE_MODE = os.environ.get("LLM_CACHE_MODE", "OFF")
+LLM_CACHE_MAX_MB = int(os.environ.get("LLM_CACHE_MAX_MB", 256))
+LLM_MAX_ATTEMPTS = int(os.environ.get("LLM_MAX_ATTEMPTS", 2))
+PROFILE_STAGES = os.environ.get("PROFILE_STAGES", "").lower() in ["1", "true", "yes"]
+PROFILE_TRACES_PATH = Path(os.environ.get("PROFILE_TRACES_PATH", Path(DATA_PATH, "cache", "profiles")))
+PREDICTION_CHUNK_SIZE = int(os.environ.get("PREDICTION_CHUNK_SIZE", 200))
+PREDICTION_WORKER_MEMORY_BUDGET_MB = int(os.environ.get("PREDICTION_WORKER_MEMORY_BUDGET_MB", 4096))
+PREDICTION_WORKER_COALESCE_SECONDS = float(os.environ.get("PREDICTION_WORKER_COALESCE_SECONDS", 0.01))
+SUPERVISE_SUB_JOBS = os.environ.get("SUPERVISE_SUB_JOBS", "").lower() in ["1", "true", "yes"]
+SUB_JOB_MEMORY_LIMIT_MB = int(os.environ.get("SUB_JOB_MEMORY_LIMIT_MB", 0))
+SUB_JOB_POLL_SECONDS = float(os.environ.get("SUB_JOB_POLL_SECONDS", 1))
+PREPARED_DATA_CACHE_SIZE = int(os.environ.get("PREPARED_DATA_CACHE_SIZE", 4))
+TRAINING_MAX_ROUNDS = int(os.environ.get("TRAINING_MAX_ROUNDS", 100))
+SUCCESSIVE_HALVING = os.environ.get("SUCCESSIVE_HALVING", "").lower() in ["1", "true", "yes"]
+SUCCESSIVE_HALVING_FRACTIONS = [float(x) for x in os.environ.get("SUCCESSIVE_HALVING_FRACTIONS", "0.25,0.5,1").split(",")]
+SUCCESSIVE_HALVING_REDUCTION_FACTOR = int(os.environ.get("SUCCESSIVE_HALVING_REDUCTION_FACTOR", 3))
+SUCCESSIVE_HALVING_MARGIN = float(os.environ.get("SUCCESSIVE_HALVING_MARGIN", 10))
+SUCCESSIVE_HALVING_CHEAP_SECONDS = float(os.environ.get("SUCCESSIVE_HALVING_CHEAP_SECONDS", 60))
+SUCCESSIVE_HALVING_MIN_SAMPLES = int(os.environ.get("SUCCESSIVE_HALVING_MIN_SAMPLES", 10))
+METHOD_COST_PRIORS_PATH = Path(
+    os.environ.get("METHOD_COST_PRIORS_PATH", Path(DATA_PATH, "cache", "method_cost_priors.json"))
+)
+PERFORMANCE_HISTORY = os.environ.get("PERFORMANCE_HISTORY", "").lower() in ["1", "true", "yes"]
+PERFORMANCE_HISTORY_PATH = Path(os.environ.get("PERFORMANCE_HISTORY_PATH", Path(DATA_PATH, "cache", "performance_history")))
+PERFORMANCE_HISTORY_MIN_RUNS = int(os.environ.get("PERFORMANCE_HISTORY_MIN_RUNS", 2))
+PERFORMANCE_HISTORY_MARGIN = float(os.environ.get("PERFORMANCE_HISTORY_MARGIN", 15))
+SCHEDULER_MAX_QUEUED_JOBS = int(os.environ.get("SCHEDULER_MAX_QUEUED_JOBS", 1000))
+SCHEDULER_MAX_QUEUED_JOBS_PER_DOMAIN = int(os.environ.get("SCHEDULER_MAX_QUEUED_JOBS_PER_DOMAIN", 200))
+SCHEDULER_MAX_RUNNING_JOBS_PER_DOMAIN = int(os.environ.get("SCHEDULER_MAX_RUNNING_JOBS_PER_DOMAIN", 2))
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "true").lower() in ["1", "true", "yes"]
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", 100))
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", 1))
+PDF_DATA_WORKERS = int(os.environ.get("PDF_DATA_WORKERS", 1))
+ALIGNMENT_WORKERS = int(os.environ.get("ALIGNMENT_WORKERS", 1))
+ALIGNMENT_CACHE = os.environ.get("ALIGNMENT_CACHE", "").lower() in ["1", "true", "yes"]
+ALIGNMENT_CACHE_WINDOW = int(os.environ.get("ALIGNMENT_CACHE_WINDOW", 5))
+ALIGNMENT_CACHE_MAX_CHANGED_FRACTION = float(os.environ.get("ALIGNMENT_CACHE_MAX_CHANGED_FRACTION", 0.2))
 HUGGINGFACE_PATH = join(ROOT_PATH, "huggingface")
 
 IS_TRAINING_CANCELED_FILE_NAME = "is_training_canceled.txt"
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from pdf_features.PdfFeatures import PdfFeatures
+
+from trainable_entity_extractor.domain.PdfData import PdfData
+from trainable_entity_extractor.domain.PdfTokensStore import PdfTokensStore
+from trainable_entity_extractor.domain.TokensColumn import TokensColumn
+
+
+class CompactPdfData:
+    def __init__(self, pdf_data: PdfData):
+        self.values = {
+            key: value for key, value in pdf_data.__dict__.items() if key not in {"pdf_features", "pdf_data_segments"}
+        }
+        self.tokens_store: Optional[PdfTokensStore] = None
+        self.pdf_features: Optional[PdfFeatures] = None
+        if pdf_data.has_pdf_features():
+            self.tokens_store = PdfTokensStore.from_pdf_features(pdf_data.pdf_features)
+            self.pdf_features = None if self.tokens_store else pdf_data.pdf_features
+
+        self.segments_count = len(pdf_data.pdf_data_segments)
+        self.segments = TokensColumn(pdf_data.pdf_data_segments)
+
+    def to_pdf_data(self) -> PdfData:
+        pdf_features = self.tokens_store.to_pdf_features() if self.tokens_store else self.pdf_features
+        pdf_data_segments = self.segments.get_values(0, self.segments_count)
+        return PdfData.model_construct(pdf_features=pdf_features, pdf_data_segments=pdf_data_segments, **self.values)
@@ -0,0 +1,51 @@
+import math
+
+from pydantic import BaseModel
+
+from trainable_entity_extractor.domain.ExtractionDataSummary import ExtractionDataSummary
+
+
+class DataProfile(BaseModel):
+    extractor_name: str
+    languages: list[str] = list()
+    samples_bucket: int = 0
+    options_bucket: int = 0
+    multi_value: bool = False
+    has_pdf_data: bool = False
+    label_length_bucket: int = 0
+    source_length_bucket: int = 0
+
+    @staticmethod
+    def get_bucket(value: float) -> int:
+        return int(math.log2(value + 1))
+
+    @staticmethod
+    def from_summary(extractor_name: str, summary: ExtractionDataSummary, multi_value: bool) -> "DataProfile":
+        return DataProfile(
+            extractor_name=extractor_name,
+            languages=sorted({language.language_iso for language in summary.languages}),
+            samples_bucket=DataProfile.get_bucket(summary.total_samples),
+            options_bucket=DataProfile.get_bucket(summary.total_options),
+            multi_value=multi_value,
+            has_pdf_data=summary.has_pdf_data,
+            label_length_bucket=DataProfile.get_bucket(
+                summary.label_text_stats.median_length if summary.label_text_stats else 0
+            ),
+            source_length_bucket=DataProfile.get_bucket(
+                summary.source_text_stats.median_length if summary.source_text_stats else 0
+            ),
+        )
+
+    def get_key(self) -> str:
+        return "_".join(
+            [
+                self.extractor_name,
+                "-".join(self.languages) or "none",
+                f"s{self.samples_bucket}",
+                f"o{self.options_bucket}",
+                "multi" if self.multi_value else "single",
+                "pdf" if self.has_pdf_data else "text",
+                f"l{self.label_length_bucket}",
+                f"t{self.source_length_bucket}",
+            ]
+        )
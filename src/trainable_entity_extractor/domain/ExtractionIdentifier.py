@@ -10,6 +10,8 @@ from pydantic import BaseModel
 
 from trainable_entity_extractor.config import DATA_PATH
 
+TRAINING_FOLDER_NAME = ".training"
+
 
 class ExtractionIdentifier(BaseModel):
     run_name: str = "default"
@@ -23,6 +25,9 @@ class ExtractionIdentifier(BaseModel):
         extraction_identifier.extra_model_folder = folder
         return extraction_identifier
 
+    def get_training_identifier(self):
+        return self.model_copy(update={"output_path": Path(self.output_path, TRAINING_FOLDER_NAME)})
+
     def get_path(self):
         if self.extra_model_folder == "":
             return join(self.output_path, self.run_name, self.extraction_name)
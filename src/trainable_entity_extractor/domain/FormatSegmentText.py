@@ -1,15 +1,16 @@
 from html import escape
 from re import IGNORECASE, compile, Match
 from re import escape as re_escape
-from rapidfuzz import fuzz
 from typing import Optional, List, Tuple
-import re
+
+from trainable_entity_extractor.domain.FuzzySubstringLocator import FuzzySubstringLocator
 
 
 class FormatSegmentText:
     def __init__(self, texts: List[str], label: str = "") -> None:
         self.texts = texts
         self.label = (label or "").strip()
+        self.fuzzy_substring_locator = FuzzySubstringLocator(self.label)
 
     def get_text(self) -> str:
         if not self.texts or not any(self.texts):
@@ -119,32 +120,7 @@ class FormatSegmentText:
         return "".join(parts)
 
     def _find_fuzzy_match_in_text(self, text: str) -> Optional[Tuple[int, int, str]]:
-        best_match: Optional[Tuple[int, int, str]] = None
-        best_score = 0
-        label_len = len(self.label)
-        min_len = max(1, label_len - 2)
-        max_len = min(len(text), label_len + 5)  # Increased range for punctuation variations
-
-        word_pattern = re.compile(r"\b[\w\-_.]+\b")
-        words = [(m.start(), m.end(), m.group()) for m in word_pattern.finditer(text)]
-
-        for start, end, word in words:
-            if min_len <= len(word) <= max_len:
-                score = fuzz.ratio(self.label.lower(), word.lower())
-                if score >= 75 and score > best_score:
-                    best_score = score
-                    best_match = (start, end, word)
-
-        if not best_match:
-            for start in range(len(text)):
-                for length in range(min_len, min(max_len + 1, len(text) - start + 1)):
-                    substring = text[start : start + length]
-                    score = fuzz.ratio(self.label.lower(), substring.lower())
-                    if score >= 75 and score > best_score:
-                        best_score = score
-                        best_match = (start, start + length, substring)
-
-        return best_match
+        return self.fuzzy_substring_locator.locate(text)
 
     def _is_date_format(self) -> bool:
         return self._get_date_parts() is not None
@@ -0,0 +1,83 @@
+import re
+from typing import Optional, Tuple
+
+from rapidfuzz import fuzz
+
+
+class FuzzySubstringLocator:
+    MIN_SCORE = 75
+    MIN_ALIGNMENT_SCORE = 50
+    EXTRA_WINDOW_LENGTH = 5
+    ALIGNMENT_MARGIN = 5
+    BRUTE_FORCE_MAX_TEXT_LENGTH = 128
+    WORD_PATTERN = re.compile(r"\b[\w\-_.]+\b")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.label_lower = label.lower()
+        self.min_length = max(1, len(label) - 2)
+        self.located: dict[str, Optional[Tuple[int, int, str]]] = dict()
+
+    def locate(self, text: str) -> Optional[Tuple[int, int, str]]:
+        if text not in self.located:
+            self.located[text] = self._locate(text)
+
+        return self.located[text]
+
+    def _locate(self, text: str) -> Optional[Tuple[int, int, str]]:
+        max_length = min(len(text), len(self.label) + self.EXTRA_WINDOW_LENGTH)
+
+        word_match = self._get_word_match(text, max_length)
+        if word_match:
+            return word_match
+
+        text_lower = text.lower()
+        if len(text) <= self.BRUTE_FORCE_MAX_TEXT_LENGTH or len(text_lower) != len(text):
+            return self._get_best_window(text, text_lower, 0, len(text), max_length)
+
+        exact_start = text_lower.find(self.label_lower)
+        if exact_start != -1:
+            exact_end = exact_start + len(self.label_lower)
+            return exact_start, exact_end, text[exact_start:exact_end]
+
+        alignment = fuzz.partial_ratio_alignment(self.label_lower, text_lower, score_cutoff=self.MIN_ALIGNMENT_SCORE)
+        if not alignment:
+            return None
+
+        first_start = max(0, alignment.dest_start - self.ALIGNMENT_MARGIN)
+        last_start = min(len(text), alignment.dest_end + self.ALIGNMENT_MARGIN)
+        return self._get_best_window(text, text_lower, first_start, last_start, max_length)
+
+    def _get_word_match(self, text: str, max_length: int) -> Optional[Tuple[int, int, str]]:
+        best_match: Optional[Tuple[int, int, str]] = None
+        best_score = 0
+
+        for match in self.WORD_PATTERN.finditer(text):
+            word = match.group()
+            if self.min_length <= len(word) <= max_length:
+                score = fuzz.ratio(self.label_lower, word.lower())
+                if score >= self.MIN_SCORE and score > best_score:
+                    best_score = score
+                    best_match = (match.start(), match.end(), word)
+
+        return best_match
+
+    def _get_best_window(
+        self, text: str, text_lower: str, first_start: int, last_start: int, max_length: int
+    ) -> Optional[Tuple[int, int, str]]:
+        best_match: Optional[Tuple[int, int, str]] = None
+        best_score = 0
+        lowered_text = text_lower if len(text_lower) == len(text) else None
+
+        for start in range(first_start, last_start):
+            for length in range(self.min_length, min(max_length + 1, len(text) - start + 1)):
+                if lowered_text is None:
+                    window = text[start : start + length].lower()
+                else:
+                    window = lowered_text[start : start + length]
+                score = fuzz.ratio(self.label_lower, window)
+                if score >= self.MIN_SCORE and score > best_score:
+                    best_score = score
+                    best_match = (start, start + length, text[start : start + length])
+
+        return best_match
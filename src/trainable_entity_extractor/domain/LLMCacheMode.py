@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class LLMCacheMode(StrEnum):
+    OFF = "OFF"
+    READ_WRITE = "READ_WRITE"
+    REPLAY = "REPLAY"
@@ -5,3 +5,4 @@ class LogSeverity(str, Enum):
     error = "error"
     info = "info"
     warning = "warning"
+    debug = "debug"
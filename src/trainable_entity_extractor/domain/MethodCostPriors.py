@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+SMOOTHING = 0.5
+
+
+class MethodCostPriors(BaseModel):
+    seconds_by_method: dict[str, float] = dict()
+
+    def get_seconds(self, method_name: str) -> float | None:
+        return self.seconds_by_method.get(method_name)
+
+    def update(self, method_name: str, seconds: float):
+        previous_seconds = self.seconds_by_method.get(method_name)
+        if previous_seconds is None:
+            self.seconds_by_method[method_name] = seconds
+        else:
+            self.seconds_by_method[method_name] = SMOOTHING * seconds + (1 - SMOOTHING) * previous_seconds
+
+    @staticmethod
+    def load(path: Path) -> "MethodCostPriors":
+        try:
+            if path.exists():
+                return MethodCostPriors.model_validate_json(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"Error loading method cost priors {path}: {e}")
+
+        return MethodCostPriors()
+
+    def save(self, path: Path):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_suffix(".tmp")
+            temporary_path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+            temporary_path.replace(path)
+        except Exception as e:
+            print(f"Error saving method cost priors {path}: {e}")
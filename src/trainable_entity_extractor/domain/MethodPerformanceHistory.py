@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class MethodPerformanceHistory(BaseModel):
+    method_name: str
+    runs: int = 0
+    wins: int = 0
+    mean_performance: float = 0.0
+    last_performance: float = 0.0
+
+    def add_performance(self, performance: float, is_winner: bool):
+        self.runs += 1
+        self.wins += 1 if is_winner else 0
+        self.mean_performance += (performance - self.mean_performance) / self.runs
+        self.last_performance = performance
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ModelBundleManifest(BaseModel):
+    format_version: int = 1
+    version: int
+    bundle_name: str
+    sha256: str
+    size_bytes: int
+    created: float
+    method_name: str
+    files: list[str] = list()
+    extractor_job: dict = dict()
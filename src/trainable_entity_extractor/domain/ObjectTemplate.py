@@ -0,0 +1,39 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ObjectTemplate:
+    def __init__(self, example: Any):
+        self.object_class = type(example)
+        self.attribute_names = list(vars(example))
+        self.attribute_keys = set(self.attribute_names)
+        self.is_pydantic = isinstance(example, BaseModel)
+        self.fields_set = set(example.__pydantic_fields_set__) if self.is_pydantic else set()
+        self.private = self.get_private_defaults() if self.is_pydantic else None
+
+    def get_private_defaults(self) -> dict[str, Any] | None:
+        private_attributes = self.object_class.__private_attributes__
+        if not private_attributes:
+            return None
+
+        return {name: private_attribute.get_default() for name, private_attribute in private_attributes.items()}
+
+    def matches(self, value: Any) -> bool:
+        return type(value) is self.object_class and vars(value).keys() == self.attribute_keys
+
+    def create(self, values: dict[str, Any]) -> Any:
+        created_object = self.object_class.__new__(self.object_class)
+        if not self.is_pydantic:
+            created_object.__dict__.update(values)
+            return created_object
+
+        created_object.__setstate__(
+            {
+                "__dict__": values,
+                "__pydantic_fields_set__": set(self.fields_set),
+                "__pydantic_extra__": None,
+                "__pydantic_private__": dict(self.private) if self.private is not None else None,
+            }
+        )
+        return created_object
@@ -1,14 +1,15 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pdf_features.PdfToken import PdfToken
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.TokenType import TokenType
-from pydantic import BaseModel
+from pydantic import BaseModel, SerializerFunctionWrapHandler, model_serializer
 
 from trainable_entity_extractor.domain.SegmentationData import SegmentationData
 from pdf_features.PdfFeatures import PdfFeatures
 
 from trainable_entity_extractor.domain.PdfDataSegment import PdfDataSegment
+from trainable_entity_extractor.domain.PdfTokensStore import PdfTokensStore
 from trainable_entity_extractor.domain.XmlFile import XmlFile
 from trainable_entity_extractor.use_cases.FilterValidSegmentsPagesUseCase import FilterValidSegmentsPagesUseCase
 
@@ -19,11 +20,47 @@ class PdfData(BaseModel):
     file_type: str = ""
     pdf_data_segments: list[PdfDataSegment] = list()
     pdf_path: str = ""
+    _tokens_store: Optional[PdfTokensStore] = None
 
     def model_post_init(self, ctx):
         if not self.file_name and self.pdf_features:
             self.file_name = self.pdf_features.file_name
 
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        tokens_store = PdfTokensStore.from_pdf_features(self.__dict__.get("pdf_features"))
+        if tokens_store:
+            state["__dict__"] = {key: value for key, value in state["__dict__"].items() if key != "pdf_features"}
+            state["__pydantic_private__"] = {**(state["__pydantic_private__"] or {}), "_tokens_store": tokens_store}
+        return state
+
+    def __getattr__(self, item: str) -> Any:
+        if item == "pdf_features" and self.__pydantic_private__ and self._tokens_store:
+            self.load_tokens()
+            return self.__dict__["pdf_features"]
+
+        return super().__getattr__(item)
+
+    def load_tokens(self):
+        if not self.__pydantic_private__ or not self._tokens_store:
+            return
+
+        values = dict(self.__dict__)
+        self.__dict__.clear()
+        self.__dict__.update({"pdf_features": self._tokens_store.to_pdf_features(), **values})
+        self._tokens_store = None
+
+    @model_serializer(mode="wrap")
+    def serialize_with_tokens(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        self.load_tokens()
+        return handler(self)
+
+    def has_pdf_features(self) -> bool:
+        if "pdf_features" not in self.__dict__:
+            return bool(self.__pydantic_private__ and self._tokens_store)
+
+        return bool(self.__dict__["pdf_features"])
+
     def set_segments_from_segmentation_data(self, segmentation_data: SegmentationData):
         segments_tokens: dict[PdfDataSegment, list[PdfToken]] = dict()
         segmentation_regions: list[PdfDataSegment] = [
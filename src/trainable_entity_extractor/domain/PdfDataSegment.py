@@ -1,10 +1,13 @@
 from statistics import mode
+from typing import Any, Optional
 
 from pdf_features.Rectangle import Rectangle
 from pdf_token_type_labels.TokenType import TokenType
 from pdf_features.PdfToken import PdfToken
 from pydantic import BaseModel
 
+IDENTITY_FIELDS = {"page_number", "bounding_box", "text_content"}
+
 
 class PdfDataSegment(BaseModel):
     page_number: int
@@ -12,9 +15,55 @@ class PdfDataSegment(BaseModel):
     text_content: str
     ml_label: int = 0
     segment_type: TokenType = TokenType.TEXT
+    _identity_key: Optional[tuple] = None
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in IDENTITY_FIELDS:
+            self._identity_key = None
+
+    def get_identity_key(self) -> tuple:
+        if self.__pydantic_private__ and self._identity_key is not None:
+            return self._identity_key
+
+        bounding_box = self.bounding_box
+        self._identity_key = (
+            self.page_number,
+            self.text_content,
+            bounding_box.left,
+            bounding_box.top,
+            bounding_box.right,
+            bounding_box.bottom,
+        )
+        return self._identity_key
 
     def __hash__(self):
-        return hash((self.page_number, self.bounding_box, self.text_content))
+        return hash(self.get_identity_key())
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+
+        if type(self) is not type(other) or self.get_identity_key() != other.get_identity_key():
+            return False
+
+        return self.__dict__ == other.__dict__
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "PdfDataSegment":
+        pdf_segment = super().model_copy(update=update, deep=deep)
+        if update:
+            pdf_segment._identity_key = None
+        return pdf_segment
+
+    @staticmethod
+    def get_indexes(pdf_segments: list["PdfDataSegment"]) -> dict["PdfDataSegment", int]:
+        indexes: dict[PdfDataSegment, int] = dict()
+        for index, pdf_segment in enumerate(pdf_segments):
+            indexes.setdefault(pdf_segment, index)
+        return indexes
 
     @staticmethod
     def from_values(page_number: int, bounding_box: Rectangle, text_content: str, segment_type: TokenType = TokenType.TEXT):
@@ -0,0 +1,71 @@
+import copy
+from typing import Optional
+
+import numpy as np
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfToken import PdfToken
+
+from trainable_entity_extractor.domain.ObjectTemplate import ObjectTemplate
+from trainable_entity_extractor.domain.TokensColumn import TokensColumn
+
+
+class PdfTokensStore:
+    def __init__(self, pdf_features: PdfFeatures, tokens: list[PdfToken]):
+        self.token_template = ObjectTemplate(tokens[0])
+        self.pdf_features = self.get_features_without_tokens(pdf_features)
+        self.page_offsets = np.cumsum([0] + [len(page.tokens) for page in pdf_features.pages], dtype=np.int64)
+        self.columns = {
+            name: TokensColumn([token.__dict__[name] for token in tokens]) for name in self.token_template.attribute_names
+        }
+
+    @staticmethod
+    def from_pdf_features(pdf_features: Optional[PdfFeatures]) -> Optional["PdfTokensStore"]:
+        if not pdf_features or not pdf_features.pages:
+            return None
+
+        tokens = [token for page in pdf_features.pages for token in page.tokens]
+        if not tokens or not hasattr(tokens[0], "__dict__"):
+            return None
+
+        token_template = ObjectTemplate(tokens[0])
+        if not all(token_template.matches(token) for token in tokens):
+            return None
+
+        return PdfTokensStore(pdf_features, tokens)
+
+    @staticmethod
+    def get_features_without_tokens(pdf_features: PdfFeatures) -> PdfFeatures:
+        pages = list()
+        for page in pdf_features.pages:
+            page_without_tokens = copy.copy(page)
+            page_without_tokens.tokens = list()
+            pages.append(page_without_tokens)
+
+        pdf_features_without_tokens = copy.copy(pdf_features)
+        pdf_features_without_tokens.pages = pages
+        return pdf_features_without_tokens
+
+    def __len__(self) -> int:
+        return int(self.page_offsets[-1])
+
+    def get_tokens(self, start: int, end: int) -> list[PdfToken]:
+        names = self.token_template.attribute_names
+        columns_values = [self.columns[name].get_values(start, end) for name in names]
+        return [self.token_template.create(dict(zip(names, values))) for values in zip(*columns_values)]
+
+    def get_page_tokens(self, page_index: int) -> list[PdfToken]:
+        return self.get_tokens(int(self.page_offsets[page_index]), int(self.page_offsets[page_index + 1]))
+
+    def get_token(self, index: int) -> PdfToken:
+        return self.get_tokens(index, index + 1)[0]
+
+    def to_pdf_features(self) -> PdfFeatures:
+        pages = list()
+        for page_index, page in enumerate(self.pdf_features.pages):
+            page_with_tokens = copy.copy(page)
+            page_with_tokens.tokens = self.get_page_tokens(page_index)
+            pages.append(page_with_tokens)
+
+        pdf_features = copy.copy(self.pdf_features)
+        pdf_features.pages = pages
+        return pdf_features
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+from trainable_entity_extractor.domain.StageTiming import StageTiming
+
 
 class Performance(BaseModel):
     method_name: str = "Unknown Method"
@@ -7,6 +9,8 @@ class Performance(BaseModel):
     execution_seconds: int = 0
     is_perfect: bool = False
     failed: bool = False
+    timed_out: bool = False
     testing_samples_count: int = 0
     training_samples_count: int = 0
     samples_count: int = 0
+    stage_timings: list[StageTiming] = list()
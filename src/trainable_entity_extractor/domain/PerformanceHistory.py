@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+
+from trainable_entity_extractor.domain.MethodPerformanceHistory import MethodPerformanceHistory
+from trainable_entity_extractor.domain.Performance import Performance
+
+
+class PerformanceHistory(BaseModel):
+    profile_key: str
+    methods: dict[str, MethodPerformanceHistory] = dict()
+
+    def add_performances(self, performances: list[Performance], best_method_name: str):
+        for performance in performances:
+            method_history = self.methods.setdefault(
+                performance.method_name, MethodPerformanceHistory(method_name=performance.method_name)
+            )
+            score = 0.0 if performance.failed else performance.performance
+            method_history.add_performance(score, performance.method_name == best_method_name)
+
+    def get_hopeless_methods(self, min_runs: int, margin: float) -> set[str]:
+        winners = [method for method in self.methods.values() if method.wins]
+        if not winners:
+            return set()
+
+        leader_performance = max(method.mean_performance for method in winners)
+        return {
+            method.method_name
+            for method in self.methods.values()
+            if method.runs >= min_runs and not method.wins and method.mean_performance + margin < leader_performance
+        }
+
+    def get_priority(self, method_name: str) -> tuple[int, float]:
+        method_history = self.methods.get(method_name)
+        if not method_history:
+            return 1, 0.0
+
+        return (0 if method_history.wins else 2), -method_history.mean_performance
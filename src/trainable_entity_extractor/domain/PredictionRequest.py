@@ -0,0 +1,21 @@
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+
+
+@dataclass
+class PredictionRequest:
+    extractor_job: TrainableEntityExtractorJob
+    prediction_samples: list[PredictionSample]
+    future: Future = field(default_factory=Future)
+
+    def get_key(self) -> tuple[str, str, str, str, str]:
+        return (
+            str(self.extractor_job.output_path),
+            self.extractor_job.run_name,
+            self.extractor_job.extraction_name,
+            self.extractor_job.extractor_name,
+            self.extractor_job.method_name,
+        )
@@ -0,0 +1,60 @@
+import hashlib
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from trainable_entity_extractor.config import PREPARED_DATA_CACHE_SIZE
+from trainable_entity_extractor.domain.ExtractionData import ExtractionData
+
+
+class PreparedDataCache:
+    _prepared_data: OrderedDict[tuple, bytes] = OrderedDict()
+    _lock = Lock()
+
+    @staticmethod
+    def get_data_hash(extraction_data: ExtractionData) -> str:
+        data_hash = hashlib.sha1()
+        data_hash.update(str(extraction_data.multi_value).encode())
+        for option in extraction_data.options or []:
+            data_hash.update(f"{option.id}\x1f{option.label}\x1e".encode())
+
+        for sample in extraction_data.samples:
+            data_hash.update(sample.labeled_data.model_dump_json().encode() if sample.labeled_data else b"")
+            data_hash.update("\x1f".join(sample.segment_selector_texts or []).encode())
+            segments_count = len(sample.pdf_data.pdf_data_segments) if sample.pdf_data else -1
+            data_hash.update(f"\x1e{segments_count}\x1d".encode())
+
+        return data_hash.hexdigest()
+
+    @staticmethod
+    def get_key(extractor_name: str, extraction_data: ExtractionData) -> tuple[str, str, str]:
+        extraction_path = (
+            str(extraction_data.extraction_identifier.get_path()) if extraction_data.extraction_identifier else ""
+        )
+        return extractor_name, extraction_path, PreparedDataCache.get_data_hash(extraction_data)
+
+    @staticmethod
+    def get(key: tuple) -> Optional[tuple[ExtractionData, ExtractionData]]:
+        with PreparedDataCache._lock:
+            prepared_data = PreparedDataCache._prepared_data.get(key)
+            if not prepared_data:
+                return None
+
+            PreparedDataCache._prepared_data.move_to_end(key)
+
+        return pickle.loads(prepared_data)
+
+    @staticmethod
+    def put(key: tuple, train_set: ExtractionData, test_set: ExtractionData):
+        prepared_data = pickle.dumps((train_set, test_set), protocol=pickle.HIGHEST_PROTOCOL)
+        with PreparedDataCache._lock:
+            PreparedDataCache._prepared_data[key] = prepared_data
+            PreparedDataCache._prepared_data.move_to_end(key)
+            while len(PreparedDataCache._prepared_data) > PREPARED_DATA_CACHE_SIZE:
+                PreparedDataCache._prepared_data.popitem(last=False)
+
+    @staticmethod
+    def clear():
+        with PreparedDataCache._lock:
+            PreparedDataCache._prepared_data.clear()
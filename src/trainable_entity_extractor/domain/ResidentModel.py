@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ResidentModel:
+    model: Any
+    version: tuple[Any, ...]
+    size_bytes: int
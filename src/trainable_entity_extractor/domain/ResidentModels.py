@@ -0,0 +1,86 @@
+import os
+import threading
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional, TypeVar
+
+from trainable_entity_extractor.domain.ResidentModel import ResidentModel
+
+Model = TypeVar("Model")
+
+_active_resident_models: ContextVar[Optional["ResidentModels"]] = ContextVar("active_resident_models", default=None)
+
+
+class ResidentModels:
+    def __init__(self):
+        self.models: dict[str, ResidentModel] = dict()
+        self.lock = threading.Lock()
+        self._tokens: list[Token] = list()
+
+    def __enter__(self) -> "ResidentModels":
+        self._tokens.append(_active_resident_models.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._tokens:
+            _active_resident_models.reset(self._tokens.pop())
+
+    @staticmethod
+    def load(model_path: str, loader: Callable[[], Model]) -> Model:
+        resident_models = _active_resident_models.get()
+        if resident_models is None:
+            return loader()
+
+        return resident_models.get_model(model_path, loader)
+
+    def get_model(self, model_path: str, loader: Callable[[], Model]) -> Model:
+        real_path = os.path.realpath(model_path)
+        version = self.get_version(real_path)
+        with self.lock:
+            resident_model = self.models.get(real_path)
+            if resident_model and resident_model.version == version:
+                return resident_model.model
+
+            rss_before = self.get_rss_bytes()
+            model = loader()
+            size_bytes = max(0, self.get_rss_bytes() - rss_before) or self.get_disk_size(real_path)
+            self.models[real_path] = ResidentModel(model=model, version=version, size_bytes=size_bytes)
+            return model
+
+    def get_size_bytes(self) -> int:
+        with self.lock:
+            return sum(resident_model.size_bytes for resident_model in self.models.values())
+
+    def clear(self):
+        with self.lock:
+            self.models.clear()
+
+    @staticmethod
+    def get_version(path: str) -> tuple[Any, ...]:
+        try:
+            stat = os.stat(path)
+            return stat.st_ino, stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return tuple()
+
+    @staticmethod
+    def get_rss_bytes() -> int:
+        try:
+            with open(f"/proc/{os.getpid()}/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return 0
+
+    @staticmethod
+    def get_disk_size(path: str) -> int:
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+
+        size = 0
+        for folder, _, file_names in os.walk(path):
+            for file_name in file_names:
+                try:
+                    size += os.path.getsize(os.path.join(folder, file_name))
+                except OSError:
+                    continue
+
+        return size
@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Optional
+
+from trainable_entity_extractor.config import PROFILE_STAGES
+from trainable_entity_extractor.domain.StageTiming import StageTiming
+
+_active_profiler: ContextVar[Optional["StageProfiler"]] = ContextVar("active_stage_profiler", default=None)
+
+
+class StageProfiler:
+    def __init__(self, name: str = "", enabled: bool = PROFILE_STAGES):
+        self.name = name
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.stage_timings: list[StageTiming] = list()
+        self._tokens: list[Token] = list()
+
+    def __enter__(self) -> "StageProfiler":
+        if self.enabled:
+            self._tokens.append(_active_profiler.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._tokens:
+            _active_profiler.reset(self._tokens.pop())
+
+    @staticmethod
+    def get_active() -> Optional["StageProfiler"]:
+        return _active_profiler.get()
+
+    @staticmethod
+    def session(name: str = "", enabled: bool = PROFILE_STAGES) -> "StageProfiler":
+        active_profiler = StageProfiler.get_active()
+        return active_profiler if active_profiler else StageProfiler(name, enabled)
+
+    @staticmethod
+    @contextmanager
+    def stage(stage_name: str):
+        profiler = StageProfiler.get_active()
+        if not profiler:
+            yield
+            return
+
+        with profiler.measure(stage_name):
+            yield
+
+    @contextmanager
+    def measure(self, stage_name: str):
+        if not self.enabled:
+            yield
+            return
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        start_rss_mb = self.get_rss_mb()
+        try:
+            yield
+        finally:
+            self.stage_timings.append(
+                StageTiming(
+                    name=stage_name,
+                    start_seconds=start_wall - self.start_time,
+                    wall_seconds=time.perf_counter() - start_wall,
+                    cpu_seconds=time.process_time() - start_cpu,
+                    rss_delta_mb=self.get_rss_mb() - start_rss_mb,
+                    process_peak_rss_mb=self.get_process_peak_rss_mb(),
+                )
+            )
+
+    @staticmethod
+    def get_rss_mb() -> float:
+        try:
+            with open(f"/proc/{os.getpid()}/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+        except (OSError, ValueError, IndexError):
+            return 0.0
+
+    @staticmethod
+    def get_process_peak_rss_mb() -> float:
+        try:
+            import resource
+        except ImportError:
+            return 0.0
+
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_rss / 1024**2 if sys.platform == "darwin" else peak_rss / 1024
+
+    def get_stage_timings(self) -> list[StageTiming]:
+        return sorted(self.stage_timings, key=lambda stage_timing: stage_timing.start_seconds)
+
+    def to_log(self) -> str:
+        text = f"Stage timings {self.name}\n"
+        for stage_timing in self.get_stage_timings():
+            text += f"{stage_timing.to_log()}\n"
+        return text
+
+    def to_chrome_trace(self) -> dict:
+        process_id = os.getpid()
+        thread_id = threading.get_ident()
+        trace_events = [
+            {
+                "name": stage_timing.name,
+                "cat": self.name,
+                "ph": "X",
+                "ts": round(stage_timing.start_seconds * 1_000_000),
+                "dur": round(stage_timing.wall_seconds * 1_000_000),
+                "pid": process_id,
+                "tid": thread_id,
+                "args": {
+                    "cpu_seconds": stage_timing.cpu_seconds,
+                    "rss_delta_mb": stage_timing.rss_delta_mb,
+                    "process_peak_rss_mb": stage_timing.process_peak_rss_mb,
+                },
+            }
+            for stage_timing in self.get_stage_timings()
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class StageTiming(BaseModel):
+    name: str
+    start_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rss_delta_mb: float = 0.0
+    process_peak_rss_mb: float = 0.0
+
+    def to_log(self) -> str:
+        return (
+            f"{self.name} - wall {self.wall_seconds:.2f}s / cpu {self.cpu_seconds:.2f}s"
+            f" / RSS change {self.rss_delta_mb:+.0f}MB / process peak RSS {self.process_peak_rss_mb:.0f}MB"
+        )
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class SupervisionOutcome(StrEnum):
+    FINISHED = "FINISHED"
+    TIMED_OUT = "TIMED_OUT"
+    MEMORY_EXCEEDED = "MEMORY_EXCEEDED"
+    CANCELED = "CANCELED"
+    CRASHED = "CRASHED"
@@ -0,0 +1,109 @@
+from typing import Any
+
+import numpy as np
+
+from trainable_entity_extractor.domain.ObjectTemplate import ObjectTemplate
+
+VALUE_INTERNED_TYPES = {int, float, str, bool, type(None)}
+
+
+class TokensColumn:
+    def __init__(self, values: list[Any]):
+        self.kind = "interned"
+        self.ints: np.ndarray | None = None
+        self.floats: np.ndarray | None = None
+        self.is_int: np.ndarray | None = None
+        self.arena = ""
+        self.offsets: np.ndarray | None = None
+        self.template: ObjectTemplate | None = None
+        self.columns: dict[str, "TokensColumn"] = dict()
+        self.table: list[Any] = list()
+        self.indexes: np.ndarray | None = None
+
+        types = {type(value) for value in values}
+        if types and types.issubset({int, float}) and self.set_numbers(values, types):
+            return
+
+        if types == {str}:
+            self.set_strings(values)
+            return
+
+        if self.is_unique_objects(values):
+            self.set_objects(values)
+            return
+
+        self.set_interned(values)
+
+    def set_numbers(self, values: list[Any], types: set[type]) -> bool:
+        try:
+            if types == {float}:
+                self.kind = "float"
+                self.floats = np.array(values, dtype=np.float64)
+            elif types == {int}:
+                self.kind = "int"
+                self.ints = np.array(values, dtype=np.int64)
+            else:
+                self.kind = "number"
+                self.is_int = np.array([type(value) is int for value in values], dtype=np.bool_)
+                self.ints = np.array([value if type(value) is int else 0 for value in values], dtype=np.int64)
+                self.floats = np.array([value if type(value) is float else 0 for value in values], dtype=np.float64)
+        except OverflowError:
+            return False
+
+        return True
+
+    def set_strings(self, values: list[str]):
+        self.kind = "str"
+        self.arena = "".join(values)
+        self.offsets = np.cumsum([0] + [len(value) for value in values], dtype=np.int64)
+
+    @staticmethod
+    def is_unique_objects(values: list[Any]) -> bool:
+        if len(values) < 2 or not hasattr(values[0], "__dict__") or isinstance(values[0], type):
+            return False
+
+        template = ObjectTemplate(values[0])
+        if not all(template.matches(value) for value in values):
+            return False
+
+        return len({id(value) for value in values}) == len(values)
+
+    def set_objects(self, values: list[Any]):
+        self.kind = "object"
+        self.template = ObjectTemplate(values[0])
+        for name in self.template.attribute_names:
+            self.columns[name] = TokensColumn([value.__dict__[name] for value in values])
+
+    def set_interned(self, values: list[Any]):
+        self.kind = "interned"
+        table_indexes: dict[tuple, int] = dict()
+        self.indexes = np.empty(len(values), dtype=np.int32)
+        for position, value in enumerate(values):
+            key = (type(value), value) if type(value) in VALUE_INTERNED_TYPES else (type(value), id(value))
+            if key not in table_indexes:
+                table_indexes[key] = len(self.table)
+                self.table.append(value)
+            self.indexes[position] = table_indexes[key]
+
+    def get_values(self, start: int, end: int) -> list[Any]:
+        if self.kind == "int":
+            return self.ints[start:end].tolist()
+
+        if self.kind == "float":
+            return self.floats[start:end].tolist()
+
+        if self.kind == "number":
+            ints = self.ints[start:end].tolist()
+            floats = self.floats[start:end].tolist()
+            return [x if is_int else y for x, y, is_int in zip(ints, floats, self.is_int[start:end].tolist())]
+
+        if self.kind == "str":
+            offsets = self.offsets[start : end + 1].tolist()
+            return [self.arena[offsets[i] : offsets[i + 1]] for i in range(end - start)]
+
+        if self.kind == "object":
+            names = self.template.attribute_names
+            columns_values = [self.columns[name].get_values(start, end) for name in names]
+            return [self.template.create(dict(zip(names, values))) for values in zip(*columns_values)]
+
+        return [self.table[index] for index in self.indexes[start:end].tolist()]
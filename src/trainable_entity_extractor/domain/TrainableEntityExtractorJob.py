@@ -12,6 +12,8 @@ class TrainableEntityExtractorJob(BaseModel):
     options: list[Option] = []
     gpu_needed: bool
     timeout: int
+    sample_fraction: float = 1.0
+    data_profile_key: str = ""
     output_path: str = ""
     metadata: dict[str, str] = dict()
     languages: list[str] = []
@@ -21,9 +21,13 @@ from trainable_entity_extractor.domain.PredictionSample import PredictionSample
 from trainable_entity_extractor.domain.Suggestion import Suggestion
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.adapters.LocalJobExecutor import LocalJobExecutor
-from trainable_entity_extractor.adapters.LocalModelStorage import LocalModelStorage
+from trainable_entity_extractor.adapters.BundleModelStorage import BundleModelStorage
 from trainable_entity_extractor.adapters.LocalExtractionDataRetriever import LocalExtractionDataRetriever
+from trainable_entity_extractor.adapters.LocalPerformanceHistoryStore import LocalPerformanceHistoryStore
+from trainable_entity_extractor.adapters.SupervisedJobExecutor import SupervisedJobExecutor
+from trainable_entity_extractor.config import PERFORMANCE_HISTORY, SUPERVISE_SUB_JOBS, TRAINING_MAX_ROUNDS
 from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.PredictionWorker import PredictionWorker
 from trainable_entity_extractor.use_cases.OrchestratorUseCase import OrchestratorUseCase
 from trainable_entity_extractor.use_cases.TrainUseCase import TrainUseCase
 
@@ -36,14 +40,17 @@ class TrainableEntityExtractor:
         TextToTextExtractor,
     ]
 
-    def __init__(self, extraction_identifier: ExtractionIdentifier):
+    def __init__(self, extraction_identifier: ExtractionIdentifier, prediction_worker: PredictionWorker = None):
         self.extraction_identifier = extraction_identifier
+        self.prediction_worker = prediction_worker
         self.multi_value: bool = False
         self.options: list = list()
         self.data_retriever = LocalExtractionDataRetriever()
-        self.model_storage = LocalModelStorage()
+        self.model_storage = BundleModelStorage(extractors=self.EXTRACTORS)
         self.logger = ExtractorLogger()
-        self.job_executor = LocalJobExecutor(self.EXTRACTORS, self.data_retriever, self.model_storage, self.logger)
+        job_executor_class = SupervisedJobExecutor if SUPERVISE_SUB_JOBS else LocalJobExecutor
+        self.job_executor = job_executor_class(self.EXTRACTORS, self.data_retriever, self.model_storage, self.logger)
+        self.performance_history = LocalPerformanceHistoryStore() if PERFORMANCE_HISTORY else None
 
     def train(self, extraction_data: ExtractionData) -> tuple[bool, str]:
         if not self._is_training_valid(extraction_data):
@@ -63,6 +70,9 @@ class TrainableEntityExtractor:
         if not self._is_prediction_valid(prediction_samples):
             return []
 
+        if self.prediction_worker:
+            return self._predict_with_worker(prediction_samples)
+
         self.data_retriever.save_prediction_data(self.extraction_identifier, prediction_samples)
         extractor_job = self._get_extractor_job()
         if not extractor_job:
@@ -71,6 +81,20 @@ class TrainableEntityExtractor:
         self._execute_prediction(extractor_job)
         return self.data_retriever.get_suggestions(self.extraction_identifier)
 
+    def _predict_with_worker(self, prediction_samples: list[PredictionSample]) -> list[Suggestion]:
+        extractor_job = self._get_extractor_job()
+        if not extractor_job or not self.model_storage.download_model(self.extraction_identifier):
+            return []
+
+        try:
+            suggestions = self.prediction_worker.predict(extractor_job, prediction_samples)
+        except Exception as e:
+            self._handle_prediction_exception(e)
+            return []
+
+        self._log_prediction_success(suggestions, extractor_job.method_name)
+        return suggestions
+
     @staticmethod
     def _sanitize_languages(extraction_data: ExtractionData) -> None:
         valid_codes = {loc.shortname for loc in default_loader.get_locales()}
@@ -99,7 +123,7 @@ class TrainableEntityExtractor:
         return True
 
     def _get_training_jobs(self, extraction_data: ExtractionData) -> list:
-        trainer = TrainUseCase(extractors=self.EXTRACTORS, logger=self.logger)
+        trainer = TrainUseCase(extractors=self.EXTRACTORS, logger=self.logger, performance_history=self.performance_history)
         jobs = trainer.get_jobs(extraction_data)
 
         if not jobs:
@@ -118,7 +142,9 @@ class TrainableEntityExtractor:
 
     def _execute_training_workflow(self, jobs: list) -> tuple[bool, str]:
         distributed_jobs = self._create_distributed_training_jobs(jobs)
-        training_orchestrator = OrchestratorUseCase(self.job_executor, self.logger, distributed_jobs)
+        training_orchestrator = OrchestratorUseCase(
+            self.job_executor, self.logger, distributed_jobs, performance_history=self.performance_history
+        )
 
         self.logger.log(self.extraction_identifier, f"Training with {len(jobs)} available methods")
 
@@ -131,12 +157,20 @@ class TrainableEntityExtractor:
     @staticmethod
     def _process_training_jobs(training_orchestrator: OrchestratorUseCase, distributed_jobs: list) -> tuple[bool, str]:
         result = training_orchestrator.process_job(distributed_jobs[0])
-        if distributed_jobs:
+        rounds = 1
+        while distributed_jobs and not result.finished:
+            if rounds >= TRAINING_MAX_ROUNDS:
+                return False, f"Training did not finish after {rounds} rounds"
+
             result = training_orchestrator.process_job(distributed_jobs[0])
+            rounds += 1
 
         return result.success, result.error_message
 
     def _finalize_training(self, success: bool, message: str) -> tuple[bool, str]:
+        if self.prediction_worker:
+            self.prediction_worker.evict(self.extraction_identifier)
+
         if success:
             self.logger.log(self.extraction_identifier, f"Training completed successfully: {message}")
         else:
@@ -147,7 +181,7 @@ class TrainableEntityExtractor:
     def _handle_training_exception(self, exception: Exception) -> tuple[bool, str]:
         error_message = f"Training failed with exception: {str(exception)}"
         self.logger.log(self.extraction_identifier, error_message, LogSeverity.error)
-        shutil.rmtree(self.extraction_identifier.get_path(), ignore_errors=True)
+        shutil.rmtree(self.extraction_identifier.get_training_identifier().get_path(), ignore_errors=True)
         return False, error_message
 
     @staticmethod
@@ -0,0 +1,136 @@
+import random
+from xml.sax.saxutils import escape
+
+from pdf_token_type_labels.TokenType import TokenType
+
+from trainable_entity_extractor.domain.LabeledData import LabeledData
+from trainable_entity_extractor.domain.PredictionData import PredictionData
+from trainable_entity_extractor.domain.SegmentBox import SegmentBox
+from trainable_entity_extractor.domain.SegmentationData import SegmentationData
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 40
+TOKEN_WIDTH = 40
+TOKEN_HEIGHT = 10
+TOKEN_SEPARATION = 4
+LINE_SEPARATION = 4
+LINES_PER_PARAGRAPH = 4
+LABEL_PREVIOUS_WORD = "resolution"
+LABEL_WORD = "adopted"
+WORDS = [
+    "the",
+    "general",
+    "assembly",
+    "council",
+    "report",
+    "committee",
+    "rights",
+    "human",
+    "session",
+    "agenda",
+    "item",
+    "member",
+    "states",
+    "article",
+    "paragraph",
+    "decision",
+    "meeting",
+    "annex",
+    "document",
+    "secretary",
+]
+
+
+class SyntheticDocument:
+    def __init__(self, pages_count: int, tokens_per_page: int, seed: int = 42):
+        self.pages_count = pages_count
+        self.tokens_per_page = tokens_per_page
+        self.random = random.Random(seed)
+        self.tokens_per_line = max(1, (PAGE_WIDTH - 2 * MARGIN) // (TOKEN_WIDTH + TOKEN_SEPARATION))
+        self.max_lines = (PAGE_HEIGHT - 2 * MARGIN) // (TOKEN_HEIGHT + LINE_SEPARATION)
+        self.xml_segments_boxes: list[SegmentBox] = list()
+        self.label_segments_boxes: list[SegmentBox] = list()
+        self.xml_content = self.create_xml_content()
+
+    def get_token_text(self, paragraph_index: int, page_number: int) -> str:
+        if page_number == 1 and paragraph_index == 0:
+            return LABEL_PREVIOUS_WORD
+
+        if page_number == 1 and paragraph_index == 1:
+            return LABEL_WORD
+
+        return self.random.choice(WORDS)
+
+    def create_page_xml(self, page_number: int) -> str:
+        lines_count = min(self.max_lines, -(-self.tokens_per_page // self.tokens_per_line))
+        texts_xml = list()
+        tokens_count = 0
+        for paragraph_index, first_line in enumerate(range(0, lines_count, LINES_PER_PARAGRAPH)):
+            paragraph_lines = range(first_line, min(first_line + LINES_PER_PARAGRAPH, lines_count))
+            for line in paragraph_lines:
+                top = MARGIN + line * (TOKEN_HEIGHT + LINE_SEPARATION)
+                for token_index in range(self.tokens_per_line):
+                    if tokens_count == self.tokens_per_page:
+                        break
+                    left = MARGIN + token_index * (TOKEN_WIDTH + TOKEN_SEPARATION)
+                    text = escape(self.get_token_text(paragraph_index, page_number))
+                    texts_xml.append(
+                        f'<text top="{top}" left="{left}" width="{TOKEN_WIDTH}" height="{TOKEN_HEIGHT}" font="0">{text}</text>'
+                    )
+                    tokens_count += 1
+
+            self.add_paragraph_box(page_number, paragraph_index, paragraph_lines)
+
+        page_xml = f'<page number="{page_number}" position="absolute" top="0" left="0" height="{PAGE_HEIGHT}" width="{PAGE_WIDTH}">\n'
+        page_xml += '\t<fontspec id="0" size="10" family="TimesNewRomanPSMT" color="#000000"/>\n'
+        return page_xml + "\n".join(texts_xml) + "\n</page>\n"
+
+    def add_paragraph_box(self, page_number: int, paragraph_index: int, paragraph_lines: range):
+        segment_box = SegmentBox(
+            left=MARGIN,
+            top=MARGIN + paragraph_lines.start * (TOKEN_HEIGHT + LINE_SEPARATION),
+            width=self.tokens_per_line * (TOKEN_WIDTH + TOKEN_SEPARATION),
+            height=len(paragraph_lines) * (TOKEN_HEIGHT + LINE_SEPARATION),
+            page_number=page_number,
+            page_width=PAGE_WIDTH,
+            page_height=PAGE_HEIGHT,
+            segment_type=TokenType.TITLE if paragraph_index == 0 else TokenType.TEXT,
+        )
+        self.xml_segments_boxes.append(segment_box)
+
+        if page_number == 1 and paragraph_index == 1:
+            self.label_segments_boxes.append(segment_box)
+
+    def create_xml_content(self) -> str:
+        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
+        xml_content += '<!DOCTYPE pdf2xml SYSTEM "pdf2xml.dtd">\n\n'
+        xml_content += '<pdf2xml producer="poppler" version="23.07.0">\n'
+        for page_number in range(1, self.pages_count + 1):
+            xml_content += self.create_page_xml(page_number)
+        return xml_content + "</pdf2xml>\n"
+
+    def get_segmentation_data(self) -> SegmentationData:
+        return SegmentationData(
+            page_width=PAGE_WIDTH,
+            page_height=PAGE_HEIGHT,
+            xml_segments_boxes=self.xml_segments_boxes,
+            label_segments_boxes=self.label_segments_boxes,
+        )
+
+    def get_labeled_data(self, xml_file_name: str) -> LabeledData:
+        return LabeledData(
+            xml_file_name=xml_file_name,
+            page_width=PAGE_WIDTH,
+            page_height=PAGE_HEIGHT,
+            xml_segments_boxes=self.xml_segments_boxes,
+            label_segments_boxes=self.label_segments_boxes,
+        )
+
+    def get_prediction_data(self, xml_file_name: str) -> PredictionData:
+        return PredictionData(
+            xml_file_name=xml_file_name,
+            page_width=PAGE_WIDTH,
+            page_height=PAGE_HEIGHT,
+            xml_segments_boxes=self.xml_segments_boxes,
+        )
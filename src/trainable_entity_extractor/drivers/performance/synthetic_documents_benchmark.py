@@ -0,0 +1,168 @@
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import time
+from datetime import datetime
+from os.path import join
+from pathlib import Path
+
+from pdf_features.PdfFeatures import PdfFeatures
+
+from trainable_entity_extractor.config import ROOT_PATH
+from trainable_entity_extractor.adapters.extractors.pdf_to_text_extractor.methods.PdfToTextSegmentSelector import (
+    PdfToTextSegmentSelector,
+)
+from trainable_entity_extractor.adapters.extractors.segment_selector.FastSegmentSelector import FastSegmentSelector
+from trainable_entity_extractor.adapters.extractors.segment_selector.SegmentSelector import SegmentSelector
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.PdfData import PdfData
+from trainable_entity_extractor.domain.XmlFile import XmlFile
+from trainable_entity_extractor.drivers.performance.SyntheticDocument import SyntheticDocument
+from trainable_entity_extractor.use_cases.FilterValidSegmentsPagesUseCase import FilterValidSegmentsPagesUseCase
+from trainable_entity_extractor.use_cases.PdfDataBulkLoaderUseCase import PdfDataBulkLoaderUseCase
+
+PAGES_COUNTS = [10, 100, 300]
+TOKENS_PER_PAGE = 300
+DOCUMENTS_COUNT = 2
+RESULTS_PATH = Path(ROOT_PATH, "performance_results", "synthetic_documents")
+
+
+class SyntheticDocumentsBenchmark:
+    def __init__(self, pages_count: int, tokens_per_page: int, documents_count: int):
+        self.pages_count = pages_count
+        self.tokens_per_page = tokens_per_page
+        self.documents_count = documents_count
+        self.extraction_identifier = ExtractionIdentifier(
+            run_name="benchmark", extraction_name=f"synthetic_{pages_count}_pages_{tokens_per_page}_tokens"
+        )
+        self.documents = [SyntheticDocument(pages_count, tokens_per_page, seed=i) for i in range(documents_count)]
+        self.xml_files: list[XmlFile] = list()
+        self.timings: dict[str, float] = dict()
+
+    def measure(self, name: str, function):
+        start = time.perf_counter()
+        result = function()
+        self.timings[name] = round(time.perf_counter() - start, 4)
+        print(f"{self.pages_count} pages, {self.tokens_per_page} tokens per page: {name} {self.timings[name]}s")
+        return result
+
+    def save_xml_files(self):
+        shutil.rmtree(self.extraction_identifier.get_path(), ignore_errors=True)
+        for index, document in enumerate(self.documents):
+            xml_file = XmlFile(self.extraction_identifier, to_train=True, xml_file_name=f"synthetic_{index}.xml")
+            xml_file.save(document.xml_content.encode("utf-8"))
+            self.xml_files.append(xml_file)
+
+    def get_pdfs_data(self) -> list[PdfData]:
+        return [
+            PdfData.from_xml_file(xml_file, document.get_segmentation_data())
+            for xml_file, document in zip(self.xml_files, self.documents)
+        ]
+
+    def get_pdfs_data_in_bulk(self) -> list[PdfData]:
+        segmentations_data = [document.get_segmentation_data() for document in self.documents]
+        return PdfDataBulkLoaderUseCase(workers=self.documents_count).load(self.xml_files, segmentations_data)
+
+    def parse_xml_files(self) -> list[PdfFeatures]:
+        return [
+            PdfFeatures.from_poppler_etree_content(xml_file.xml_file_path, document.xml_content)
+            for xml_file, document in zip(self.xml_files, self.documents)
+        ]
+
+    def set_segments(self, pdfs_features: list[PdfFeatures]) -> list[PdfData]:
+        pdfs_data = list()
+        for pdf_features, document in zip(pdfs_features, self.documents):
+            pdf_data = PdfData(pdf_features=pdf_features)
+            pdf_data.set_segments_from_segmentation_data(document.get_segmentation_data())
+            pdfs_data.append(pdf_data)
+        return pdfs_data
+
+    def filter_pages(self):
+        labeled_data_list = [
+            document.get_labeled_data(x.xml_file_name) for x, document in zip(self.xml_files, self.documents)
+        ]
+        prediction_data_list = [
+            document.get_prediction_data(x.xml_file_name) for x, document in zip(self.xml_files, self.documents)
+        ]
+        filter_valid_segments_pages = FilterValidSegmentsPagesUseCase(self.extraction_identifier)
+        pages_to_keep = filter_valid_segments_pages.for_training(labeled_data_list)
+        filter_valid_segments_pages.for_prediction(prediction_data_list)
+        for document, pages in zip(self.documents, pages_to_keep):
+            FilterValidSegmentsPagesUseCase.filter_xml_pages(document.xml_content, pages)
+
+    def fast_segment_selector(self, pdfs_data: list[PdfData]):
+        segments = [segment for pdf_data in pdfs_data for segment in pdf_data.pdf_data_segments]
+        fast_segment_selector = FastSegmentSelector(self.extraction_identifier)
+        fast_segment_selector.prepare_model_folder()
+        fast_segment_selector.create_model(segments)
+        fast_segment_selector.predict(segments)
+
+    def segment_selector(self, pdfs_data: list[PdfData]):
+        segment_selector = SegmentSelector(self.extraction_identifier)
+        segment_selector.prepare_model_folder()
+        segment_selector.create_model(pdfs_data)
+        segment_selector.set_extraction_segments(pdfs_data)
+
+    @staticmethod
+    def get_predicted_texts(pdfs_data: list[PdfData]):
+        for pdf_data in pdfs_data:
+            PdfToTextSegmentSelector.get_predicted_texts(pdf_data)
+
+    def run(self) -> dict:
+        self.measure("generate_documents", self.save_xml_files)
+        pdfs_features = self.measure("parse_xml", self.parse_xml_files)
+        self.measure("set_segments_from_segmentation_data", lambda: self.set_segments(pdfs_features))
+        pdfs_data = self.measure("pdf_data_from_xml_file", self.get_pdfs_data)
+        self.measure("pdf_data_bulk_loader", self.get_pdfs_data_in_bulk)
+        self.measure("filter_valid_segments_pages", self.filter_pages)
+        self.measure("fast_segment_selector", lambda: self.fast_segment_selector(pdfs_data))
+        self.measure("segment_selector", lambda: self.segment_selector(pdfs_data))
+        self.measure("get_predicted_texts", lambda: self.get_predicted_texts(pdfs_data))
+        shutil.rmtree(self.extraction_identifier.get_path(), ignore_errors=True)
+
+        return {
+            "pages_count": self.pages_count,
+            "tokens_per_page": self.tokens_per_page,
+            "documents_count": self.documents_count,
+            "segments_count": sum([len(pdf_data.pdf_data_segments) for pdf_data in pdfs_data]),
+            "seconds": self.timings,
+        }
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_PATH, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def run_synthetic_documents_benchmark(pages_counts: list[int], tokens_per_page: int, documents_count: int) -> Path:
+    results = [
+        SyntheticDocumentsBenchmark(pages_count, tokens_per_page, documents_count).run() for pages_count in pages_counts
+    ]
+    commit = get_commit()
+    report = {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    RESULTS_PATH.mkdir(parents=True, exist_ok=True)
+    results_path = Path(join(RESULTS_PATH, f"{datetime.now():%Y_%m_%d_%H_%M}_{commit}.json"))
+    results_path.write_text(json.dumps(report, indent=4))
+    print(f"Results saved in {results_path}")
+    return results_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time PdfData and segment selectors on synthetic documents")
+    parser.add_argument("--pages", type=int, nargs="+", default=PAGES_COUNTS)
+    parser.add_argument("--tokens-per-page", type=int, default=TOKENS_PER_PAGE)
+    parser.add_argument("--documents", type=int, default=DOCUMENTS_COUNT)
+    arguments = parser.parse_args()
+    run_synthetic_documents_benchmark(arguments.pages, arguments.tokens_per_page, arguments.documents)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.PredictionSample import PredictionSample
@@ -25,6 +26,13 @@ class ExtractionDataRetriever(ABC):
     def get_prediction_data(self, extraction_identifier: ExtractionIdentifier) -> list[PredictionSample]:
         pass
 
+    def iterate_prediction_data(
+        self, extraction_identifier: ExtractionIdentifier, chunk_size: int
+    ) -> Iterator[list[PredictionSample]]:
+        prediction_samples = iter(self.get_prediction_data(extraction_identifier))
+        while chunk := list(islice(prediction_samples, chunk_size)):
+            yield chunk
+
     @abstractmethod
     def get_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
         pass
@@ -33,6 +41,25 @@ class ExtractionDataRetriever(ABC):
     def save_suggestions(self, extraction_identifier: ExtractionIdentifier, suggestions: list[Suggestion]) -> bool:
         pass
 
+    def get_pending_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
+        if not hasattr(self, "_pending_suggestions"):
+            self._pending_suggestions: dict[str, list[Suggestion]] = dict()
+
+        return self._pending_suggestions.setdefault(extraction_identifier.get_path(), list())
+
+    def append_suggestions(self, extraction_identifier: ExtractionIdentifier, suggestions: list[Suggestion]) -> bool:
+        self.get_pending_suggestions(extraction_identifier).extend(suggestions)
+        return True
+
+    def commit_suggestions(self, extraction_identifier: ExtractionIdentifier) -> bool:
+        success = self.save_suggestions(extraction_identifier, self.get_pending_suggestions(extraction_identifier))
+        self.discard_suggestions(extraction_identifier)
+        return success
+
+    def discard_suggestions(self, extraction_identifier: ExtractionIdentifier) -> bool:
+        self.get_pending_suggestions(extraction_identifier).clear()
+        return True
+
     @abstractmethod
     def is_extractor_cancelled(self, extractor_identifier: ExtractionIdentifier):
         pass
@@ -1,7 +1,10 @@
 from abc import abstractmethod
 import time
+from trainable_entity_extractor.config import SUCCESSIVE_HALVING_MIN_SAMPLES
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.PreparedDataCache import PreparedDataCache
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
@@ -9,16 +12,19 @@ from trainable_entity_extractor.domain.Suggestion import Suggestion
 from trainable_entity_extractor.domain.TrainingSample import TrainingSample
 from trainable_entity_extractor.domain.LogSeverity import LogSeverity
 from trainable_entity_extractor.ports.MethodBase import MethodBase
+from trainable_entity_extractor.ports.MethodRegistry import MethodRegistry
 from trainable_entity_extractor.ports.Logger import Logger
 
 
 class ExtractorBase:
 
     METHODS: list[type[MethodBase]] = list()
+    METHOD_REGISTRIES: dict[type, MethodRegistry] = dict()
 
     def __init__(self, extraction_identifier: ExtractionIdentifier, logger: Logger):
         self.extraction_identifier = extraction_identifier
         self.logger = logger
+        self.resident_methods: dict[str, MethodBase] | None = None
 
     def get_name(self):
         return self.__class__.__name__
@@ -27,17 +33,32 @@ class ExtractorBase:
     def get_suggestions(self, method_name: str, prediction_samples: PredictionSamplesData) -> list[Suggestion]:
         pass
 
+    @classmethod
+    def get_method_registry(cls) -> MethodRegistry:
+        method_registry = ExtractorBase.METHOD_REGISTRIES.get(cls)
+        if not method_registry or not method_registry.is_built_from(cls.METHODS):
+            method_registry = MethodRegistry(cls.METHODS)
+            ExtractorBase.METHOD_REGISTRIES[cls] = method_registry
+
+        return method_registry
+
+    def keep_methods_resident(self) -> "ExtractorBase":
+        self.resident_methods = dict()
+        return self
+
     def get_method_instance_by_name(self, method_name: str) -> MethodBase:
-        for method in self.METHODS:
-            if isinstance(method, type):
-                method_instance = method(self.extraction_identifier)
-            else:
-                method_instance = method.set_extraction_identifier(self.extraction_identifier)
+        if self.resident_methods and method_name in self.resident_methods:
+            return self.resident_methods[method_name]
+
+        method_registry = self.get_method_registry()
+        method_instance = method_registry.create(method_name, self.extraction_identifier)
+        if not method_instance:
+            raise ValueError(f"Method {method_name} not found in {self.get_name()}")
 
-            if method_instance.get_name() == method_name:
-                return method_instance
+        if self.resident_methods is not None and method_registry.creates_new_instances(method_name):
+            self.resident_methods[method_name] = method_instance
 
-        raise ValueError(f"Method {method_name} not found in {self.get_name()}")
+        return method_instance
 
     @abstractmethod
     def can_be_used(self, extraction_data: ExtractionData) -> bool:
@@ -47,6 +68,30 @@ class ExtractorBase:
     def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
         pass
 
+    def reset_model_folders(self):
+        pass
+
+    def get_prepared_train_test_sets(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+        key = PreparedDataCache.get_key(self.get_name(), extraction_data)
+        prepared_data = PreparedDataCache.get(key)
+        if prepared_data:
+            self.reset_model_folders()
+            return prepared_data
+
+        train_set, test_set = self.prepare_for_training(extraction_data)
+        PreparedDataCache.put(key, train_set, test_set)
+        return train_set, test_set
+
+    @staticmethod
+    def get_training_subsample(train_set: ExtractionData, sample_fraction: float) -> ExtractionData:
+        samples_count = max(SUCCESSIVE_HALVING_MIN_SAMPLES, int(len(train_set.samples) * sample_fraction))
+        if sample_fraction >= 1 or samples_count >= len(train_set.samples):
+            return train_set
+
+        step = len(train_set.samples) / samples_count
+        samples = [train_set.samples[int(i * step)] for i in range(samples_count)]
+        return ExtractorBase.get_extraction_data_from_samples(train_set, samples)
+
     @staticmethod
     def is_multilingual(multi_option_data: ExtractionData) -> bool:
         not_multilingual_languages = ["", "en", "eng"]
@@ -86,28 +131,21 @@ class ExtractorBase:
 
     def get_distributed_jobs(self, extraction_data: ExtractionData) -> list[TrainableEntityExtractorJob]:
         jobs = list()
-        for method in self.METHODS:
-            if isinstance(method, type):
-                method_instance = method(self.extraction_identifier)
-            else:
-                method_instance = method.set_extraction_identifier(self.extraction_identifier)
-
-            if hasattr(method_instance, "can_be_used"):
+        method_registry = self.get_method_registry()
+        for method_name in method_registry.get_names():
+            method_instance = None
+            if method_registry.has_applicability_check(method_name):
+                method_instance = method_registry.create(method_name, self.extraction_identifier)
                 if not method_instance.can_be_used(extraction_data):
                     continue
 
-            if hasattr(method_instance, "gpu_needed"):
-                gpu_needed = method_instance.gpu_needed()
-            else:
-                gpu_needed = True
-
             job = TrainableEntityExtractorJob(
                 run_name=extraction_data.extraction_identifier.run_name,
                 extraction_name=extraction_data.extraction_identifier.extraction_name,
                 extractor_name=self.get_name(),
-                method_name=method_instance.get_name(),
-                gpu_needed=gpu_needed,
-                timeout=getattr(method_instance, "timeout", 3600),
+                method_name=method_name,
+                gpu_needed=method_registry.is_gpu_needed(method_name, self.extraction_identifier, method_instance),
+                timeout=method_registry.get_timeout(method_name),
                 options=extraction_data.options if extraction_data.options else [],
                 multi_value=extraction_data.multi_value if extraction_data.multi_value else False,
                 metadata=(
@@ -126,10 +164,19 @@ class ExtractorBase:
         return jobs
 
     def get_performance(self, extractor_job: TrainableEntityExtractorJob, extraction_data: ExtractionData) -> Performance:
+        profiler = StageProfiler.session(f"{extraction_data.extraction_identifier} / {extractor_job.method_name}")
+        with profiler:
+            performance = self._get_performance(extractor_job, extraction_data)
+
+        performance.stage_timings = profiler.get_stage_timings()
+        return performance
+
+    def _get_performance(self, extractor_job: TrainableEntityExtractorJob, extraction_data: ExtractionData) -> Performance:
         method_name = extractor_job.method_name
         start_time = time.time()
 
-        method_instance = self.get_method_instance_by_name(method_name)
+        with StageProfiler.stage("get_method_instance"):
+            method_instance = self.get_method_instance_by_name(method_name)
         if not method_instance:
             self.logger.log(extraction_data.extraction_identifier, f"Method {method_name} not found")
             return Performance(method_name=method_name, failed=True)
@@ -144,8 +191,11 @@ class ExtractorBase:
         self.logger.log(extraction_data.extraction_identifier, f"\nChecking {method_name}")
 
         try:
-            train_set, test_set = self.prepare_for_training(extraction_data)
-            performance_score = method_instance.get_performance(train_set, test_set)
+            with StageProfiler.stage("prepare_for_training"):
+                train_set, test_set = self.get_prepared_train_test_sets(extraction_data)
+                train_set = self.get_training_subsample(train_set, extractor_job.sample_fraction)
+            with StageProfiler.stage("method_performance"):
+                performance_score = method_instance.get_performance(train_set, test_set)
             performance_score = float(performance_score) if performance_score is not None else 0.0
 
             execution_time = int(time.time() - start_time)
@@ -181,8 +231,10 @@ class ExtractorBase:
                 return False, f"Method {method_name} cannot be used with current data"
 
         try:
-            self.prepare_for_training(extraction_data)
-            method_instance.train(extraction_data)
+            with StageProfiler.stage("prepare_for_training"):
+                self.prepare_for_training(extraction_data)
+            with StageProfiler.stage("train"):
+                method_instance.train(extraction_data)
             return True, ""
 
         except Exception as e:
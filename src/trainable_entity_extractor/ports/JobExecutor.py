@@ -1,4 +1,5 @@
 import shutil
+from pathlib import Path
 from abc import ABC, abstractmethod
 
 from trainable_entity_extractor.config import CACHE_PATH
@@ -55,8 +56,9 @@ class JobExecutor(ABC):
 
     @staticmethod
     def recreate_model_folder(extraction_identifier: ExtractionIdentifier) -> None:
-        shutil.rmtree(extraction_identifier.get_path(), ignore_errors=True)
-        extraction_identifier.get_path().mkdir(parents=True, exist_ok=True)
+        path = Path(extraction_identifier.get_training_identifier().get_path())
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True, exist_ok=True)
 
     def is_extractor_cancelled(self, extractor_identifier: ExtractionIdentifier) -> bool:
         try:
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.ports.MethodBase import MethodBase
+
+DEFAULT_TIMEOUT = 3600
+
+
+class MethodRegistry:
+    def __init__(self, methods: list[type[MethodBase] | MethodBase]):
+        self.methods = methods
+        self.methods_count = len(methods)
+        self.methods_by_name: dict[str, type[MethodBase] | MethodBase] = dict()
+        self.gpu_needed_by_name: dict[str, bool] = dict()
+
+        for method in methods:
+            self.methods_by_name.setdefault(self.get_method_name(method), method)
+
+    def is_built_from(self, methods: list[type[MethodBase] | MethodBase]) -> bool:
+        return self.methods is methods and self.methods_count == len(methods)
+
+    @staticmethod
+    def get_method_name(method: type[MethodBase] | MethodBase) -> str:
+        if not isinstance(method, type):
+            return method.get_name()
+
+        try:
+            return method.__new__(method).get_name()
+        except (AttributeError, TypeError):
+            return method.__name__
+
+    @staticmethod
+    def get_method_class(method: type[MethodBase] | MethodBase) -> type:
+        return method if isinstance(method, type) else type(method)
+
+    def get_names(self) -> list[str]:
+        return list(self.methods_by_name.keys())
+
+    def create(self, method_name: str, extraction_identifier: ExtractionIdentifier) -> Optional[MethodBase]:
+        method = self.methods_by_name.get(method_name)
+        if method is None:
+            return None
+
+        if isinstance(method, type):
+            return method(extraction_identifier)
+
+        return method.set_extraction_identifier(extraction_identifier)
+
+    def creates_new_instances(self, method_name: str) -> bool:
+        return isinstance(self.methods_by_name.get(method_name), type)
+
+    def has_applicability_check(self, method_name: str) -> bool:
+        can_be_used = getattr(self.get_method_class(self.methods_by_name[method_name]), "can_be_used", None)
+        return can_be_used is not None and can_be_used is not MethodBase.can_be_used
+
+    def get_timeout(self, method_name: str) -> int:
+        return getattr(self.methods_by_name[method_name], "timeout", DEFAULT_TIMEOUT)
+
+    def is_gpu_needed(
+        self, method_name: str, extraction_identifier: ExtractionIdentifier, method_instance: MethodBase = None
+    ) -> bool:
+        if method_name in self.gpu_needed_by_name:
+            return self.gpu_needed_by_name[method_name]
+
+        gpu_needed = getattr(self.get_method_class(self.methods_by_name[method_name]), "gpu_needed", None)
+
+        if gpu_needed is None:
+            self.gpu_needed_by_name[method_name] = True
+        elif gpu_needed is MethodBase.gpu_needed:
+            self.gpu_needed_by_name[method_name] = False
+        else:
+            method_instance = method_instance or self.create(method_name, extraction_identifier)
+            self.gpu_needed_by_name[method_name] = method_instance.gpu_needed()
+
+        return self.gpu_needed_by_name[method_name]
@@ -1,6 +1,9 @@
 import json
 import os
+import shutil
+import time
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional
 
 from trainable_entity_extractor.config import EXTRACTOR_JOB_PATH
@@ -8,6 +11,9 @@ from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIde
 from trainable_entity_extractor.domain.Option import Option
 from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
 
+INSTALLED_VERSIONS_SUFFIX = ".versions"
+INSTALLED_VERSIONS_TO_KEEP = 2
+
 
 class ModelStorage(ABC):
 
@@ -23,6 +29,47 @@ class ModelStorage(ABC):
     def get_extractor_job(self, extraction_identifier: ExtractionIdentifier) -> Optional[TrainableEntityExtractorJob]:
         pass
 
+    def install_model(self, training_identifier: ExtractionIdentifier, extraction_identifier: ExtractionIdentifier) -> bool:
+        model_path = Path(extraction_identifier.get_path())
+        versions_path = self.get_installed_versions_path(model_path)
+        version_path = Path(versions_path, f"{time.time_ns():020d}")
+        try:
+            versions_path.mkdir(parents=True, exist_ok=True)
+            os.replace(training_identifier.get_path(), version_path)
+            self.point_to_version(model_path, version_path)
+            self.prune_installed_versions(versions_path, version_path)
+            return True
+        except Exception as e:
+            print(f"Error installing model: {e}")
+            return False
+
+    @staticmethod
+    def get_installed_versions_path(model_path: Path) -> Path:
+        return Path(f"{model_path}{INSTALLED_VERSIONS_SUFFIX}")
+
+    @staticmethod
+    def point_to_version(model_path: Path, version_path: Path):
+        temporary_link = Path(f"{model_path}.link.{os.getpid()}")
+        temporary_link.unlink(missing_ok=True)
+        os.symlink(os.path.relpath(version_path, model_path.parent), temporary_link, target_is_directory=True)
+
+        if model_path.is_dir() and not model_path.is_symlink():
+            # A folder left by a previous installation cannot be swapped in one step, only the symlink that replaces it can
+            old_model_path = Path(f"{model_path}.old.{os.getpid()}")
+            os.replace(model_path, old_model_path)
+            os.replace(temporary_link, model_path)
+            shutil.rmtree(old_model_path, ignore_errors=True)
+            return
+
+        os.replace(temporary_link, model_path)
+
+    @staticmethod
+    def prune_installed_versions(versions_path: Path, version_path: Path):
+        version_paths = sorted([x for x in versions_path.iterdir() if not x.name.startswith(".")])
+        for old_version_path in version_paths[:-INSTALLED_VERSIONS_TO_KEEP]:
+            if old_version_path != version_path:
+                shutil.rmtree(old_version_path, ignore_errors=True)
+
     def save_extractor_job(
         self, extraction_identifier: ExtractionIdentifier, extractor_job: TrainableEntityExtractorJob
     ) -> bool:
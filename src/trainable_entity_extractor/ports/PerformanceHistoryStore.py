@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+from trainable_entity_extractor.config import PERFORMANCE_HISTORY_MARGIN, PERFORMANCE_HISTORY_MIN_RUNS
+from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.PerformanceHistory import PerformanceHistory
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+
+
+class PerformanceHistoryStore(ABC):
+    def __init__(self, min_runs: int = PERFORMANCE_HISTORY_MIN_RUNS, margin: float = PERFORMANCE_HISTORY_MARGIN):
+        self.min_runs = min_runs
+        self.margin = margin
+
+    @abstractmethod
+    def get_history(self, profile_key: str) -> PerformanceHistory:
+        pass
+
+    @abstractmethod
+    def save_history(self, performance_history: PerformanceHistory) -> bool:
+        pass
+
+    def add_performances(self, profile_key: str, performances: list[Performance], best_method_name: str) -> bool:
+        if not profile_key or not performances:
+            return False
+
+        performance_history = self.get_history(profile_key)
+        performance_history.add_performances(performances, best_method_name)
+        return self.save_history(performance_history)
+
+    def prune_jobs(self, jobs: list[TrainableEntityExtractorJob]) -> list[TrainableEntityExtractorJob]:
+        if not jobs or not jobs[0].data_profile_key:
+            return jobs
+
+        performance_history = self.get_history(jobs[0].data_profile_key)
+        hopeless_methods = performance_history.get_hopeless_methods(self.min_runs, self.margin)
+        kept_jobs = [job for job in jobs if job.method_name not in hopeless_methods] or jobs
+        return sorted(kept_jobs, key=lambda job: performance_history.get_priority(job.method_name))
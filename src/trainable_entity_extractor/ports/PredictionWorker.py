@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.Suggestion import Suggestion
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+
+
+class PredictionWorker(ABC):
+    @abstractmethod
+    def predict(
+        self, extractor_job: TrainableEntityExtractorJob, prediction_samples: list[PredictionSample]
+    ) -> list[Suggestion]:
+        pass
+
+    @abstractmethod
+    def evict(self, extraction_identifier: ExtractionIdentifier) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
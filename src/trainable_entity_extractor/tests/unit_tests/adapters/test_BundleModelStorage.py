@@ -0,0 +1,128 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.BundleModelStorage import BundleModelStorage, MANIFEST_FILE_NAME
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.MethodBase import MethodBase
+
+
+class RegexMethod(MethodBase):
+    pass
+
+
+class OtherMethod(MethodBase):
+    pass
+
+
+class RegexExtractor(ExtractorBase):
+    METHODS = [RegexMethod, OtherMethod]
+
+
+class TestBundleModelStorage(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        output_path = Path(self.temporary_directory.name, "models")
+        self.extraction_identifier = ExtractionIdentifier(
+            run_name="bundle", extraction_name="extraction", output_path=output_path
+        )
+        self.model_storage = BundleModelStorage(Path(self.temporary_directory.name, "bundles"), [RegexExtractor])
+        self.extractor_job = TrainableEntityExtractorJob(
+            run_name="bundle",
+            extraction_name="extraction",
+            extractor_name="RegexExtractor",
+            method_name="RegexMethod",
+            gpu_needed=False,
+            timeout=3600,
+        )
+        self.model_path = Path(self.extraction_identifier.get_path())
+        Path(self.model_path, "RegexMethod").mkdir(parents=True)
+        Path(self.model_path, "RegexMethod", "regex.json").write_text('["[0-9]+"]')
+        Path(self.model_path, "RegexMethod", "checkpoint-500").mkdir()
+        Path(self.model_path, "RegexMethod", "checkpoint-500", "optimizer.pt").write_text("transient")
+        Path(self.model_path, "OtherMethod").mkdir()
+        Path(self.model_path, "OtherMethod", "model.txt").write_text("losing method")
+        Path(self.model_path, "options.json").write_text("[]")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_upload_prunes_transient_artifacts(self):
+        self.assertTrue(self.model_storage.upload_model(self.extraction_identifier, self.extractor_job))
+        bundles_path = self.model_storage.get_bundles_path(self.extraction_identifier)
+
+        manifest = self.model_storage.get_manifest(self.extraction_identifier)
+        self.assertEqual(1, manifest.version)
+        self.assertIn("RegexMethod/regex.json", manifest.files)
+        self.assertIn("options.json", manifest.files)
+        self.assertFalse([x for x in manifest.files if "checkpoint-" in x])
+        self.assertFalse([x for x in manifest.files if x.startswith("OtherMethod/")])
+        self.assertEqual({MANIFEST_FILE_NAME, "000001.tar.gz"}, {x.name for x in bundles_path.iterdir()})
+        self.assertEqual("RegexMethod", self.model_storage.get_extractor_job(self.extraction_identifier).method_name)
+
+    def test_download_restores_model_folder(self):
+        self.model_storage.upload_model(self.extraction_identifier, self.extractor_job)
+        Path(self.model_path, "RegexMethod", "regex.json").write_text("half written")
+
+        self.assertTrue(self.model_storage.download_model(self.extraction_identifier))
+
+        self.assertTrue(self.model_path.is_symlink())
+        self.assertEqual('["[0-9]+"]', Path(self.model_path, "RegexMethod", "regex.json").read_text())
+        self.assertFalse(Path(self.model_path, "RegexMethod", "checkpoint-500").exists())
+        self.assertFalse(Path(self.model_path, "OtherMethod").exists())
+        versions_path = BundleModelStorage.get_installed_versions_path(self.model_path)
+        self.assertEqual({self.model_path.name, versions_path.name}, {x.name for x in self.model_path.parent.iterdir()})
+
+    def test_download_swaps_versions_atomically(self):
+        self.model_storage.upload_model(self.extraction_identifier, self.extractor_job)
+        self.model_storage.download_model(self.extraction_identifier)
+        first_version_path = self.model_path.resolve()
+
+        training_path = Path(self.temporary_directory.name, "training")
+        training_identifier = self.extraction_identifier.model_copy(update={"output_path": training_path})
+        Path(training_identifier.get_path(), "RegexMethod").mkdir(parents=True)
+        Path(training_identifier.get_path(), "RegexMethod", "regex.json").write_text('["[a-z]+"]')
+        self.model_storage.upload_model(training_identifier, self.extractor_job)
+
+        self.assertTrue(self.model_storage.download_model(self.extraction_identifier))
+
+        self.assertTrue(self.model_path.is_symlink())
+        self.assertNotEqual(first_version_path, self.model_path.resolve())
+        self.assertEqual('["[a-z]+"]', Path(self.model_path, "RegexMethod", "regex.json").read_text())
+        self.assertEqual('["[0-9]+"]', Path(first_version_path, "RegexMethod", "regex.json").read_text())
+        self.assertTrue(self.model_storage.download_model(self.extraction_identifier))
+
+    def test_install_swaps_trained_model_in_after_upload(self):
+        self.model_storage.upload_model(self.extraction_identifier, self.extractor_job)
+        self.model_storage.download_model(self.extraction_identifier)
+        training_identifier = self.extraction_identifier.get_training_identifier()
+        Path(training_identifier.get_path(), "RegexMethod").mkdir(parents=True)
+        Path(training_identifier.get_path(), "RegexMethod", "regex.json").write_text('["[a-z]+"]')
+
+        self.assertEqual('["[0-9]+"]', Path(self.model_path, "RegexMethod", "regex.json").read_text())
+        self.assertTrue(self.model_storage.upload_model(training_identifier, self.extractor_job))
+        self.assertEqual('["[0-9]+"]', Path(self.model_path, "RegexMethod", "regex.json").read_text())
+        self.assertTrue(self.model_storage.install_model(training_identifier, self.extraction_identifier))
+
+        self.assertTrue(self.model_path.is_symlink())
+        self.assertEqual('["[a-z]+"]', Path(self.model_path, "RegexMethod", "regex.json").read_text())
+        self.assertFalse(Path(training_identifier.get_path()).exists())
+
+    def test_corrupted_bundle_is_not_installed(self):
+        self.model_storage.upload_model(self.extraction_identifier, self.extractor_job)
+        manifest = self.model_storage.get_manifest(self.extraction_identifier)
+        bundle_path = Path(self.model_storage.get_bundles_path(self.extraction_identifier), manifest.bundle_name)
+        bundle_path.write_bytes(b"corrupted")
+
+        self.assertFalse(self.model_storage.download_model(self.extraction_identifier))
+        self.assertTrue(Path(self.model_path, "RegexMethod", "regex.json").exists())
+
+    def test_old_versions_are_pruned(self):
+        for _ in range(4):
+            self.model_storage.upload_model(self.extraction_identifier, self.extractor_job)
+
+        bundles_path = self.model_storage.get_bundles_path(self.extraction_identifier)
+        self.assertEqual(4, self.model_storage.get_manifest(self.extraction_identifier).version)
+        self.assertEqual(["000003.tar.gz", "000004.tar.gz"], sorted([x.name for x in bundles_path.glob("*.tar.gz")]))
@@ -0,0 +1,69 @@
+import logging
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.ExtractorLogger import ExtractorLogger
+from trainable_entity_extractor.adapters.SubJobSupervisor import SubJobSupervisor
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.SupervisionOutcome import SupervisionOutcome
+
+extraction_identifier = ExtractionIdentifier(run_name="logger_run", extraction_name="logger_extraction")
+
+
+def log_lines(log_path: str, lines_count: int) -> int:
+    config_logger.addHandler(logging.FileHandler(log_path))
+    logger = ExtractorLogger(asynchronous=True)
+    for i in range(lines_count):
+        logger.log(extraction_identifier, f"line {i}")
+    return lines_count
+
+
+class TestExtractorLogger(TestCase):
+    def test_async_log(self):
+        logger = ExtractorLogger(asynchronous=True)
+
+        with self.assertLogs(config_logger, level="INFO") as logs:
+            logger.log(extraction_identifier, "first message")
+            logger.log(extraction_identifier, "second message")
+            logger.flush()
+
+        self.assertEqual(2, len(logs.output))
+        self.assertIn("first message", logs.output[0])
+        self.assertIn("logger_extraction", logs.output[1])
+
+    def test_error_with_exception(self):
+        logger = ExtractorLogger(asynchronous=True)
+
+        with self.assertLogs(config_logger, level="ERROR") as logs:
+            try:
+                raise ValueError("wrong value")
+            except ValueError as e:
+                logger.log(extraction_identifier, "failed", LogSeverity.error, e)
+            logger.flush()
+
+        self.assertIn("Exception type: ValueError", logs.output[0])
+        self.assertIn("wrong value", logs.output[0])
+
+    def test_debug_sampling(self):
+        logger = ExtractorLogger(asynchronous=False, debug_sample_rate=0.25)
+
+        with self.assertLogs(config_logger, level="DEBUG") as logs:
+            for i in range(8):
+                logger.log(extraction_identifier, f"debug {i}", LogSeverity.debug)
+            logger.log(extraction_identifier, "info")
+
+        self.assertEqual(["debug 3", "debug 7", "info"], [x.getMessage().split(" for ")[0] for x in logs.records])
+
+    def test_supervised_sub_job_logs_are_written(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            log_path = Path(temporary_directory, "sub_job.log")
+
+            outcome, lines_count = SubJobSupervisor(poll_seconds=0.05).run(
+                log_lines, (str(log_path), 2000), timeout=60, is_cancelled=lambda: False
+            )
+
+            self.assertEqual(SupervisionOutcome.FINISHED, outcome)
+            self.assertEqual(lines_count, len(log_path.read_text().splitlines()))
@@ -0,0 +1,63 @@
+import shutil
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.LocalExtractionDataRetriever import LocalExtractionDataRetriever
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.Suggestion import Suggestion
+
+extraction_identifier = ExtractionIdentifier(run_name="test_data_retriever", extraction_name="streaming")
+
+
+class TestLocalExtractionDataRetriever(TestCase):
+    def setUp(self):
+        self.data_retriever = LocalExtractionDataRetriever()
+        shutil.rmtree(self.data_retriever._get_cache_path(extraction_identifier), ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_retriever._get_cache_path(extraction_identifier), ignore_errors=True)
+
+    def test_iterate_prediction_data_in_chunks(self):
+        prediction_samples = [PredictionSample.from_text(f"text {i}") for i in range(5)]
+        self.data_retriever.save_prediction_data(extraction_identifier, prediction_samples)
+
+        chunks = list(self.data_retriever.iterate_prediction_data(extraction_identifier, 2))
+
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+        self.assertEqual("text 4", chunks[-1][0].source_text)
+        self.assertEqual(5, len(self.data_retriever.get_prediction_data(extraction_identifier)))
+
+    def test_iterate_prediction_data_raises_on_truncated_file(self):
+        prediction_samples = [PredictionSample.from_text(f"text {i}") for i in range(5)]
+        self.data_retriever.save_prediction_data(extraction_identifier, prediction_samples)
+        pickle_file = self.data_retriever._get_cache_path(extraction_identifier) / "prediction_data.pickle"
+        pickle_file.write_bytes(pickle_file.read_bytes()[:-10])
+
+        with self.assertRaises(Exception):
+            list(self.data_retriever.iterate_prediction_data(extraction_identifier, 2))
+
+    def test_append_suggestions(self):
+        self.data_retriever.save_suggestions(extraction_identifier, [Suggestion.get_empty(extraction_identifier, "old")])
+
+        self.data_retriever.append_suggestions(extraction_identifier, [Suggestion.get_empty(extraction_identifier, "a")])
+        self.data_retriever.append_suggestions(extraction_identifier, [Suggestion.get_empty(extraction_identifier, "b")])
+
+        suggestions = self.data_retriever.get_suggestions(extraction_identifier)
+        self.assertEqual(["old"], [suggestion.entity_name for suggestion in suggestions])
+
+        self.assertTrue(self.data_retriever.commit_suggestions(extraction_identifier))
+
+        suggestions = self.data_retriever.get_suggestions(extraction_identifier)
+        self.assertEqual(["a", "b"], [suggestion.entity_name for suggestion in suggestions])
+
+    def test_discard_suggestions(self):
+        self.data_retriever.save_suggestions(extraction_identifier, [Suggestion.get_empty(extraction_identifier, "old")])
+        self.data_retriever.append_suggestions(extraction_identifier, [Suggestion.get_empty(extraction_identifier, "a")])
+
+        self.data_retriever.discard_suggestions(extraction_identifier)
+
+        suggestions = self.data_retriever.get_suggestions(extraction_identifier)
+        self.assertEqual(["old"], [suggestion.entity_name for suggestion in suggestions])
+        cache_path = self.data_retriever._get_cache_path(extraction_identifier)
+        self.assertEqual(["suggestions_data.pickle"], [path.name for path in cache_path.iterdir()])
+        self.assertFalse(self.data_retriever.commit_suggestions(extraction_identifier))
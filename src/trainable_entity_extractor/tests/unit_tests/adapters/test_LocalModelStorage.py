@@ -0,0 +1,48 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.LocalModelStorage import LocalModelStorage
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+
+
+class TestLocalModelStorage(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.extraction_identifier = ExtractionIdentifier(
+            run_name="local", extraction_name="extraction", output_path=Path(self.temporary_directory.name)
+        )
+        self.training_identifier = self.extraction_identifier.get_training_identifier()
+        self.model_storage = LocalModelStorage()
+        self.extractor_job = TrainableEntityExtractorJob(
+            run_name="local",
+            extraction_name="extraction",
+            extractor_name="RegexExtractor",
+            method_name="RegexMethod",
+            gpu_needed=False,
+            timeout=3600,
+        )
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def train(self, regex: str):
+        Path(self.training_identifier.get_path(), "RegexMethod").mkdir(parents=True)
+        Path(self.training_identifier.get_path(), "RegexMethod", "regex.json").write_text(regex)
+        self.model_storage.upload_model(self.training_identifier, self.extractor_job)
+
+    def test_install_swaps_trained_model_in(self):
+        model_path = Path(self.extraction_identifier.get_path())
+        self.train('["[0-9]+"]')
+        self.assertFalse(model_path.exists())
+
+        self.assertTrue(self.model_storage.install_model(self.training_identifier, self.extraction_identifier))
+        self.train('["[a-z]+"]')
+        self.assertEqual('["[0-9]+"]', Path(model_path, "RegexMethod", "regex.json").read_text())
+        self.assertTrue(self.model_storage.install_model(self.training_identifier, self.extraction_identifier))
+
+        self.assertTrue(model_path.is_symlink())
+        self.assertEqual('["[a-z]+"]', Path(model_path, "RegexMethod", "regex.json").read_text())
+        self.assertEqual("RegexMethod", self.model_storage.get_extractor_job(self.extraction_identifier).method_name)
+        self.assertFalse(Path(self.training_identifier.get_path()).exists())
@@ -0,0 +1,67 @@
+import tempfile
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.LocalPerformanceHistoryStore import LocalPerformanceHistoryStore
+from trainable_entity_extractor.domain.DataProfile import DataProfile
+from trainable_entity_extractor.domain.ExtractionDataSummary import ExtractionDataSummary, LanguageDistribution
+from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+
+profile_key = "TextToTextExtractor_en_s5_o0_single_text_l3_t6"
+
+
+def get_job(method_name: str) -> TrainableEntityExtractorJob:
+    return TrainableEntityExtractorJob(
+        run_name="history",
+        extraction_name="extraction",
+        extractor_name="TextToTextExtractor",
+        method_name=method_name,
+        gpu_needed=False,
+        timeout=3600,
+        data_profile_key=profile_key,
+    )
+
+
+class TestLocalPerformanceHistoryStore(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.history_store = LocalPerformanceHistoryStore(self.temporary_directory.name, min_runs=2, margin=15)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def add_run(self):
+        performances = [
+            Performance(method_name="Regex", performance=90),
+            Performance(method_name="T5", performance=85),
+            Performance(method_name="DateParser", performance=20),
+        ]
+        self.history_store.add_performances(profile_key, performances, "Regex")
+
+    def test_methods_are_kept_until_enough_runs(self):
+        self.add_run()
+
+        jobs = self.history_store.prune_jobs([get_job("DateParser"), get_job("T5"), get_job("Regex")])
+
+        self.assertEqual(["Regex", "T5", "DateParser"], [job.method_name for job in jobs])
+
+    def test_hopeless_methods_are_skipped(self):
+        self.add_run()
+        self.add_run()
+
+        jobs = self.history_store.prune_jobs([get_job("New"), get_job("DateParser"), get_job("T5"), get_job("Regex")])
+
+        self.assertEqual(["Regex", "New", "T5"], [job.method_name for job in jobs])
+        self.assertEqual(2, self.history_store.get_history(profile_key).methods["Regex"].wins)
+
+    def test_data_profile_key(self):
+        summary = ExtractionDataSummary(
+            total_samples=40,
+            total_options=0,
+            has_pdf_data=False,
+            languages=[LanguageDistribution(language_iso="en", count=40, percentage=100)],
+        )
+
+        data_profile = DataProfile.from_summary("TextToTextExtractor", summary, multi_value=False)
+
+        self.assertEqual("TextToTextExtractor_en_s5_o0_single_text_l0_t0", data_profile.get_key())
@@ -0,0 +1,148 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.LocalPredictionWorker import LocalPredictionWorker
+from trainable_entity_extractor.domain.ExtractionData import ExtractionData
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.PredictionRequest import PredictionRequest
+from trainable_entity_extractor.domain.PredictionSample import PredictionSample
+from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.domain.ResidentModels import ResidentModels
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.Logger import Logger
+
+
+class TestLogger(Logger):
+    def log(
+        self,
+        extraction_identifier: ExtractionIdentifier,
+        message: str,
+        severity: LogSeverity = LogSeverity.info,
+        exception: Exception = None,
+    ):
+        pass
+
+
+class CountingExtractor(ExtractorBase):
+    instances_count = 0
+    batches: list[int] = list()
+
+    def __init__(self, extraction_identifier: ExtractionIdentifier, logger: Logger):
+        super().__init__(extraction_identifier, logger)
+        CountingExtractor.instances_count += 1
+
+    def get_suggestions(self, method_name: str, prediction_samples: PredictionSamplesData) -> list[str]:
+        CountingExtractor.batches.append(len(prediction_samples.prediction_samples))
+        return [f"{method_name} {x.source_text}" for x in prediction_samples.prediction_samples]
+
+    def can_be_used(self, extraction_data: ExtractionData) -> bool:
+        return True
+
+    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+        return extraction_data, extraction_data
+
+
+class LoadingExtractor(CountingExtractor):
+    models_path = ""
+    loads: list[str] = list()
+
+    def get_suggestions(self, method_name: str, prediction_samples: PredictionSamplesData) -> list[str]:
+        model_path = str(Path(LoadingExtractor.models_path, method_name))
+        model = ResidentModels.load(model_path, lambda: self.load_model(model_path))
+        return [f"{model} {x.source_text}" for x in prediction_samples.prediction_samples]
+
+    @staticmethod
+    def load_model(model_path: str) -> str:
+        LoadingExtractor.loads.append(Path(model_path).name)
+        return Path(model_path).read_text()
+
+
+class TestLocalPredictionWorker(TestCase):
+    def setUp(self):
+        CountingExtractor.instances_count = 0
+        CountingExtractor.batches = list()
+        LoadingExtractor.loads = list()
+        self.extractor_job = TrainableEntityExtractorJob(
+            run_name="prediction_worker",
+            extraction_name="extraction",
+            extractor_name="CountingExtractor",
+            method_name="Method",
+            gpu_needed=False,
+            timeout=3600,
+        )
+
+    def test_extractor_stays_resident(self):
+        prediction_worker = LocalPredictionWorker([CountingExtractor], TestLogger(), use_thread=False)
+
+        first = prediction_worker.predict(self.extractor_job, [PredictionSample.from_text("one")])
+        second = prediction_worker.predict(self.extractor_job, [PredictionSample.from_text("two")])
+
+        self.assertEqual(["Method one"], first)
+        self.assertEqual(["Method two"], second)
+        self.assertEqual(1, CountingExtractor.instances_count)
+
+    def test_evict(self):
+        prediction_worker = LocalPredictionWorker([CountingExtractor], TestLogger(), use_thread=False)
+
+        prediction_worker.predict(self.extractor_job, [PredictionSample.from_text("one")])
+        prediction_worker.evict(ExtractionIdentifier(run_name="prediction_worker", extraction_name="extraction"))
+        prediction_worker.predict(self.extractor_job, [PredictionSample.from_text("two")])
+
+        self.assertEqual(2, CountingExtractor.instances_count)
+
+    def test_concurrent_requests_are_coalesced(self):
+        prediction_worker = LocalPredictionWorker([CountingExtractor], TestLogger(), coalesce_seconds=0.05)
+        requests = [
+            PredictionRequest(self.extractor_job, [PredictionSample.from_text("one")]),
+            PredictionRequest(self.extractor_job, [PredictionSample.from_text("two"), PredictionSample.from_text("three")]),
+        ]
+        for request in requests:
+            prediction_worker.requests.put(request)
+
+        prediction_worker.start()
+
+        self.assertEqual(["Method one"], requests[0].future.result(timeout=5))
+        self.assertEqual(["Method two", "Method three"], requests[1].future.result(timeout=5))
+        self.assertEqual([3], CountingExtractor.batches)
+        prediction_worker.close()
+
+    def test_unknown_extractor(self):
+        prediction_worker = LocalPredictionWorker([CountingExtractor], TestLogger(), use_thread=False)
+        extractor_job = self.extractor_job.model_copy(update={"extractor_name": "MissingExtractor"})
+
+        with self.assertRaises(ValueError):
+            prediction_worker.predict(extractor_job, [PredictionSample.from_text("one")])
+
+    def test_loaded_models_stay_resident(self):
+        with tempfile.TemporaryDirectory() as models_path:
+            LoadingExtractor.models_path = models_path
+            Path(models_path, "Method").write_text("model")
+            prediction_worker = LocalPredictionWorker([LoadingExtractor], TestLogger(), use_thread=False)
+            extractor_job = self.extractor_job.model_copy(update={"extractor_name": "LoadingExtractor"})
+
+            first = prediction_worker.predict(extractor_job, [PredictionSample.from_text("one")])
+            second = prediction_worker.predict(extractor_job, [PredictionSample.from_text("two")])
+
+            self.assertEqual(["model one"], first)
+            self.assertEqual(["model two"], second)
+            self.assertEqual(["Method"], LoadingExtractor.loads)
+
+    def test_memory_budget_uses_loaded_models(self):
+        with tempfile.TemporaryDirectory() as models_path:
+            LoadingExtractor.models_path = models_path
+            Path(models_path, "Method").write_text("model")
+            Path(models_path, "Other").write_text("other")
+            prediction_worker = LocalPredictionWorker([LoadingExtractor], TestLogger(), memory_budget_mb=0, use_thread=False)
+            extractor_job = self.extractor_job.model_copy(update={"extractor_name": "LoadingExtractor"})
+            other_extractor_job = extractor_job.model_copy(update={"method_name": "Other"})
+
+            prediction_worker.predict(extractor_job, [PredictionSample.from_text("one")])
+            prediction_worker.predict(other_extractor_job, [PredictionSample.from_text("two")])
+            prediction_worker.predict(extractor_job, [PredictionSample.from_text("three")])
+
+            self.assertEqual(["Method", "Other", "Method"], LoadingExtractor.loads)
+            self.assertEqual(1, len(prediction_worker.resident_extractors))
+            self.assertLess(0, list(prediction_worker.resident_extractors.values())[0].get_size_bytes())
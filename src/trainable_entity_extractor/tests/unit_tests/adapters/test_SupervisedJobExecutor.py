@@ -0,0 +1,111 @@
+import time
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.LocalModelStorage import LocalModelStorage
+from trainable_entity_extractor.adapters.SubJobSupervisor import SubJobSupervisor
+from trainable_entity_extractor.adapters.SupervisedJobExecutor import SupervisedJobExecutor
+from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.ports.ExtractionDataRetriever import ExtractionDataRetriever
+from trainable_entity_extractor.ports.Logger import Logger
+
+extraction_identifier = ExtractionIdentifier(run_name="supervised", extraction_name="extraction")
+
+
+class TestLogger(Logger):
+    def log(
+        self,
+        extraction_identifier: ExtractionIdentifier,
+        message: str,
+        severity: LogSeverity = LogSeverity.info,
+        exception: Exception = None,
+    ):
+        pass
+
+
+class TestDataRetriever(ExtractionDataRetriever):
+    def __init__(self, cancelled: bool = False):
+        self.cancelled = cancelled
+
+    def get_extraction_data(self, extraction_identifier):
+        return None
+
+    def save_extraction_data(self, extraction_identifier, extraction_data):
+        return True
+
+    def get_prediction_data(self, extraction_identifier):
+        return []
+
+    def save_prediction_data(self, extraction_identifier, prediction_samples):
+        return True
+
+    def get_suggestions(self, extraction_identifier):
+        return []
+
+    def save_suggestions(self, extraction_identifier, suggestions):
+        return True
+
+    def is_extractor_cancelled(self, extractor_identifier):
+        return self.cancelled
+
+
+class TestSupervisedJobExecutor(SupervisedJobExecutor):
+    def _start_performance_evaluation(self, extraction_identifier, distributed_sub_job):
+        time.sleep(float(distributed_sub_job.extractor_job.method_name.split("_")[-1]))
+        distributed_sub_job.status = JobStatus.SUCCESS
+        distributed_sub_job.result = Performance(method_name=distributed_sub_job.extractor_job.method_name, performance=90)
+        return distributed_sub_job.result
+
+
+class TestSupervisedJobExecutorTimeouts(TestCase):
+    @staticmethod
+    def get_sub_job(sleep_seconds: float, timeout: int) -> DistributedSubJob:
+        extractor_job = TrainableEntityExtractorJob(
+            run_name="supervised",
+            extraction_name="extraction",
+            extractor_name="TextToTextExtractor",
+            method_name=f"sleep_{sleep_seconds}",
+            gpu_needed=False,
+            timeout=timeout,
+        )
+        return DistributedSubJob(extractor_job=extractor_job)
+
+    @staticmethod
+    def get_job_executor(cancelled: bool = False) -> TestSupervisedJobExecutor:
+        supervisor = SubJobSupervisor(poll_seconds=0.05, termination_grace_seconds=1)
+        return TestSupervisedJobExecutor([], TestDataRetriever(cancelled), LocalModelStorage(), TestLogger(), supervisor)
+
+    def test_finished_sub_job_result_is_returned(self):
+        sub_job = self.get_sub_job(0, 10)
+
+        performance = self.get_job_executor().start_performance_evaluation(extraction_identifier, sub_job)
+
+        self.assertEqual(JobStatus.SUCCESS, sub_job.status)
+        self.assertEqual(90, performance.performance)
+        self.assertEqual(90, sub_job.result.performance)
+
+    def test_timeout_records_failed_performance(self):
+        sub_job = self.get_sub_job(30, 1)
+        start_time = time.time()
+
+        performance = self.get_job_executor().start_performance_evaluation(extraction_identifier, sub_job)
+
+        self.assertLess(time.time() - start_time, 10)
+        self.assertEqual(JobStatus.FAILURE, sub_job.status)
+        self.assertTrue(performance.failed)
+        self.assertTrue(performance.timed_out)
+        self.assertEqual("sleep_30", performance.method_name)
+
+    def test_cancellation_stops_sub_job(self):
+        sub_job = self.get_sub_job(30, 3600)
+        start_time = time.time()
+
+        performance = self.get_job_executor(cancelled=True).start_performance_evaluation(extraction_identifier, sub_job)
+
+        self.assertLess(time.time() - start_time, 10)
+        self.assertEqual(JobStatus.CANCELED, sub_job.status)
+        self.assertFalse(performance.timed_out)
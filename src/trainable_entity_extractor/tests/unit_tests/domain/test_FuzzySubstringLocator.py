@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from rapidfuzz import fuzz
+
+from trainable_entity_extractor.domain.FuzzySubstringLocator import FuzzySubstringLocator
+
+
+def brute_force_locate(label: str, text: str):
+    best_match = None
+    best_score = 0
+    min_len = max(1, len(label) - 2)
+    max_len = min(len(text), len(label) + 5)
+    for start in range(len(text)):
+        for length in range(min_len, min(max_len + 1, len(text) - start + 1)):
+            substring = text[start : start + length]
+            score = fuzz.ratio(label.lower(), substring.lower())
+            if score >= 75 and score > best_score:
+                best_score = score
+                best_match = (start, start + length, substring)
+    return best_match
+
+
+class TestFuzzySubstringLocator(TestCase):
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt. " * 6
+
+    def test_word_match(self):
+        locator = FuzzySubstringLocator("item")
+        self.assertEqual((8, 12, "itme"), locator.locate("This is itme in the text"))
+
+    def test_short_text_same_as_brute_force(self):
+        label = "item-1"
+        text = "This is item_1 in the text"
+        self.assertEqual(brute_force_locate(label, text), FuzzySubstringLocator(label).locate(text))
+
+    def test_exact_match_inside_long_text(self):
+        label = "Resolution"
+        text = self.filler + "TheRESOLUTIONadopted" + self.filler
+        self.assertEqual(brute_force_locate(label, text), FuzzySubstringLocator(label).locate(text))
+
+    def test_fuzzy_match_inside_long_text(self):
+        label = "Secretary-General"
+        text = self.filler + "theSecretaryGeneralof" + self.filler
+        expected = brute_force_locate(label, text)
+        result = FuzzySubstringLocator(label).locate(text)
+
+        self.assertIsNotNone(result)
+        self.assertLessEqual(abs(expected[0] - result[0]), 2)
+        self.assertLessEqual(abs(expected[1] - result[1]), 2)
+
+    def test_no_match_in_long_text(self):
+        label = "completely different"
+        text = self.filler * 3
+        self.assertIsNone(FuzzySubstringLocator(label).locate(text))
+
+    def test_results_are_cached_per_text(self):
+        locator = FuzzySubstringLocator("item")
+        text = self.filler + "itme"
+        first_result = locator.locate(text)
+        self.assertIs(first_result, locator.locate(text))
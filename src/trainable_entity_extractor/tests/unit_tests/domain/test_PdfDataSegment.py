@@ -0,0 +1,52 @@
+import pickle
+from unittest import TestCase
+
+from pdf_features.Rectangle import Rectangle
+
+from trainable_entity_extractor.domain.PdfDataSegment import PdfDataSegment
+
+
+class TestPdfDataSegment(TestCase):
+    def test_equality(self):
+        segment = PdfDataSegment.from_text("text")
+        same_segment = PdfDataSegment.from_text("text")
+        labeled_segment = PdfDataSegment.from_text("text")
+        labeled_segment.ml_label = 1
+
+        self.assertEqual(segment, same_segment)
+        self.assertEqual(hash(segment), hash(same_segment))
+        self.assertNotEqual(segment, labeled_segment)
+        self.assertNotEqual(segment, PdfDataSegment.from_text("other text"))
+        self.assertNotEqual(segment, Rectangle.from_coordinates(0, 0, 0, 0))
+
+    def test_identity_key_follows_changes(self):
+        segment = PdfDataSegment.from_text("text")
+        segments_set = {PdfDataSegment.from_text("text changed")}
+        self.assertNotIn(segment, segments_set)
+
+        segment.text_content = "text changed"
+        self.assertIn(segment, segments_set)
+
+        segment.bounding_box = Rectangle.from_coordinates(0, 0, 10, 10)
+        self.assertNotIn(segment, segments_set)
+
+        copied_segment = segment.model_copy(update={"bounding_box": Rectangle.from_coordinates(0, 0, 0, 0)})
+        self.assertIn(copied_segment, segments_set)
+
+    def test_pickle(self):
+        segment = PdfDataSegment.from_text("text")
+        hash(segment)
+
+        unpickled_segment = pickle.loads(pickle.dumps(segment))
+
+        self.assertEqual(segment, unpickled_segment)
+        self.assertEqual(hash(segment), hash(unpickled_segment))
+
+    def test_get_indexes(self):
+        segments = PdfDataSegment.from_texts(["a", "b", "c"])
+        segments.append(segments[1].model_copy())
+
+        indexes = PdfDataSegment.get_indexes(segments)
+
+        self.assertEqual([0, 1, 2, 1], [indexes[x] for x in segments])
+        self.assertEqual([segments.index(x) for x in segments], [indexes[x] for x in segments])
@@ -0,0 +1,138 @@
+import pickle
+from unittest import TestCase
+
+from pdf_features.PdfFeatures import PdfFeatures
+from pdf_features.PdfFont import PdfFont
+from pdf_features.PdfPage import PdfPage
+from pdf_features.PdfToken import PdfToken
+from pdf_features.PdfTokenStyle import PdfTokenStyle
+from pdf_features.Rectangle import Rectangle
+from pdf_token_type_labels.TokenType import TokenType
+
+from trainable_entity_extractor.domain.CompactPdfData import CompactPdfData
+from trainable_entity_extractor.domain.PdfData import PdfData
+from trainable_entity_extractor.domain.PdfDataSegment import PdfDataSegment
+from trainable_entity_extractor.domain.PdfTokensStore import PdfTokensStore
+from trainable_entity_extractor.domain.TokensColumn import TokensColumn
+from trainable_entity_extractor.domain.TrainingSample import TrainingSample
+
+
+class TestPdfTokensStore(TestCase):
+    @staticmethod
+    def get_pdf_features() -> PdfFeatures:
+        fonts = [PdfFont(font_id=str(i), font_size=10 + i, bold=False, italics=i == 1, color="black") for i in range(2)]
+        pages = list()
+        for page_number in [1, 2]:
+            tokens = list()
+            for index, content in enumerate(["first", "second", "", "third"]):
+                font = fonts[index % 2]
+                tokens.append(
+                    PdfToken(
+                        page_number=page_number,
+                        id=f"p{page_number}_t{index}",
+                        content=content,
+                        font=font,
+                        reading_order_no=index,
+                        bounding_box=Rectangle.from_coordinates(index, 10 * index, index + 5.5, 10 * index + 8),
+                        token_type=TokenType.TITLE if index == 0 else TokenType.TEXT,
+                        token_style=PdfTokenStyle(font=font),
+                    )
+                )
+            pages.append(PdfPage(page_number=page_number, page_width=612, page_height=792, tokens=tokens, pdf_name="x"))
+
+        return PdfFeatures(pages=pages, fonts=fonts, file_name="file", file_type="pdf")
+
+    def test_round_trip(self):
+        pdf_features = self.get_pdf_features()
+
+        tokens_store = PdfTokensStore.from_pdf_features(pdf_features)
+        restored_pdf_features = tokens_store.to_pdf_features()
+
+        self.assertEqual(8, len(tokens_store))
+        self.assertEqual(2, len(tokens_store.columns["font"].table))
+        self.assertEqual("file", restored_pdf_features.file_name)
+        self.assertEqual([4, 4], [len(page.tokens) for page in restored_pdf_features.pages])
+        for page, restored_page in zip(pdf_features.pages, restored_pdf_features.pages):
+            self.assertEqual(page.page_width, restored_page.page_width)
+            for token, restored_token in zip(page.tokens, restored_page.tokens):
+                self.assertEqual(vars(token), vars(restored_token))
+        self.assertIs(pdf_features.pages[1].tokens[1].font, tokens_store.get_token(5).font)
+        self.assertEqual("third", tokens_store.get_page_tokens(1)[3].content)
+        self.assertEqual("str", tokens_store.columns["id"].kind)
+        self.assertEqual("object", tokens_store.columns["token_style"].kind)
+        self.assertEqual("object", tokens_store.columns["bounding_box"].kind)
+        self.assertEqual("interned", tokens_store.columns["font"].kind)
+
+    def test_numbers_keep_their_types(self):
+        values = [1, 2.5, -3, 0.0, 2**40]
+
+        tokens_column = TokensColumn(values)
+        restored_values = tokens_column.get_values(0, len(values))
+
+        self.assertEqual(values, restored_values)
+        self.assertEqual([type(value) for value in values], [type(value) for value in restored_values])
+        self.assertEqual("number", tokens_column.kind)
+        self.assertEqual([1, -3], TokensColumn([1, -3]).get_values(0, 2))
+        self.assertEqual("int", TokensColumn([1, -3]).kind)
+        self.assertEqual([True, None, True], TokensColumn([True, None, True]).get_values(0, 3))
+
+    def test_unpickled_tokens_are_plain_lists(self):
+        pdf_data = PdfData(pdf_features=self.get_pdf_features())
+
+        unpickled_pdf_data = pickle.loads(pickle.dumps(pdf_data))
+        tokens = unpickled_pdf_data.pdf_features.pages[0].tokens
+
+        self.assertIs(list, type(tokens))
+        self.assertEqual(["first", "second", "", "third"], [token.content for token in tokens])
+        tokens[0].content = "changed"
+        self.assertEqual("changed", next(unpickled_pdf_data.pdf_features.loop_tokens())[1].content)
+        self.assertIs(tokens[0], unpickled_pdf_data.pdf_features.pages[0].tokens[0])
+        self.assertIs(list, type(pdf_data.pdf_features.pages[0].tokens))
+
+    def test_empty_pdf_features(self):
+        self.assertIsNone(PdfTokensStore.from_pdf_features(None))
+        self.assertIsNone(PdfTokensStore.from_pdf_features(PdfFeatures.get_empty()))
+
+    def test_pickle_pdf_data_lazily(self):
+        pdf_data = PdfData(pdf_features=self.get_pdf_features(), pdf_data_segments=PdfDataSegment.from_texts(["a", "b"]))
+
+        unpickled_pdf_data = pickle.loads(pickle.dumps(pdf_data))
+
+        self.assertNotIn("pdf_features", unpickled_pdf_data.__dict__)
+        self.assertTrue(unpickled_pdf_data.has_pdf_features())
+        self.assertEqual(pdf_data.pdf_data_segments, unpickled_pdf_data.pdf_data_segments)
+        self.assertEqual("file", unpickled_pdf_data.file_name)
+        tokens = [vars(token) for _, token in pdf_data.pdf_features.loop_tokens()]
+        self.assertEqual(tokens, [vars(token) for _, token in unpickled_pdf_data.pdf_features.loop_tokens()])
+        self.assertIn("pdf_features", unpickled_pdf_data.__dict__)
+        self.assertFalse(PdfData.get_blank().has_pdf_features())
+
+    def test_dump_unpickled_pdf_data(self):
+        pdf_data = PdfData(pdf_features=self.get_pdf_features(), pdf_data_segments=PdfDataSegment.from_texts(["a"]))
+        expected_dump = pdf_data.model_dump()
+
+        unpickled_pdf_data = pickle.loads(pickle.dumps(pdf_data))
+        self.assertEqual(expected_dump, unpickled_pdf_data.model_dump())
+
+        unpickled_pdf_data = pickle.loads(pickle.dumps(pdf_data))
+        self.assertEqual(pdf_data.model_dump_json(), unpickled_pdf_data.model_dump_json())
+
+        unpickled_pdf_data = pickle.loads(pickle.dumps(pdf_data))
+        self.assertEqual(expected_dump, TrainingSample(pdf_data=unpickled_pdf_data).model_dump()["pdf_data"])
+
+    def test_compact_pdf_data(self):
+        pdf_data_segments = PdfDataSegment.from_texts(["a", "b", "c"])
+        pdf_data_segments[1].ml_label = 1
+        pdf_data = PdfData(pdf_features=self.get_pdf_features(), pdf_data_segments=pdf_data_segments)
+        PdfDataSegment.get_indexes(pdf_data.pdf_data_segments)
+
+        compact_pdf_data = pickle.loads(pickle.dumps(CompactPdfData(pdf_data)))
+        restored_pdf_data = compact_pdf_data.to_pdf_data()
+
+        self.assertEqual("object", compact_pdf_data.segments.kind)
+        self.assertIsNone(restored_pdf_data.pdf_data_segments[0]._identity_key)
+        self.assertEqual(pdf_data.pdf_data_segments, restored_pdf_data.pdf_data_segments)
+        self.assertEqual([0, 1, 0], [segment.ml_label for segment in restored_pdf_data.pdf_data_segments])
+        self.assertIs(list, type(restored_pdf_data.pdf_features.pages[0].tokens))
+        self.assertEqual(pdf_data.model_dump(), restored_pdf_data.model_dump())
+        self.assertFalse(CompactPdfData(PdfData.get_blank()).to_pdf_data().has_pdf_features())
@@ -0,0 +1,100 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
+
+
+class TestStageProfiler(TestCase):
+    def test_disabled_profiler_records_nothing(self):
+        profiler = StageProfiler("disabled", enabled=False)
+        with profiler:
+            with StageProfiler.stage("load"):
+                pass
+
+        self.assertEqual([], profiler.get_stage_timings())
+        self.assertIsNone(StageProfiler.get_active())
+
+    def test_stages_are_recorded_in_active_profiler(self):
+        profiler = StageProfiler("enabled", enabled=True)
+        with profiler:
+            with StageProfiler.stage("load"):
+                sum(range(10000))
+            with StageProfiler.stage("fit"):
+                with StageProfiler.stage("features"):
+                    pass
+
+        stage_timings = profiler.get_stage_timings()
+        self.assertEqual(["load", "fit", "features"], [stage_timing.name for stage_timing in stage_timings])
+        self.assertGreater(stage_timings[0].wall_seconds, 0)
+        self.assertGreaterEqual(stage_timings[0].cpu_seconds, 0)
+        self.assertGreater(stage_timings[0].process_peak_rss_mb, 0)
+        self.assertIsNone(StageProfiler.get_active())
+
+    def test_stage_rss_delta(self):
+        profiler = StageProfiler("enabled", enabled=True)
+        with profiler:
+            with StageProfiler.stage("allocate"):
+                allocated = b"x" * 64 * 1024 * 1024
+            with StageProfiler.stage("keep"):
+                pass
+
+        allocate_timing, keep_timing = profiler.get_stage_timings()
+        self.assertGreater(allocate_timing.rss_delta_mb, 32)
+        self.assertLess(abs(keep_timing.rss_delta_mb), 32)
+        self.assertGreaterEqual(keep_timing.process_peak_rss_mb, allocate_timing.rss_delta_mb)
+        del allocated
+
+    def test_session_reuses_active_profiler(self):
+        profiler = StageProfiler("outer", enabled=True)
+        with profiler:
+            self.assertIs(profiler, StageProfiler.session("inner"))
+
+        self.assertIsNot(profiler, StageProfiler.session("inner"))
+
+    def test_nested_sessions(self):
+        with StageProfiler.session("outer", enabled=True) as outer_profiler:
+            with StageProfiler.session("inner", enabled=True) as inner_profiler:
+                with StageProfiler.stage("inner_stage"):
+                    pass
+
+            self.assertIs(outer_profiler, inner_profiler)
+            self.assertIs(outer_profiler, StageProfiler.get_active())
+            with StageProfiler.stage("outer_stage"):
+                pass
+
+        self.assertIsNone(StageProfiler.get_active())
+        self.assertEqual(["inner_stage", "outer_stage"], [x.name for x in outer_profiler.get_stage_timings()])
+
+    def test_active_profiler_is_cleared_after_outer_session(self):
+        with StageProfiler.session("outer", enabled=True):
+            with StageProfiler.session("inner", enabled=True):
+                pass
+
+        with StageProfiler.stage("later_job_stage"):
+            pass
+
+        self.assertIsNone(StageProfiler.get_active())
+        new_profiler = StageProfiler.session("later_job", enabled=True)
+        with new_profiler:
+            pass
+        self.assertEqual([], new_profiler.get_stage_timings())
+        self.assertIsNone(StageProfiler.get_active())
+
+    def test_chrome_trace(self):
+        profiler = StageProfiler("trace", enabled=True)
+        with profiler:
+            with StageProfiler.stage("predict"):
+                pass
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            trace_path = Path(temporary_directory, "trace.json")
+            profiler.save_chrome_trace(trace_path)
+            trace = json.loads(trace_path.read_text())
+
+        self.assertEqual(1, len(trace["traceEvents"]))
+        self.assertEqual("predict", trace["traceEvents"][0]["name"])
+        self.assertEqual("X", trace["traceEvents"][0]["ph"])
+        self.assertIn("rss_delta_mb", trace["traceEvents"][0]["args"])
+        self.assertIn("process_peak_rss_mb", trace["traceEvents"][0]["args"])
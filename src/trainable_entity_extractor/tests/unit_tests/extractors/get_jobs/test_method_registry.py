@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from trainable_entity_extractor.domain.ExtractionData import ExtractionData
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.ports.MethodBase import MethodBase
+from trainable_entity_extractor.ports.MethodRegistry import MethodRegistry
+
+extraction_identifier = ExtractionIdentifier(extraction_name="test_method_registry")
+created_methods: list[str] = list()
+
+
+class CountedMethod(MethodBase):
+    def __init__(self, extraction_identifier: ExtractionIdentifier):
+        super().__init__(extraction_identifier)
+        created_methods.append(self.get_name())
+
+    def get_name(self):
+        return self.__class__.__name__
+
+    def get_performance(self, train_set: ExtractionData, test_set: ExtractionData) -> float:
+        return 0
+
+    def train(self, extraction_data: ExtractionData) -> None:
+        pass
+
+    def predict(self, prediction_samples_data: PredictionSamplesData) -> list[str]:
+        return []
+
+
+class CpuMethod(CountedMethod):
+    pass
+
+
+class GpuMethod(CountedMethod):
+    timeout = 7200
+
+    def gpu_needed(self) -> bool:
+        return True
+
+
+class MultiValueMethod(CountedMethod):
+    def can_be_used(self, extraction_data: ExtractionData) -> bool:
+        return extraction_data.multi_value
+
+
+class TestMethodRegistry(TestCase):
+    def setUp(self):
+        created_methods.clear()
+        self.method_registry = MethodRegistry([CpuMethod, GpuMethod, MultiValueMethod])
+
+    def test_names_without_instantiation(self):
+        self.assertEqual(["CpuMethod", "GpuMethod", "MultiValueMethod"], self.method_registry.get_names())
+        self.assertEqual([], created_methods)
+
+    def test_create_only_requested_method(self):
+        method = self.method_registry.create("GpuMethod", extraction_identifier)
+
+        self.assertIsInstance(method, GpuMethod)
+        self.assertEqual(["GpuMethod"], created_methods)
+        self.assertIsNone(self.method_registry.create("MissingMethod", extraction_identifier))
+
+    def test_metadata(self):
+        self.assertEqual(3600, self.method_registry.get_timeout("CpuMethod"))
+        self.assertEqual(7200, self.method_registry.get_timeout("GpuMethod"))
+        self.assertFalse(self.method_registry.has_applicability_check("CpuMethod"))
+        self.assertTrue(self.method_registry.has_applicability_check("MultiValueMethod"))
+        self.assertFalse(self.method_registry.is_gpu_needed("CpuMethod", extraction_identifier))
+        self.assertEqual([], created_methods)
+
+    def test_gpu_needed_is_cached(self):
+        self.assertTrue(self.method_registry.is_gpu_needed("GpuMethod", extraction_identifier))
+        self.assertTrue(self.method_registry.is_gpu_needed("GpuMethod", extraction_identifier))
+        self.assertEqual(["GpuMethod"], created_methods)
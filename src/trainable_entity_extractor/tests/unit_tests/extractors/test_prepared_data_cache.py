@@ -0,0 +1,91 @@
+from unittest import TestCase
+
+from trainable_entity_extractor.domain.ExtractionData import ExtractionData
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.LabeledData import LabeledData
+from trainable_entity_extractor.domain.LogSeverity import LogSeverity
+from trainable_entity_extractor.domain.PredictionSamplesData import PredictionSamplesData
+from trainable_entity_extractor.domain.PreparedDataCache import PreparedDataCache
+from trainable_entity_extractor.domain.TrainingSample import TrainingSample
+from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
+from trainable_entity_extractor.ports.Logger import Logger
+
+extraction_identifier = ExtractionIdentifier(run_name="prepared_data", extraction_name="cache")
+
+
+class TestLogger(Logger):
+    def log(
+        self,
+        extraction_identifier: ExtractionIdentifier,
+        message: str,
+        severity: LogSeverity = LogSeverity.info,
+        exception: Exception = None,
+    ):
+        pass
+
+
+class CountingExtractor(ExtractorBase):
+    def __init__(self, extraction_identifier: ExtractionIdentifier, logger: Logger):
+        super().__init__(extraction_identifier, logger)
+        self.prepare_count = 0
+        self.reset_count = 0
+
+    def get_suggestions(self, method_name: str, prediction_samples: PredictionSamplesData) -> list:
+        return []
+
+    def can_be_used(self, extraction_data: ExtractionData) -> bool:
+        return True
+
+    def reset_model_folders(self):
+        self.reset_count += 1
+
+    def prepare_for_training(self, extraction_data: ExtractionData) -> tuple[ExtractionData, ExtractionData]:
+        self.prepare_count += 1
+        self.reset_model_folders()
+        return self.get_train_test_sets(extraction_data)
+
+
+class TestPreparedDataCache(TestCase):
+    def setUp(self):
+        PreparedDataCache.clear()
+
+    @staticmethod
+    def get_extraction_data(labels: list[str]) -> ExtractionData:
+        samples = [TrainingSample(labeled_data=LabeledData(label_text=label, source_text=label)) for label in labels]
+        return ExtractionData(samples=samples, extraction_identifier=extraction_identifier)
+
+    def test_split_is_prepared_once(self):
+        extractor = CountingExtractor(extraction_identifier, TestLogger())
+        labels = [f"label {i}" for i in range(20)]
+
+        first_train_set, first_test_set = extractor.get_prepared_train_test_sets(self.get_extraction_data(labels))
+        train_set, test_set = extractor.get_prepared_train_test_sets(self.get_extraction_data(labels))
+
+        self.assertEqual(1, extractor.prepare_count)
+        self.assertEqual(2, extractor.reset_count)
+        self.assertEqual(first_train_set, train_set)
+        self.assertEqual(first_test_set, test_set)
+        self.assertEqual(16, len(train_set.samples))
+
+    def test_cached_split_is_not_shared_between_methods(self):
+        extractor = CountingExtractor(extraction_identifier, TestLogger())
+        labels = [f"label {i}" for i in range(20)]
+
+        train_set, test_set = extractor.get_prepared_train_test_sets(self.get_extraction_data(labels))
+        train_set.samples[0].labeled_data.label_text = "changed by a method"
+        test_set.samples.clear()
+        cached_train_set, cached_test_set = extractor.get_prepared_train_test_sets(self.get_extraction_data(labels))
+
+        self.assertEqual(1, extractor.prepare_count)
+        self.assertIsNot(train_set, cached_train_set)
+        self.assertEqual("label 0", cached_train_set.samples[0].labeled_data.label_text)
+        self.assertEqual(4, len(cached_test_set.samples))
+
+    def test_changed_data_is_prepared_again(self):
+        extractor = CountingExtractor(extraction_identifier, TestLogger())
+        labels = [f"label {i}" for i in range(20)]
+
+        extractor.get_prepared_train_test_sets(self.get_extraction_data(labels))
+        extractor.get_prepared_train_test_sets(self.get_extraction_data(labels + ["new label"]))
+
+        self.assertEqual(2, extractor.prepare_count)
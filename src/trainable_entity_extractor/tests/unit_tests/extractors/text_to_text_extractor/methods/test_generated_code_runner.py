@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.GeneratedCodeRunner import (
+    GeneratedCodeRunner,
+)
+
+
+class TestGeneratedCodeRunner(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        GeneratedCodeRunner.close_pool()
+
+    def test_run_batch(self):
+        code = "def extract(text: str):\n    import re\n    return re.sub(r'[^0-9]', '', text)"
+        outputs = GeneratedCodeRunner.run(code, ["one 1", "two 22", "none"])
+        self.assertEqual([(True, "1"), (True, "22"), (True, "")], outputs)
+
+    def test_compile_once(self):
+        code = "def extract(text: str):\n    return text.upper()"
+        first_code_object = GeneratedCodeRunner.compile_code(code)
+        self.assertIs(first_code_object, GeneratedCodeRunner.compile_code(code))
+
+    def test_syntax_error(self):
+        self.assertIsNone(GeneratedCodeRunner.run("def extract(text: str)\n    return text", ["a"]))
+
+    def test_missing_extract_function(self):
+        self.assertEqual([(False, None)], GeneratedCodeRunner.run("def other(text: str):\n    return text", ["a"]))
+
+    def test_exception_only_fails_sample(self):
+        code = "def extract(text: str):\n    return str(1 / int(text))"
+        outputs = GeneratedCodeRunner.run(code, ["1", "0", "2"])
+        self.assertEqual([(True, "1.0"), (False, None), (True, "0.5")], outputs)
+
+    def test_sample_timeout(self):
+        code = "def extract(text: str):\n    while text == 'loop':\n        pass\n    return text"
+        outputs = GeneratedCodeRunner.run(code, ["a", "loop", "b"])
+        self.assertEqual([(True, "a"), (False, None), (True, "b")], outputs)
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.adapters.extractors.text_to_text_extractor.methods.LLMResponseCache import LLMResponseCache
+from trainable_entity_extractor.domain.LLMCacheMode import LLMCacheMode
+
+
+class TestLLMResponseCache(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.requests_count = 0
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def request_response(self) -> str:
+        self.requests_count += 1
+        return f"response {self.requests_count}"
+
+    def test_read_write(self):
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.READ_WRITE)
+
+        first_response = cache.get_response("model", "prompt", {"stream": False}, self.request_response)
+        second_response = cache.get_response("model", "prompt", {"stream": False}, self.request_response)
+
+        self.assertEqual("response 1", first_response)
+        self.assertEqual("response 1", second_response)
+        self.assertEqual(1, self.requests_count)
+
+    def test_key_depends_on_model_prompt_and_parameters(self):
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.READ_WRITE)
+
+        cache.get_response("model", "prompt", {}, self.request_response)
+        cache.get_response("other_model", "prompt", {}, self.request_response)
+        cache.get_response("model", "other prompt", {}, self.request_response)
+        cache.get_response("model", "prompt", {"stream": True}, self.request_response)
+
+        self.assertEqual(4, self.requests_count)
+
+    def test_replay_never_requests(self):
+        LLMResponseCache(self.temporary_directory.name, LLMCacheMode.READ_WRITE).save("model", "prompt", {}, "cached")
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.REPLAY)
+
+        self.assertEqual("cached", cache.get_response("model", "prompt", {}, self.request_response))
+        self.assertIsNone(cache.get_response("model", "missing prompt", {}, self.request_response))
+        self.assertEqual(0, self.requests_count)
+        self.assertTrue(cache.can_generate(None))
+
+    def test_off(self):
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.OFF)
+
+        cache.get_response("model", "prompt", {}, self.request_response)
+        cache.get_response("model", "prompt", {}, self.request_response)
+
+        self.assertEqual(2, self.requests_count)
+        self.assertFalse(cache.can_generate(None))
+
+    def test_off_by_default(self):
+        cache = LLMResponseCache(self.temporary_directory.name)
+
+        cache.get_response("model", "prompt", {}, self.request_response)
+
+        self.assertEqual(LLMCacheMode.OFF, cache.mode)
+        self.assertEqual(LLMCacheMode.OFF, LLMResponseCache(self.temporary_directory.name, "unknown").mode)
+        self.assertEqual([], list(Path(self.temporary_directory.name).glob("*/*.json")))
+
+    def test_retry_skips_cache(self):
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.READ_WRITE)
+
+        cache.get_response("model", "prompt", {}, self.request_response)
+        retry_response = cache.get_response("model", "prompt", {}, self.request_response, attempt=1)
+        cached_response = cache.get_response("model", "prompt", {}, self.request_response)
+
+        self.assertEqual("response 2", retry_response)
+        self.assertEqual("response 2", cached_response)
+        self.assertEqual(2, self.requests_count)
+
+    def test_evicts_least_recently_used_responses(self):
+        cache = LLMResponseCache(self.temporary_directory.name, LLMCacheMode.READ_WRITE, max_mb=1.5 / 1024)
+        for index in range(3):
+            cache.save("model", f"prompt {index}", {}, "x" * 400)
+            file_path = cache.get_file_path(cache.get_key("model", f"prompt {index}", {}))
+            os.utime(file_path, (index, index))
+
+        cache.save("model", "prompt 3", {}, "x" * 400)
+
+        self.assertIsNone(cache.get("model", "prompt 0", {}))
+        self.assertIsNotNone(cache.get("model", "prompt 3", {}))
+        self.assertLessEqual(sum(x.stat().st_size for x in Path(self.temporary_directory.name).glob("*/*.json")), 1536)
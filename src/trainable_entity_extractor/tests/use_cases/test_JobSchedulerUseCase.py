@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from trainable_entity_extractor.domain.DistributedJob import DistributedJob
+from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.JobType import JobType
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.use_cases.JobSchedulerUseCase import JobSchedulerUseCase
+
+
+def get_job(domain: str, extraction_name: str, job_type: JobType = JobType.TRAIN, gpu_needed: bool = False):
+    extractor_job = TrainableEntityExtractorJob(
+        run_name=domain,
+        extraction_name=extraction_name,
+        extractor_name="TextToTextExtractor",
+        method_name="SameInputOutputMethod",
+        gpu_needed=gpu_needed,
+        timeout=300,
+    )
+    return DistributedJob(
+        type=job_type,
+        sub_jobs=[DistributedSubJob(extractor_job=extractor_job)],
+        domain_name=domain,
+        extraction_identifier=ExtractionIdentifier(run_name=domain, extraction_name=extraction_name),
+    )
+
+
+class TestJobSchedulerUseCase(TestCase):
+    def test_predict_jobs_go_first(self):
+        distributed_jobs = [get_job("a", "1"), get_job("a", "2", JobType.PERFORMANCE), get_job("b", "3", JobType.PREDICT)]
+
+        next_job = JobSchedulerUseCase().get_next_job(distributed_jobs)
+
+        self.assertEqual(JobType.PREDICT, next_job.type)
+
+    def test_domains_share_the_queue(self):
+        scheduler = JobSchedulerUseCase(max_running_jobs_per_domain=100)
+        distributed_jobs = [get_job("busy", str(i)) for i in range(50)] + [get_job("quiet", "1"), get_job("quiet", "2")]
+
+        started_domains = list()
+        for _ in range(4):
+            next_job = scheduler.get_next_job(distributed_jobs)
+            started_domains.append(next_job.domain_name)
+            distributed_jobs.remove(next_job)
+
+        self.assertEqual(["busy", "quiet", "busy", "quiet"], started_domains)
+
+    def test_running_jobs_cap_per_domain(self):
+        scheduler = JobSchedulerUseCase(max_running_jobs_per_domain=1)
+        running_job = get_job("a", "1")
+        running_job.sub_jobs[0].status = JobStatus.RUNNING
+        distributed_jobs = [running_job, get_job("a", "2", JobType.PREDICT)]
+
+        self.assertEqual(running_job, scheduler.get_next_job(distributed_jobs))
+
+    def test_gpu_and_cpu_lanes(self):
+        distributed_jobs = [get_job("a", "1", gpu_needed=True), get_job("a", "2")]
+        scheduler = JobSchedulerUseCase()
+
+        self.assertEqual("1", scheduler.get_next_job(distributed_jobs, gpu_lane=True).extraction_identifier.extraction_name)
+        self.assertEqual("2", scheduler.get_next_job(distributed_jobs, gpu_lane=False).extraction_identifier.extraction_name)
+
+    def test_duplicated_jobs_and_backpressure(self):
+        scheduler = JobSchedulerUseCase(max_queued_jobs=2, max_queued_jobs_per_domain=1)
+        distributed_jobs = [get_job("a", "1")]
+
+        self.assertFalse(scheduler.can_enqueue(distributed_jobs, get_job("a", "1"))[0])
+        self.assertFalse(scheduler.can_enqueue(distributed_jobs, get_job("a", "2"))[0])
+        self.assertTrue(scheduler.can_enqueue(distributed_jobs, get_job("b", "1"))[0])
+        self.assertFalse(scheduler.can_enqueue(distributed_jobs + [get_job("b", "1")], get_job("c", "1"))[0])
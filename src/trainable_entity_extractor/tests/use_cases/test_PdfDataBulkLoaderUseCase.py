@@ -0,0 +1,87 @@
+import shutil
+from os.path import join
+from unittest import TestCase
+
+from pdf_token_type_labels.TokenType import TokenType
+
+from trainable_entity_extractor.config import APP_PATH, DATA_PATH
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.PdfData import PdfData
+from trainable_entity_extractor.domain.SegmentBox import SegmentBox
+from trainable_entity_extractor.domain.SegmentationData import SegmentationData
+from trainable_entity_extractor.domain.XmlFile import XmlFile
+from trainable_entity_extractor.use_cases.PdfDataBulkLoaderUseCase import PdfDataBulkLoaderUseCase
+
+
+class TestPdfDataBulkLoaderUseCase(TestCase):
+    TEST_XML_PATH = APP_PATH / "trainable_entity_extractor" / "tests" / "test_files"
+    tenant = "tenant_bulk_loader"
+
+    def tearDown(self):
+        shutil.rmtree(join(DATA_PATH, self.tenant), ignore_errors=True)
+
+    def get_xml_file(self, xml_file_name: str, test_file_name: str = "") -> XmlFile:
+        xml_file = XmlFile(
+            extraction_identifier=ExtractionIdentifier(run_name=self.tenant, extraction_name="extraction"),
+            to_train=True,
+            xml_file_name=xml_file_name,
+        )
+        if test_file_name:
+            xml_file.save(file_content=(self.TEST_XML_PATH / test_file_name).read_bytes())
+
+        return xml_file
+
+    @staticmethod
+    def get_segmentation_data(top: float) -> SegmentationData:
+        segment_box = SegmentBox(
+            left=123.38, top=top, width=317.406, height=27.5377, page_width=612, page_height=792, page_number=1
+        )
+        return SegmentationData(
+            page_width=612,
+            page_height=792,
+            xml_segments_boxes=[segment_box.model_copy(update={"type": TokenType.TEXT})],
+            label_segments_boxes=[segment_box],
+        )
+
+    def test_load(self):
+        xml_files = [
+            self.get_xml_file("test_1.xml", "test.xml"),
+            self.get_xml_file("missing.xml"),
+            self.get_xml_file("test_2.xml", "test.xml"),
+        ]
+        segmentations_data = [
+            self.get_segmentation_data(245.184),
+            self.get_segmentation_data(0),
+            self.get_segmentation_data(0),
+        ]
+
+        pdf_data_bulk_loader = PdfDataBulkLoaderUseCase(workers=2)
+        pdfs_data = pdf_data_bulk_loader.load(xml_files, segmentations_data)
+
+        self.assertEqual(3, len(pdfs_data))
+        self.assertEqual(["", "", ""], pdf_data_bulk_loader.errors)
+        self.assertEqual(0, len(pdfs_data[1].pdf_data_segments))
+        for xml_file, segmentation_data, pdf_data in zip(xml_files, segmentations_data, pdfs_data):
+            expected_pdf_data = PdfData.from_xml_file(xml_file, segmentation_data)
+            self.assertEqual(expected_pdf_data.pdf_data_segments, pdf_data.pdf_data_segments)
+            self.assertEqual(
+                len(list(expected_pdf_data.pdf_features.loop_tokens())), len(list(pdf_data.pdf_features.loop_tokens()))
+            )
+            self.assertTrue(all(type(page.tokens) is list for page in pdf_data.pdf_features.pages))
+
+        self.assertEqual(1, len([segment for segment in pdfs_data[0].pdf_data_segments if segment.ml_label == 1]))
+
+    def test_load_reports_errors_per_sample(self):
+        xml_files = [self.get_xml_file("test.xml", "test.xml"), self.get_xml_file("without_segmentation.xml", "test.xml")]
+        segmentations_data = [self.get_segmentation_data(245.184), None]
+
+        pdf_data_bulk_loader = PdfDataBulkLoaderUseCase(workers=1)
+        pdfs_data = pdf_data_bulk_loader.load(xml_files, segmentations_data)
+
+        self.assertEqual(2, len(pdfs_data))
+        self.assertEqual("", pdf_data_bulk_loader.errors[0])
+        self.assertTrue(pdf_data_bulk_loader.errors[1])
+        self.assertTrue(pdfs_data[0].pdf_data_segments)
+        self.assertEqual(0, len(pdfs_data[1].pdf_data_segments))
+        self.assertIn("pdf_features", pdfs_data[0].__dict__)
+        self.assertTrue(all(type(page.tokens) is list for page in pdfs_data[0].pdf_features.pages))
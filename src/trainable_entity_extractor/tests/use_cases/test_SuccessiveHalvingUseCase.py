@@ -0,0 +1,91 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trainable_entity_extractor.domain.DistributedJob import DistributedJob
+from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
+from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.JobType import JobType
+from trainable_entity_extractor.domain.MethodCostPriors import MethodCostPriors
+from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
+from trainable_entity_extractor.use_cases.SuccessiveHalvingUseCase import SuccessiveHalvingUseCase
+
+
+def get_performance_job(methods_names: list[str]) -> DistributedJob:
+    sub_jobs = [
+        DistributedSubJob(
+            extractor_job=TrainableEntityExtractorJob(
+                run_name="halving",
+                extraction_name="extraction",
+                extractor_name="TextToTextExtractor",
+                method_name=method_name,
+                gpu_needed=False,
+                timeout=3600,
+            )
+        )
+        for method_name in methods_names
+    ]
+    return DistributedJob(
+        type=JobType.PERFORMANCE,
+        sub_jobs=sub_jobs,
+        extraction_identifier=ExtractionIdentifier(run_name="halving", extraction_name="extraction"),
+    )
+
+
+def finish_pending(distributed_job: DistributedJob, scores: dict[str, float]):
+    for sub_job in distributed_job.sub_jobs:
+        if sub_job.status != JobStatus.PENDING:
+            continue
+        method_name = sub_job.extractor_job.method_name
+        sub_job.status = JobStatus.SUCCESS
+        sub_job.result = Performance(method_name=method_name, performance=scores[method_name], execution_seconds=10)
+
+
+class TestSuccessiveHalvingUseCase(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.priors_path = Path(self.temporary_directory.name, "priors.json")
+        MethodCostPriors(seconds_by_method={"Regex": 1}).save(self.priors_path)
+        self.successive_halving = SuccessiveHalvingUseCase(
+            fractions=[0.25, 0.5], reduction_factor=2, margin=10, cheap_seconds=60, cost_priors_path=self.priors_path
+        )
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_cheap_methods_skip_subsamples(self):
+        distributed_job = get_performance_job(["Regex", "SetFit", "T5"])
+
+        self.successive_halving.plan(distributed_job)
+
+        fractions = {x.extractor_job.method_name: x.extractor_job.sample_fraction for x in distributed_job.sub_jobs}
+        self.assertEqual({"Regex": 1.0, "SetFit": 0.25, "T5": 0.25}, fractions)
+
+    def test_only_promising_methods_reach_full_data(self):
+        methods_names = ["Regex", "SetFit", "T5", "Bert", "Llm"]
+        scores = {"Regex": 80, "SetFit": 75, "T5": 40, "Bert": 60, "Llm": 30}
+        distributed_job = get_performance_job(methods_names)
+        self.successive_halving.plan(distributed_job)
+
+        rounds = 0
+        finish_pending(distributed_job, scores)
+        while self.successive_halving.promote(distributed_job):
+            finish_pending(distributed_job, scores)
+            rounds += 1
+
+        full_methods = [
+            x.extractor_job.method_name for x in distributed_job.sub_jobs if x.extractor_job.sample_fraction == 1
+        ]
+        self.assertEqual(2, rounds)
+        self.assertEqual(["Regex", "SetFit"], full_methods)
+
+    def test_cost_priors_are_learned(self):
+        distributed_job = get_performance_job(["SetFit"])
+        self.successive_halving.plan(distributed_job)
+        finish_pending(distributed_job, {"SetFit": 50})
+
+        self.successive_halving.update_cost_priors(distributed_job)
+
+        self.assertEqual(40, MethodCostPriors.load(self.priors_path).get_seconds("SetFit"))
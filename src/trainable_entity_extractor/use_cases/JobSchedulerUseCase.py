@@ -0,0 +1,96 @@
+from collections import Counter
+from typing import Optional
+
+from trainable_entity_extractor.config import (
+    SCHEDULER_MAX_QUEUED_JOBS,
+    SCHEDULER_MAX_QUEUED_JOBS_PER_DOMAIN,
+    SCHEDULER_MAX_RUNNING_JOBS_PER_DOMAIN,
+)
+from trainable_entity_extractor.domain.DistributedJob import DistributedJob
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.JobType import JobType
+
+
+class JobSchedulerUseCase:
+    JOB_TYPE_PRIORITY = {JobType.PREDICT: 0, JobType.TRAIN: 1, JobType.PERFORMANCE: 2}
+
+    def __init__(
+        self,
+        max_queued_jobs: int = SCHEDULER_MAX_QUEUED_JOBS,
+        max_queued_jobs_per_domain: int = SCHEDULER_MAX_QUEUED_JOBS_PER_DOMAIN,
+        max_running_jobs_per_domain: int = SCHEDULER_MAX_RUNNING_JOBS_PER_DOMAIN,
+    ):
+        self.max_queued_jobs = max_queued_jobs
+        self.max_queued_jobs_per_domain = max_queued_jobs_per_domain
+        self.max_running_jobs_per_domain = max_running_jobs_per_domain
+        self.started_jobs_by_domain: Counter[str] = Counter()
+
+    @staticmethod
+    def get_job_key(distributed_job: DistributedJob) -> tuple:
+        methods_names = tuple(sorted(sub_job.extractor_job.method_name for sub_job in distributed_job.sub_jobs))
+        return distributed_job.type, str(distributed_job.extraction_identifier.get_path()), methods_names
+
+    @staticmethod
+    def is_started(distributed_job: DistributedJob) -> bool:
+        return any(sub_job.status != JobStatus.PENDING for sub_job in distributed_job.sub_jobs)
+
+    @staticmethod
+    def is_gpu_needed(distributed_job: DistributedJob) -> bool:
+        return any(sub_job.extractor_job.gpu_needed for sub_job in distributed_job.sub_jobs)
+
+    def can_enqueue(self, distributed_jobs: list[DistributedJob], distributed_job: DistributedJob) -> tuple[bool, str]:
+        job_key = self.get_job_key(distributed_job)
+        if any(self.get_job_key(queued_job) == job_key for queued_job in distributed_jobs):
+            return False, f"Duplicated {distributed_job.type} job for {distributed_job.extraction_identifier}"
+
+        if len(distributed_jobs) >= self.max_queued_jobs:
+            return False, f"Queue is full ({self.max_queued_jobs} jobs)"
+
+        domain_jobs_count = sum(
+            1 for queued_job in distributed_jobs if queued_job.domain_name == distributed_job.domain_name
+        )
+        if domain_jobs_count >= self.max_queued_jobs_per_domain:
+            return False, f"Queue is full for domain {distributed_job.domain_name}"
+
+        return True, ""
+
+    def _register_domains(self, distributed_jobs: list[DistributedJob]):
+        queued_domains = {distributed_job.domain_name for distributed_job in distributed_jobs}
+        for domain in list(self.started_jobs_by_domain):
+            if domain not in queued_domains:
+                del self.started_jobs_by_domain[domain]
+
+        new_domains = queued_domains - set(self.started_jobs_by_domain)
+        starting_count = min(self.started_jobs_by_domain.values(), default=0)
+        for domain in new_domains:
+            self.started_jobs_by_domain[domain] = starting_count
+
+    def get_next_job(
+        self, distributed_jobs: list[DistributedJob], gpu_lane: Optional[bool] = None
+    ) -> Optional[DistributedJob]:
+        self._register_domains(distributed_jobs)
+        running_by_domain = Counter(job.domain_name for job in distributed_jobs if self.is_started(job))
+        candidates = list()
+        for queue_position, distributed_job in enumerate(distributed_jobs):
+            if gpu_lane is not None and self.is_gpu_needed(distributed_job) != gpu_lane:
+                continue
+
+            is_started = self.is_started(distributed_job)
+            if not is_started and running_by_domain[distributed_job.domain_name] >= self.max_running_jobs_per_domain:
+                continue
+
+            priority = (
+                self.JOB_TYPE_PRIORITY.get(distributed_job.type, len(self.JOB_TYPE_PRIORITY)),
+                0 if is_started else 1,
+                self.started_jobs_by_domain[distributed_job.domain_name],
+                queue_position,
+            )
+            candidates.append((priority, distributed_job))
+
+        if not candidates:
+            return None
+
+        _, next_job = min(candidates, key=lambda candidate: candidate[0])
+        if not self.is_started(next_job):
+            self.started_jobs_by_domain[next_job.domain_name] += 1
+        return next_job
@@ -8,7 +8,11 @@ from trainable_entity_extractor.domain.JobStatus import JobStatus
 class JobSelectorUseCase:
     @staticmethod
     def select_best_job(distributed_job: DistributedJob) -> Optional[DistributedSubJob]:
-        successful_evaluations = [sub_job for sub_job in distributed_job.sub_jobs if sub_job.status == JobStatus.SUCCESS]
+        successful_evaluations = [
+            sub_job
+            for sub_job in distributed_job.sub_jobs
+            if sub_job.status == JobStatus.SUCCESS and sub_job.extractor_job.sample_fraction >= 1
+        ]
 
         if not successful_evaluations:
             return None
@@ -1,23 +1,46 @@
 from typing import Tuple, List
+
+from trainable_entity_extractor.config import SUCCESSIVE_HALVING
 from trainable_entity_extractor.domain.DistributedJob import DistributedJob
 from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
 from trainable_entity_extractor.domain.JobStatus import JobStatus
 from trainable_entity_extractor.domain.JobType import JobType
+from trainable_entity_extractor.domain.Performance import Performance
 from trainable_entity_extractor.domain.PerformanceSummary import PerformanceSummary
 from trainable_entity_extractor.domain.JobProcessingResult import JobProcessingResult
 from trainable_entity_extractor.ports.JobExecutor import JobExecutor
 from trainable_entity_extractor.ports.Logger import Logger
+from trainable_entity_extractor.ports.PerformanceHistoryStore import PerformanceHistoryStore
+from trainable_entity_extractor.use_cases.JobSchedulerUseCase import JobSchedulerUseCase
 from trainable_entity_extractor.use_cases.JobSelectorUseCase import JobSelectorUseCase
+from trainable_entity_extractor.use_cases.SuccessiveHalvingUseCase import SuccessiveHalvingUseCase
 
 
 class OrchestratorUseCase:
-    def __init__(self, job_executor: JobExecutor, logger: Logger, distributed_jobs: List[DistributedJob] = None):
+    def __init__(
+        self,
+        job_executor: JobExecutor,
+        logger: Logger,
+        distributed_jobs: List[DistributedJob] = None,
+        scheduler: JobSchedulerUseCase = None,
+        successive_halving: SuccessiveHalvingUseCase = None,
+        performance_history: PerformanceHistoryStore = None,
+    ):
         self.job_executor = job_executor
         self.logger = logger
         self.distributed_jobs: List[DistributedJob] = distributed_jobs or []
+        self.scheduler = scheduler or JobSchedulerUseCase()
+        self.successive_halving = successive_halving or (SuccessiveHalvingUseCase() if SUCCESSIVE_HALVING else None)
+        self.performance_history = performance_history
+
+    def add_job(self, distributed_job: DistributedJob) -> bool:
+        can_enqueue, message = self.scheduler.can_enqueue(self.distributed_jobs, distributed_job)
+        if not can_enqueue:
+            self.logger.log(distributed_job.extraction_identifier, f"Job not queued: {message}")
+            return False
 
-    def add_job(self, distributed_job: DistributedJob) -> None:
         self.distributed_jobs.append(distributed_job)
+        return True
 
     def process_job(self, distributed_job: DistributedJob) -> JobProcessingResult:
         self.job_executor.update_job_statuses(distributed_job)
@@ -108,9 +131,13 @@ class OrchestratorUseCase:
             )
 
     def _process_performance_job(self, distributed_job: DistributedJob) -> JobProcessingResult:
+        if self.successive_halving:
+            self.successive_halving.plan(distributed_job)
+
         self._start_pending_performance_evaluations(distributed_job)
 
-        if self._has_perfect_score_job(distributed_job):
+        has_perfect_score_job = self._has_perfect_score_job(distributed_job)
+        if has_perfect_score_job:
             self.job_executor.cancel_jobs(distributed_job)
 
         if not self._are_all_jobs_complete(distributed_job):
@@ -121,8 +148,20 @@ class OrchestratorUseCase:
                 gpu_needed=any(getattr(job.extractor_job, "requires_gpu", False) for job in distributed_job.sub_jobs),
             )
 
+        if self.successive_halving and not has_perfect_score_job and self.successive_halving.promote(distributed_job):
+            return JobProcessingResult(
+                finished=False,
+                success=False,
+                error_message="Evaluating best methods on more samples",
+                gpu_needed=any(getattr(job.extractor_job, "requires_gpu", False) for job in distributed_job.sub_jobs),
+            )
+
+        if self.successive_halving:
+            self.successive_halving.update_cost_priors(distributed_job)
+
         self._remove_job_from_queue(distributed_job)
         self._log_performance_summary(distributed_job)
+        self._save_performance_history(distributed_job)
 
         return self._handle_performance_results(distributed_job)
 
@@ -135,17 +174,16 @@ class OrchestratorUseCase:
             if sub_job.status == JobStatus.PENDING:
                 self.job_executor.start_performance_evaluation(distributed_job.extraction_identifier, sub_job)
 
-            if sub_job.result and hasattr(sub_job.result, "is_perfect") and sub_job.result.is_perfect:
+            if self._is_perfect_score_job(sub_job):
                 break
 
     @staticmethod
-    def _has_perfect_score_job(distributed_job: DistributedJob) -> bool:
-        perfect_score_jobs = [
-            job
-            for job in distributed_job.sub_jobs
-            if job.result and hasattr(job.result, "is_perfect") and job.result.is_perfect
-        ]
-        return len(perfect_score_jobs) > 0
+    def _is_perfect_score_job(sub_job: DistributedSubJob) -> bool:
+        is_perfect = sub_job.result and hasattr(sub_job.result, "is_perfect") and sub_job.result.is_perfect
+        return bool(is_perfect) and sub_job.extractor_job.sample_fraction >= 1
+
+    def _has_perfect_score_job(self, distributed_job: DistributedJob) -> bool:
+        return any(self._is_perfect_score_job(job) for job in distributed_job.sub_jobs)
 
     def _are_all_jobs_complete(self, distributed_job: DistributedJob) -> bool:
         return all(sub_job.status in self.job_executor.get_finished_status() for sub_job in distributed_job.sub_jobs)
@@ -154,12 +192,32 @@ class OrchestratorUseCase:
         performance_summary = PerformanceSummary.from_distributed_job(distributed_job)
 
         for sub_job in distributed_job.sub_jobs:
+            if sub_job.extractor_job.sample_fraction < 1:
+                continue
             if sub_job.status in [JobStatus.SUCCESS, JobStatus.FAILURE] and sub_job.result:
                 performance_summary.add_performance_from_sub_job(sub_job)
 
         summary_log = performance_summary.to_log()
         self.logger.log(distributed_job.extraction_identifier, summary_log)
 
+    def _save_performance_history(self, distributed_job: DistributedJob) -> None:
+        if not self.performance_history or not distributed_job.sub_jobs:
+            return
+
+        best_job = JobSelectorUseCase.select_best_job(distributed_job)
+        if not best_job:
+            return
+
+        performances = [
+            sub_job.result
+            for sub_job in distributed_job.sub_jobs
+            if sub_job.status in [JobStatus.SUCCESS, JobStatus.FAILURE]
+            and isinstance(sub_job.result, Performance)
+            and sub_job.extractor_job.sample_fraction >= 1
+        ]
+        profile_key = best_job.extractor_job.data_profile_key
+        self.performance_history.add_performances(profile_key, performances, best_job.extractor_job.method_name)
+
     def _remove_job_from_queue(self, distributed_job: DistributedJob) -> None:
         if distributed_job in self.distributed_jobs:
             self.distributed_jobs.remove(distributed_job)
@@ -196,6 +254,13 @@ class OrchestratorUseCase:
     def exists_jobs_to_be_done(self) -> bool:
         return len(self.distributed_jobs) > 0
 
+    def execute_next_job(self, gpu_lane: bool = None) -> tuple[JobProcessingResult, DistributedJob | None]:
+        next_job = self.scheduler.get_next_job(self.distributed_jobs, gpu_lane)
+        if not next_job:
+            return JobProcessingResult(finished=False, success=False, error_message="No job ready to be executed"), None
+
+        return self.process_job(next_job), next_job
+
     def execute_job_for_domain(self, domain: str) -> tuple[JobProcessingResult, DistributedJob | None]:
         for job in self.distributed_jobs:
             if job.domain_name == domain:
@@ -0,0 +1,73 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from trainable_entity_extractor.config import PDF_DATA_WORKERS
+from trainable_entity_extractor.domain.CompactPdfData import CompactPdfData
+from trainable_entity_extractor.domain.PdfData import PdfData
+from trainable_entity_extractor.domain.SegmentationData import SegmentationData
+from trainable_entity_extractor.domain.XmlFile import XmlFile
+
+
+def _load_pdf_data(
+    xml_file: XmlFile, segmentation_data: SegmentationData, pages_to_keep: list[int]
+) -> tuple[PdfData | None, str]:
+    try:
+        return PdfData.from_xml_file(xml_file, segmentation_data, pages_to_keep), ""
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _load_compact_pdf_data(
+    xml_file: XmlFile, segmentation_data: SegmentationData, pages_to_keep: list[int]
+) -> tuple[CompactPdfData | None, str]:
+    pdf_data, error = _load_pdf_data(xml_file, segmentation_data, pages_to_keep)
+    return CompactPdfData(pdf_data) if pdf_data else None, error
+
+
+class PdfDataBulkLoaderUseCase:
+    def __init__(self, workers: int = PDF_DATA_WORKERS):
+        self.workers = workers
+        self.errors: list[str] = list()
+
+    def load(
+        self,
+        xml_files: list[XmlFile],
+        segmentations_data: list[SegmentationData],
+        pages_to_keep: list[list[int]] = None,
+    ) -> list[PdfData]:
+        pages_to_keep = pages_to_keep or [[] for _ in xml_files]
+        results = self.load_in_parallel(xml_files, segmentations_data, pages_to_keep)
+        if results is None:
+            results = [_load_pdf_data(*arguments) for arguments in zip(xml_files, segmentations_data, pages_to_keep)]
+
+        pdfs_data = list()
+        self.errors = list()
+        for xml_file, (pdf_data, error) in zip(xml_files, results):
+            if error:
+                print(f"Error loading pdf data from {xml_file.xml_file_name}: {error}")
+
+            if isinstance(pdf_data, CompactPdfData):
+                pdf_data = pdf_data.to_pdf_data()
+
+            pdfs_data.append(pdf_data if pdf_data else PdfData.get_blank())
+            self.errors.append(error)
+
+        return pdfs_data
+
+    def load_in_parallel(
+        self, xml_files: list[XmlFile], segmentations_data: list[SegmentationData], pages_to_keep: list[list[int]]
+    ) -> list[tuple[CompactPdfData | None, str]] | None:
+        workers = min(self.workers, len(xml_files))
+        if workers < 2 or multiprocessing.current_process().daemon:
+            return None
+
+        chunksize = max(1, len(xml_files) // (4 * workers))
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                return list(
+                    executor.map(_load_compact_pdf_data, xml_files, segmentations_data, pages_to_keep, chunksize=chunksize)
+                )
+        except Exception as e:
+            print(f"Error loading pdf data in parallel: {e}")
+            return None
@@ -1,3 +1,5 @@
+from typing import Iterable, Iterator
+
 from trainable_entity_extractor.config import DATA_PATH
 from trainable_entity_extractor.domain.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.domain.PredictionSample import PredictionSample
@@ -11,23 +13,46 @@ from trainable_entity_extractor.ports.Logger import Logger
 class PredictUseCase:
     def __init__(self, extractors: list[type[ExtractorBase]], logger: Logger):
         self.extractors: list[type[ExtractorBase]] = extractors
+        self.extractors_by_name: dict[str, type[ExtractorBase]] = {x.__name__: x for x in reversed(extractors)}
         self.logger = logger
 
     def predict(self, extractor_job: TrainableEntityExtractorJob, samples: list[PredictionSample]) -> list[Suggestion]:
+        extractor_instance = self.get_extractor_instance(extractor_job)
+        if not extractor_instance:
+            return []
+
+        return self.get_suggestions(extractor_instance, extractor_job, samples)
+
+    def predict_in_chunks(
+        self, extractor_job: TrainableEntityExtractorJob, samples_chunks: Iterable[list[PredictionSample]]
+    ) -> Iterator[list[Suggestion]]:
+        extractor_instance = self.get_extractor_instance(extractor_job)
+        if not extractor_instance:
+            return
+
+        extractor_instance.keep_methods_resident()
+        for samples in samples_chunks:
+            yield self.get_suggestions(extractor_instance, extractor_job, samples)
+
+    def get_extractor_instance(self, extractor_job: TrainableEntityExtractorJob) -> ExtractorBase | None:
+        extractor = self.extractors_by_name.get(extractor_job.extractor_name)
+        if not extractor:
+            return None
+
+        return extractor(self.get_extraction_identifier(extractor_job), self.logger)
+
+    @staticmethod
+    def get_extraction_identifier(extractor_job: TrainableEntityExtractorJob) -> ExtractionIdentifier:
         output_path = extractor_job.output_path if extractor_job.output_path else DATA_PATH
-        extraction_identifier = ExtractionIdentifier(
+        return ExtractionIdentifier(
             run_name=extractor_job.run_name, output_path=output_path, extraction_name=extractor_job.extraction_name
         )
 
-        extractor_name = extractor_job.extractor_name
-        for extractor in self.extractors:
-            extractor_instance = extractor(extraction_identifier, self.logger)
-            if extractor_instance.get_name() != extractor_name:
-                continue
-
-            prediction_samples = PredictionSamplesData(
-                prediction_samples=samples, options=extractor_job.options, multi_value=extractor_job.multi_value
-            )
-            return extractor_instance.get_suggestions(extractor_job.method_name, prediction_samples)
-
-        return []
+    @staticmethod
+    def get_suggestions(
+        extractor_instance: ExtractorBase, extractor_job: TrainableEntityExtractorJob, samples: list[PredictionSample]
+    ) -> list[Suggestion]:
+        prediction_samples = PredictionSamplesData(
+            prediction_samples=samples, options=extractor_job.options, multi_value=extractor_job.multi_value
+        )
+        return extractor_instance.get_suggestions(extractor_job.method_name, prediction_samples)
@@ -0,0 +1,105 @@
+import math
+from pathlib import Path
+
+from trainable_entity_extractor.config import (
+    METHOD_COST_PRIORS_PATH,
+    SUCCESSIVE_HALVING_CHEAP_SECONDS,
+    SUCCESSIVE_HALVING_FRACTIONS,
+    SUCCESSIVE_HALVING_MARGIN,
+    SUCCESSIVE_HALVING_REDUCTION_FACTOR,
+)
+from trainable_entity_extractor.domain.DistributedJob import DistributedJob
+from trainable_entity_extractor.domain.DistributedSubJob import DistributedSubJob
+from trainable_entity_extractor.domain.JobStatus import JobStatus
+from trainable_entity_extractor.domain.MethodCostPriors import MethodCostPriors
+
+
+class SuccessiveHalvingUseCase:
+    def __init__(
+        self,
+        fractions: list[float] = None,
+        reduction_factor: int = SUCCESSIVE_HALVING_REDUCTION_FACTOR,
+        margin: float = SUCCESSIVE_HALVING_MARGIN,
+        cheap_seconds: float = SUCCESSIVE_HALVING_CHEAP_SECONDS,
+        cost_priors_path: Path = METHOD_COST_PRIORS_PATH,
+    ):
+        self.fractions = sorted(set([x for x in fractions or SUCCESSIVE_HALVING_FRACTIONS if 0 < x < 1] + [1.0]))
+        self.reduction_factor = max(2, reduction_factor)
+        self.margin = margin
+        self.cheap_seconds = cheap_seconds
+        self.cost_priors_path = cost_priors_path
+        self.cost_priors = MethodCostPriors.load(cost_priors_path) if cost_priors_path else MethodCostPriors()
+
+    def is_cheap(self, method_name: str) -> bool:
+        seconds = self.cost_priors.get_seconds(method_name)
+        return seconds is not None and seconds <= self.cheap_seconds
+
+    @staticmethod
+    def is_full_evaluation(sub_job: DistributedSubJob) -> bool:
+        return sub_job.extractor_job.sample_fraction >= 1
+
+    @staticmethod
+    def get_score(sub_job: DistributedSubJob) -> float | None:
+        if sub_job.status != JobStatus.SUCCESS or not sub_job.result or getattr(sub_job.result, "failed", True):
+            return None
+
+        return sub_job.result.performance
+
+    def plan(self, distributed_job: DistributedJob):
+        if any(
+            sub_job.status != JobStatus.PENDING or not self.is_full_evaluation(sub_job)
+            for sub_job in distributed_job.sub_jobs
+        ):
+            return
+
+        for sub_job in distributed_job.sub_jobs:
+            if not self.is_cheap(sub_job.extractor_job.method_name):
+                sub_job.extractor_job = sub_job.extractor_job.model_copy(update={"sample_fraction": self.fractions[0]})
+
+    def get_leader_score(self, distributed_job: DistributedJob) -> float | None:
+        scores = [self.get_score(x) for x in distributed_job.sub_jobs if self.is_full_evaluation(x)]
+        scores = [score for score in scores if score is not None]
+        return max(scores) if scores else None
+
+    def promote(self, distributed_job: DistributedJob) -> bool:
+        for fraction, next_fraction in zip(self.fractions, self.fractions[1:]):
+            rung_sub_jobs = [x for x in distributed_job.sub_jobs if x.extractor_job.sample_fraction == fraction]
+            next_rung_methods = {
+                x.extractor_job.method_name for x in distributed_job.sub_jobs if x.extractor_job.sample_fraction > fraction
+            }
+            if not rung_sub_jobs or any(x.extractor_job.method_name in next_rung_methods for x in rung_sub_jobs):
+                continue
+
+            promoted_sub_jobs = self.get_promoted_sub_jobs(distributed_job, rung_sub_jobs)
+            for sub_job in promoted_sub_jobs:
+                extractor_job = sub_job.extractor_job.model_copy(update={"sample_fraction": next_fraction})
+                distributed_job.sub_jobs.append(DistributedSubJob(extractor_job=extractor_job))
+
+            return len(promoted_sub_jobs) > 0
+
+        return False
+
+    def get_promoted_sub_jobs(
+        self, distributed_job: DistributedJob, rung_sub_jobs: list[DistributedSubJob]
+    ) -> list[DistributedSubJob]:
+        scored_sub_jobs = [x for x in rung_sub_jobs if self.get_score(x) is not None]
+        scored_sub_jobs.sort(key=lambda x: self.get_score(x), reverse=True)
+        promoted_sub_jobs = scored_sub_jobs[: math.ceil(len(rung_sub_jobs) / self.reduction_factor)]
+
+        leader_score = self.get_leader_score(distributed_job)
+        if leader_score is None:
+            return promoted_sub_jobs
+
+        return [x for x in promoted_sub_jobs if self.get_score(x) + self.margin >= leader_score]
+
+    def update_cost_priors(self, distributed_job: DistributedJob):
+        for sub_job in distributed_job.sub_jobs:
+            timed_out = bool(sub_job.result) and getattr(sub_job.result, "timed_out", False)
+            if self.get_score(sub_job) is None and not timed_out:
+                continue
+
+            seconds = sub_job.result.execution_seconds / sub_job.extractor_job.sample_fraction
+            self.cost_priors.update(sub_job.extractor_job.method_name, seconds)
+
+        if self.cost_priors_path:
+            self.cost_priors.save(self.cost_priors_path)
@@ -1,17 +1,27 @@
 from pathlib import Path
 
+from trainable_entity_extractor.domain.DataProfile import DataProfile
 from trainable_entity_extractor.domain.ExtractionData import ExtractionData
 from trainable_entity_extractor.domain.ExtractionDataSummary import ExtractionDataSummary
 from trainable_entity_extractor.domain.Performance import Performance
+from trainable_entity_extractor.domain.StageProfiler import StageProfiler
 from trainable_entity_extractor.domain.TrainableEntityExtractorJob import TrainableEntityExtractorJob
 from trainable_entity_extractor.ports.ExtractorBase import ExtractorBase
 from trainable_entity_extractor.ports.Logger import Logger
+from trainable_entity_extractor.ports.PerformanceHistoryStore import PerformanceHistoryStore
 
 
 class TrainUseCase:
-    def __init__(self, extractors: list[type[ExtractorBase]], logger: Logger):
+    def __init__(
+        self,
+        extractors: list[type[ExtractorBase]],
+        logger: Logger,
+        performance_history: PerformanceHistoryStore = None,
+    ):
         self.extractors: list[type[ExtractorBase]] = extractors
+        self.extractors_by_name: dict[str, type[ExtractorBase]] = {x.__name__: x for x in reversed(extractors)}
         self.logger = logger
+        self.performance_history = performance_history
 
     def train_one_method(
         self, extractor_job: TrainableEntityExtractorJob, extraction_data: ExtractionData
@@ -22,12 +32,12 @@ class TrainUseCase:
             return True, ""
 
         extractor_name = extractor_job.extractor_name
-        for extractor in self.extractors:
-            extractor_instance = extractor(extraction_data.extraction_identifier, self.logger)
-            if extractor_instance.get_name() != extractor_name:
-                continue
-
-            return extractor_instance.train_one_method(extractor_job, extraction_data)
+        profiler = StageProfiler.session(f"{extraction_data.extraction_identifier} / {extractor_job.method_name}")
+        with profiler:
+            with profiler.measure("get_extractor"):
+                extractor_instance = self.get_extractor_instance(extractor_name, extraction_data)
+            if extractor_instance:
+                return extractor_instance.train_one_method(extractor_job, extraction_data)
 
         return False, f"Extractor {extractor_name} not found"
 
@@ -35,15 +45,22 @@ class TrainUseCase:
         self, extractor_job: TrainableEntityExtractorJob, extraction_data: ExtractionData
     ) -> Performance | None:
         extractor_name = extractor_job.extractor_name
-        for extractor in self.extractors:
-            extractor_instance = extractor(extraction_data.extraction_identifier, self.logger)
-            if extractor_instance.get_name() != extractor_name:
-                continue
-
-            return extractor_instance.get_performance(extractor_job, extraction_data)
+        profiler = StageProfiler.session(f"{extraction_data.extraction_identifier} / {extractor_job.method_name}")
+        with profiler:
+            with profiler.measure("get_extractor"):
+                extractor_instance = self.get_extractor_instance(extractor_name, extraction_data)
+            if extractor_instance:
+                return extractor_instance.get_performance(extractor_job, extraction_data)
 
         return None
 
+    def get_extractor_instance(self, extractor_name: str, extraction_data: ExtractionData) -> ExtractorBase | None:
+        extractor = self.extractors_by_name.get(extractor_name)
+        if not extractor:
+            return None
+
+        return extractor(extraction_data.extraction_identifier, self.logger)
+
     def get_jobs(self, extraction_data: ExtractionData) -> list[TrainableEntityExtractorJob]:
         summary = ExtractionDataSummary.from_extraction_data(extraction_data)
         self.logger.log(extraction_data.extraction_identifier, summary.to_report_string())
@@ -54,6 +71,29 @@ class TrainUseCase:
             if not extractor_instance.can_be_used(extraction_data):
                 continue
 
-            return extractor_instance.get_distributed_jobs(extraction_data)
+            jobs = extractor_instance.get_distributed_jobs(extraction_data)
+            return self.apply_performance_history(extractor_instance, summary, extraction_data, jobs)
 
         return []
+
+    def apply_performance_history(
+        self,
+        extractor_instance: ExtractorBase,
+        summary: ExtractionDataSummary,
+        extraction_data: ExtractionData,
+        jobs: list[TrainableEntityExtractorJob],
+    ) -> list[TrainableEntityExtractorJob]:
+        if not self.performance_history:
+            return jobs
+
+        data_profile = DataProfile.from_summary(extractor_instance.get_name(), summary, extraction_data.multi_value)
+        for job in jobs:
+            job.data_profile_key = data_profile.get_key()
+
+        kept_jobs = self.performance_history.prune_jobs(jobs)
+        if len(kept_jobs) < len(jobs):
+            skipped_methods = sorted({job.method_name for job in jobs} - {job.method_name for job in kept_jobs})
+            message = f"Skipping methods that never won for this data profile: {', '.join(skipped_methods)}"
+            self.logger.log(extraction_data.extraction_identifier, message)
+
+        return kept_jobs